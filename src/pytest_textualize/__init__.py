@@ -143,6 +143,10 @@ class TextualizePlugins(StrEnum):
     TRACER = "textualize-tracer"
     ERROR_TRACER = "textualize-error-tracer"
     COLLECTOR_TRACER = "textualize-collector-tracer"
+    COLLECTOR_VERBOSE_TRACER = "textualize-collector-verbose-tracer"
+    COLLECTOR_PROFILER = "textualize-collector-profiler"
+    COLLECTOR_STATIC = "textualize-collector-static"
+    COLLECTOR_SCHEDULER = "textualize-collector-scheduler"
     RUNTEST_TRACER = "textualize-runtest-tracer"
     REGISTRATION_SERVICE = "textualize-registration-service"
     PLUGGY_COLLECTOR_SERVICE = "pluggy-collector-service"
@@ -152,6 +156,8 @@ class TextualizePlugins(StrEnum):
     HOOKS_COLLECTOR_SERVICE = "hooks-collector-service"
     COLLECTOR_WRAPPER = "collector-wrapper"
     SUMMARY_SERVICE = "summary-service"
+    DURATION_HISTORY_SERVICE = "duration-history-service"
+    FIXTURE_PROFILER_SERVICE = "fixture-profiler-service"
 
 
 class Verbosity(IntEnum):
@@ -19,6 +19,8 @@ from rich.scope import render_scope
 from rich.text import Text
 
 from pytest_textualize import assert_never
+from pytest_textualize.textualize.templates import is_markup
+from pytest_textualize.textualize.templates import strip_markup
 
 if TYPE_CHECKING:
     from pytest_textualize.typist import TextualizeSettingsType
@@ -33,13 +35,6 @@ _CLICK_AFTER = chr(0x2B84) + " click"
 _CLICK_BEFORE = "click " + chr(0x2B86)
 
 
-def is_markup(string: str) -> bool:
-    if string:
-        text = render_markup(string)
-        return len(text.spans) > 0
-    return False
-
-
 class ConsoleMessage:
 
     def __init__(self, text: str, debug=False) -> None:
@@ -48,10 +43,7 @@ class ConsoleMessage:
 
     @property
     def stripped(self) -> str:
-        if is_markup(self.text):
-            txt = Text.from_markup(self.text)
-            return txt.plain
-        return self.text
+        return strip_markup(self.text)
 
     def style(self, name: str) -> Self:
         if self.text:
@@ -186,16 +178,19 @@ class Textualize:
     ) -> Console | NoReturn:
         from pytest_textualize.factories.console_factory import ConsoleFactory
         from pytest_textualize.textualize.logging import TextualizeLogRender
+        from pytest_textualize.textualize.plain import PlainRenderer
 
         match instance:
             case "<stdout>":
                 c = ConsoleFactory().console_stdout(config)
                 TextualizeLogRender.override_log_render(console=c)
+                PlainRenderer.select(config, c)
                 return c
 
             case "<stderr>":
                 c = ConsoleFactory().console_stderr(config)
                 TextualizeLogRender.override_log_render(console=c)
+                PlainRenderer.select(config, c)
                 return c
 
             case "buffer":
@@ -242,26 +237,22 @@ class Textualize:
     def is_gettrace() -> bool:
         return False if getattr(sys, "gettrace", None) is None else True
 
+    @staticmethod
+    def is_null_console(console: Console | None) -> bool:
+        """The console output is discarded, see ConsoleFactory.console_null."""
+        from rich._null_file import NullFile
+
+        return console is not None and isinstance(console.file, NullFile)
+
     @staticmethod
     def hook_msg(
         hookname: str,
         info: Optional[TextType] = None,
     ) -> tuple[TextAlias, TextAlias, TextAlias]:
+        from pytest_textualize.textualize.templates import HOOK_LEVEL
+        from pytest_textualize.textualize.templates import HOOK_MESSAGE
 
-        level = Text("\u2bc0", style="pyest.hook.prefix")
-        hookname = Text(hookname.ljust(30), style="pyest.hook.name")
-        msg = Text("hook:".ljust(6), style="pyest.hook.tag").append_text(hookname)
-        if info:
-            info_text = Text()
-            if isinstance(info, str):
-                if is_markup(info):
-                    info_text.append(Text.from_markup(info, end=""))
-                else:
-                    info_text.append(Text(info))
-            else:
-                info_text.append_text(info)
-
-        return msg, info, level
+        return HOOK_MESSAGE.render(hookname=hookname), info, HOOK_LEVEL.render()
 
     @staticmethod
     def keyval_msg(
@@ -292,7 +283,15 @@ class Textualize:
         time_str: str,
         start: bool = True,
     ) -> None:
+        from pytest_textualize.textualize.plain import PlainRenderer
+
         msg = "started" if start else "ended"
+        plain_renderer = PlainRenderer.from_console(console)
+        if plain_renderer is not None:
+            plain_renderer.write(
+                plain_renderer.stage_rule(f"{stage.capitalize()} {msg} at {time_str}")
+            )
+            return None
         title = (
             f"[txt.stage_title][b]{stage.capitalize()}[/] {msg} at[/] [txt.stage_time]{time_str}[/]"
         )
@@ -310,7 +309,6 @@ class Textualize:
         use_click: bool = False,
         click_location: Literal["before", "after"] = "before",
     ) -> Text:
-        from rich.console import render_markup
 
         if isinstance(link_path, str):
             link_path = Textualize.to_pathlib(link_path)
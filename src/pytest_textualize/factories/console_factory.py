@@ -2,23 +2,31 @@ from __future__ import annotations
 
 import sys
 from io import StringIO
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from rich.console import Console
 
 from pytest_textualize import Textualize
 
+if TYPE_CHECKING:
+    from pytest_textualize.textualize.export import StreamingExporter
+    from pytest_textualize.textualize.export import StreamingRecordBuffer
+    from pytest_textualize.textualize.writer import ConsoleWriter
+
 
 class ConsoleFactory:
 
     @staticmethod
-    def console_null(config: pytest.Config) -> Console:
+    def console_null(config: pytest.Config, stderr: bool = False) -> Console:
         # noinspection PyProtectedMember
         from rich._null_file import NullFile
         from pytest_textualize.plugin import console_key
+        from pytest_textualize.plugin import error_console_key
 
-        null_console = Console(file=NullFile(), stderr=False)
-        config.stash[console_key] = null_console
+        null_console = Console(file=NullFile(), stderr=stderr)
+        config.stash[error_console_key if stderr else console_key] = null_console
         return null_console
 
     @staticmethod
@@ -41,6 +49,9 @@ class ConsoleFactory:
             if stderr
             else config.stash.get(console_key, None)
         )
+        if console is None and config.getoption("textualize_headless", False, skip=True):
+            # -- nothing is displayed, the tracers skip building the renderables
+            return ConsoleFactory.console_null(config, stderr=stderr)
         if console is None:
             exclude_none_unset = console_settings.model_dump(
                 exclude_none=True, exclude_unset=True, exclude={"argparse_theme"}
@@ -51,8 +62,14 @@ class ConsoleFactory:
             from rich.console import Console
 
             theme = console_settings.get_theme(console_settings.color_system)
+            console_cls: type[Console] = Console
+            if config.getoption("textualize_async_output", False, skip=True):
+                from pytest_textualize.textualize.writer import BackgroundConsole
+
+                console_cls = BackgroundConsole
+                exclude_none_unset["writer"] = ConsoleFactory.console_writer(config)
             if stderr:
-                console = Console(
+                console = console_cls(
                     log_time=False,
                     stderr=True,
                     force_interactive=False,
@@ -60,12 +77,78 @@ class ConsoleFactory:
                     **exclude_none_unset,
                 )
             else:
-                console = Console(stderr=False, theme=theme, log_time=False, **exclude_none_unset)
+                console = console_cls(
+                    stderr=False, theme=theme, log_time=False, **exclude_none_unset
+                )
+            export = ConsoleFactory.console_export(config, console.width)
+            if export is not None:
+                export.attach(console)
             # console = ConsoleFactory.redirect_log_render(console)
             config.stash.setdefault(console_key, console)
 
         return console
 
+    @staticmethod
+    def console_writer(config: pytest.Config) -> ConsoleWriter:
+        """
+        The background writer is shared by the stdout and stderr consoles to keep the output order
+        """
+        from pytest_textualize.plugin import writer_key
+        from pytest_textualize.textualize.writer import ConsoleWriter
+
+        writer = config.stash.get(writer_key, None)
+        if writer is None:
+            writer = ConsoleWriter()
+            config.stash[writer_key] = writer
+        return writer
+
+    @staticmethod
+    def console_export(config: pytest.Config, width: int) -> StreamingRecordBuffer | None:
+        """
+        The html/svg export is shared by the stdout and stderr consoles, finalized on unconfigure
+        """
+        from pytest_textualize.plugin import export_key
+        from pytest_textualize.textualize.export import HtmlStreamExporter
+        from pytest_textualize.textualize.export import StreamingRecordBuffer
+        from pytest_textualize.textualize.export import SvgStreamExporter
+
+        export = config.stash.get(export_key, None)
+        if export is None:
+            exporters: list[StreamingExporter] = []
+            if html_path := config.getoption("textualize_html", None, skip=True):
+                exporters.append(HtmlStreamExporter(html_path))
+            if svg_path := config.getoption("textualize_svg", None, skip=True):
+                exporters.append(SvgStreamExporter(svg_path, width=width))
+            if not exporters:
+                return None
+            export = StreamingRecordBuffer(exporters)
+            config.stash[export_key] = export
+        return export
+
+    @staticmethod
+    def console_log_file(config: pytest.Config, path: str | Path, width: int) -> Console:
+        """
+        A colorless console writing the verbose logger records to a file, closed on unconfigure
+        """
+        from pytest_textualize.plugin import log_file_console_key
+
+        console = config.stash.get(log_file_console_key, None)
+        if console is None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            console_settings = Textualize.settings(config).console_settings
+            console = Console(
+                file=path.open("w", encoding="utf-8"),
+                width=width,
+                color_system=None,
+                force_terminal=False,
+                force_interactive=False,
+                theme=console_settings.get_theme(console_settings.color_system),
+                log_time=False,
+            )
+            config.stash[log_file_console_key] = console
+        return console
+
     @staticmethod
     def console_buffer(config: pytest.Config) -> Console:
         """
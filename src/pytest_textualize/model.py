@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import sys
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
+from typing import Any
 from typing import ClassVar
 from typing import ParamSpec
 from typing import TYPE_CHECKING
@@ -22,15 +24,18 @@ from rich.console import ConsoleRenderable
 from rich.console import Group
 from rich.panel import Panel
 from rich.repr import auto
+from rich.syntax import DEFAULT_THEME
 from rich.syntax import Syntax
 from rich.text import Text
 
 from pytest_textualize import Textualize
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
+    from collections.abc import Iterator
+    from _pytest._code import ExceptionInfo
     from rich.console import RenderableType
-    from pytest_textualize.typist import PanelType
     from rich.console import Console
 
 
@@ -62,21 +67,28 @@ class TestResult(StrEnum):
 
 
 class SkipInfo(BaseModel):
+    """A skip evaluation, one instance is shared by the items with the same marks, see
+    ``ClassificationTable``."""
+
+    model_config = ConfigDict(frozen=True)
+
     reason: str
-    markers: list[Marker] = Field(default_factory=list)
+    markers: tuple[Marker, ...] = ()
 
 
 RaisesType = Type[BaseException] | tuple[Type[BaseException], ...]
 
 
 class XfailInfo(BaseModel):
-    model_config = {"arbitrary_types_allowed": True}
+    """An xfail evaluation, shared like ``SkipInfo``."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     reason: str
     raises: RaisesType | None
     run: bool
     strict: bool
-    markers: list[Marker] = Field(default_factory=list)
+    markers: tuple[Marker, ...] = ()
 
     @field_serializer("raises")
     def serialize_exception(self, exc: RaisesType | None, _info) -> str:
@@ -311,38 +323,408 @@ class CollectStats(BaseModel):
         yield "selected", self.selected
 
 
+class CollectCounters:
+    """The collection counters incremented by the hooks, plain slots without any validation.
+
+    The ``CollectStats`` model is built once from them, when the collection finishes.
+    """
+
+    __slots__ = (
+        "total_errors",
+        "total_skipped",
+        "total_xfailed",
+        "total_deselected",
+        "total_collected",
+        "total_ignored_collected",
+    )
+
+    def __init__(self) -> None:
+        self.total_errors = 0
+        self.total_skipped = 0
+        self.total_xfailed = 0
+        self.total_deselected = 0
+        self.total_collected = 0
+        self.total_ignored_collected = 0
+
+    def __repr__(self) -> str:
+        counts = " ".join(f"{name[6:]}={getattr(self, name)}" for name in self.__slots__)
+        return f"<{self.__class__.__name__} {counts}>"
+
+    @property
+    def selected(self) -> int:
+        return self.total_collected - self.total_deselected
+
+    def to_stats(self) -> CollectStats:
+        fields = CollectStats.model_fields
+        return CollectStats(**{fields[name].alias: getattr(self, name) for name in self.__slots__})
+
+
+class NodeIdTable:
+    """The node ids split at their last ``::``, the parents are stored once.
+
+    The items of a module or a class share their parent node id, an item keeps the index of
+    its parent and its own name only.
+    """
+
+    __slots__ = ("parents", "_index")
+
+    def __init__(self) -> None:
+        self.parents: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} parents={len(self.parents)}>"
+
+    def split(self, nodeid: NodeId) -> tuple[int, str]:
+        parent, sep, name = nodeid.rpartition("::")
+        index = self._index.get(parent)
+        if index is None:
+            index = self._index[parent] = len(self.parents)
+            self.parents.append(sys.intern(parent))
+        return index, name
+
+    def join(self, parent: int, name: str) -> NodeId:
+        prefix = self.parents[parent]
+        return f"{prefix}::{name}" if prefix else name
+
+
+class ClassificationTable:
+    """The skip or xfail records of the collected items, every unique record is stored once.
+
+    The items of a parametrize family evaluate to the same reason and markers, each item holds
+    the index of the shared record in an array, next to its compressed node id.
+    """
+
+    __slots__ = ("node_ids", "records", "_keys", "_markers", "_parents", "_names", "_refs")
+
+    def __init__(self, node_ids: NodeIdTable | None = None) -> None:
+        from array import array
+
+        self.node_ids = NodeIdTable() if node_ids is None else node_ids
+        self.records: list[SkipInfo | XfailInfo] = []
+        self._keys: dict[tuple[Any, ...], int] = {}
+        self._markers: dict[tuple[Marker, ...], tuple[Marker, ...]] = {}
+        self._parents = array("I")
+        self._names: list[str] = []
+        self._refs = array("I")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} items={len(self)} records={len(self.records)}>"
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __bool__(self) -> bool:
+        return bool(self._names)
+
+    def __iter__(self) -> Iterator[tuple[NodeId, SkipInfo | XfailInfo]]:
+        join, records = self.node_ids.join, self.records
+        for parent, name, ref in zip(self._parents, self._names, self._refs):
+            yield join(parent, name), records[ref]
+
+    def add_skip(self, nodeid: NodeId, reason: str, markers: Iterable[Marker]) -> SkipInfo:
+        reason, markers = sys.intern(reason), self.intern_markers(markers)
+        key = (reason, markers)
+        return self._add(nodeid, key, lambda: SkipInfo(reason=reason, markers=markers))
+
+    def add_xfail(
+        self,
+        nodeid: NodeId,
+        reason: str,
+        raises: RaisesType | None,
+        run: bool,
+        strict: bool,
+        markers: Iterable[Marker],
+    ) -> XfailInfo:
+        reason, markers = sys.intern(reason), self.intern_markers(markers)
+        key = (reason, raises, run, strict, markers)
+        return self._add(
+            nodeid,
+            key,
+            lambda: XfailInfo(
+                reason=reason, raises=raises, run=run, strict=strict, markers=markers
+            ),
+        )
+
+    def intern_markers(self, markers: Iterable[Marker]) -> tuple[Marker, ...]:
+        markers = tuple(markers)
+        return self._markers.setdefault(markers, markers)
+
+    def _add(self, nodeid: NodeId, key: tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+        ref = self._keys.get(key)
+        if ref is None:
+            ref = self._keys[key] = len(self.records)
+            self.records.append(factory())
+        parent, name = self.node_ids.split(nodeid)
+        self._parents.append(parent)
+        self._names.append(name)
+        self._refs.append(ref)
+        return self.records[ref]
+
+    def get(self, nodeid: NodeId) -> list[SkipInfo | XfailInfo]:
+        """The records of a node id, a scan of the table."""
+        return [record for record_id, record in self if record_id == nodeid]
+
+    def to_dict(self) -> dict[NodeId, list[SkipInfo | XfailInfo]]:
+        """The records by node id, the layout of the results before the table."""
+        records: dict[NodeId, list[SkipInfo | XfailInfo]] = {}
+        for nodeid, record in self:
+            records.setdefault(nodeid, []).append(record)
+        return records
+
+
+OUTCOMES: tuple[TestResult, ...] = tuple(TestResult)
+OUTCOME_CODES: dict[str, int] = {outcome: code for code, outcome in enumerate(OUTCOMES)}
+
+
+class ResultColumns:
+    """The outcome and the phase durations of the executed tests, in parallel columns.
+
+    A test is a row: its node id, a small int outcome code, see ``OUTCOMES``, and the setup,
+    call and teardown durations in ``array('d')`` columns. The node id column references the
+    string of the report, the same object the item keeps, so a row costs a few dozen bytes.
+    Only the tests whose teardown was not reported yet are looked up by node id.
+    """
+
+    __slots__ = ("nodeids", "outcomes", "setup", "call", "teardown", "_running")
+
+    def __init__(self) -> None:
+        from array import array
+
+        self.nodeids: list[NodeId] = []
+        self.outcomes = array("B")
+        self.setup = array("d")
+        self.call = array("d")
+        self.teardown = array("d")
+        self._running: dict[NodeId, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} tests={len(self)} running={len(self._running)}>"
+
+    def __len__(self) -> int:
+        return len(self.nodeids)
+
+    def __iter__(self) -> Iterator[tuple[NodeId, TestResult, float, float, float]]:
+        for nodeid, code, setup, call, teardown in zip(
+            self.nodeids, self.outcomes, self.setup, self.call, self.teardown
+        ):
+            yield nodeid, OUTCOMES[code], setup, call, teardown
+
+    def row(self, nodeid: NodeId) -> int:
+        index = self._running.get(nodeid)
+        if index is None:
+            index = self._running[nodeid] = len(self.nodeids)
+            self.nodeids.append(nodeid)
+            self.outcomes.append(OUTCOME_CODES[TestResult.Unknown])
+            self.setup.append(0.0)
+            self.call.append(0.0)
+            self.teardown.append(0.0)
+        return index
+
+    def record(self, nodeid: NodeId, when: str, outcome: str, duration: float) -> None:
+        """Records a phase report, ``outcome`` tells apart the xfailed and xpassed tests.
+
+        A failed setup or teardown is an error, a skipped setup is the outcome of the test,
+        the call outcome replaces the passed setup.
+        """
+        index = self.row(nodeid)
+        if when == "call":
+            self.call[index] = duration
+            self.outcomes[index] = OUTCOME_CODES[outcome]
+        elif when == "setup":
+            self.setup[index] = duration
+            if outcome != TestResult.Passed:
+                self.outcomes[index] = OUTCOME_CODES[
+                    TestResult.Error if outcome == TestResult.Failed else outcome
+                ]
+        else:
+            self.teardown[index] = duration
+            if outcome == TestResult.Failed and self.outcomes[index] in PASSED_CODES:
+                self.outcomes[index] = OUTCOME_CODES[TestResult.Error]
+            del self._running[nodeid]
+        return None
+
+    def outcome(self, index: int) -> TestResult:
+        return OUTCOMES[self.outcomes[index]]
+
+    def counts(self) -> dict[TestResult, int]:
+        from collections import Counter
+
+        return {OUTCOMES[code]: count for code, count in Counter(self.outcomes).items()}
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        return {
+            "nodeid": list(self.nodeids),
+            "outcome": [str(OUTCOMES[code]) for code in self.outcomes],
+            "setup": self.setup.tolist(),
+            "call": self.call.tolist(),
+            "teardown": self.teardown.tolist(),
+        }
+
+
+PASSED_CODES: frozenset[int] = frozenset(
+    OUTCOME_CODES[outcome] for outcome in (TestResult.Passed, TestResult.Unknown)
+)
+
+
 class ErrorInfo(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    exception: BaseException = Field(alias="exception")
-    collect_report: pytest.CollectReport = Field(alias="report")
-    rich_report: Panel
-    error_syntax: Syntax = Field(alias="syntax")
+    """The facts of a collection error, the renderables are built and kept the first time the
+    errors summary shows them."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+    nodeid: NodeId
+    when: str = "collect"
+    hook: str = ""
+    node_type: str = ""
+    node_name: str = ""
+    exception_type: str
+    message: str
+    doc: str | None = None
+    path: Path | None = None
+    relpath: str = ""
+    lineno: int = 0
+    """The line of the last traceback entry, 1-based."""
+    function: str = ""
+    collect_report: pytest.CollectReport | None = Field(default=None, alias="report")
+    syntax_theme: Any = Field(default=None, exclude=True)
+
+    @classmethod
+    def from_exception_info(
+        cls,
+        hook: str,
+        node: pytest.Item | pytest.Collector,
+        excinfo: ExceptionInfo[BaseException],
+        report: pytest.CollectReport,
+        syntax_theme: Any = None,
+    ) -> ErrorInfo:
+        from _pytest.pathlib import bestrelpath
+
+        entry = excinfo.traceback[-1]
+        path = entry.path if isinstance(entry.path, Path) else None
+        return cls(
+            nodeid=report.nodeid,
+            when=report.when,
+            hook=hook,
+            node_type=node.__class__.__name__,
+            node_name=node.name,
+            exception_type=excinfo.typename,
+            message=str(excinfo.value),
+            doc=excinfo.type.__doc__,
+            path=path,
+            relpath="" if path is None else bestrelpath(node.config.rootpath, path),
+            lineno=entry.lineno + 1,
+            function=entry.name,
+            collect_report=report,
+            syntax_theme=syntax_theme,
+        )
+
+    @property
+    def statement(self) -> str:
+        import linecache
+
+        if self.path is None:
+            return ""
+        return linecache.getline(str(self.path), self.lineno).strip()
+
+    @cached_property
+    def rich_report(self) -> Panel:
+        from rich.containers import Lines
+        from rich.padding import Padding
+        from rich.table import Table
+
+        from pytest_textualize.factories.theme_factory import ThemeFactory
+
+        repr_h = ThemeFactory.repr_highlighter()
+        path_h = ThemeFactory.path_highlighter()
+
+        txt = Text(f" ≫ hook {self.hook} was invoked")
+        txt.highlight_words([self.hook], style="pyest.hook.name")
+
+        node_table = Table.grid(padding=(0, 1))
+        node_table.add_column(justify="left")
+        node_table.add_column(justify="left", style="scope.key_ni")
+        node_table.add_row("|", "when: ", self.when)
+        node_table.add_row("|", "node type: ", self.node_type)
+        node_table.add_row("|", "node name: ", self.node_name)
+        node_table.add_row("|", "node id: ", self.nodeid)
+        location = f"{self.relpath}:{self.lineno}"
+        link = Text(f"File {location}")
+        if self.path is not None:
+            link.stylize(f"link {self.path.as_uri()}")
+        lines = Lines(
+            [
+                Text(" | ".rjust(9))
+                .append("File")
+                .append(" = ", style="i")
+                .append_text(path_h(self.relpath)),
+                Text(" | ".rjust(9))
+                .append("Function")
+                .append(" = ", style="i")
+                .append(self.function, style="i"),
+                Text(" | ".rjust(9))
+                .append("Lineno")
+                .append(" = ", style="i")
+                .append_text(repr_h(str(self.lineno))),
+                Text(" | ".rjust(9))
+                .append("Statement ↦ ")
+                .append(Text(self.statement, style="white")),
+                Text(" | ".rjust(9)).append(link).append(" ", style="reset"),
+            ]
+        )
+        group = Group(
+            txt,
+            Text("\n Node Details:", style="b"),
+            Padding(node_table, pad=(0, 0, 0, 8)),
+            Text("\n Documentation:", style="white b"),
+            Text(f"{" | ".rjust(9)}{self.doc}", style="white", end="\n\n"),
+            Text(" Exception Message:", style="b"),
+            repr_h(f"{" | ".rjust(9)}{self.message}\n"),
+            Text(" Exception Details:", style="b"),
+            lines,
+        )
+        return Panel(group, title=f"[b]{self.exception_type}[/b]", style="red", width=120)
+
+    @cached_property
+    def error_syntax(self) -> Syntax | None:
+        """The source around the error line, None when the error is not in a file."""
+        if self.path is None or not self.path.is_file():
+            return None
+        return Syntax.from_path(
+            str(self.path),
+            theme=self.syntax_theme or DEFAULT_THEME,
+            line_numbers=True,
+            line_range=(max(self.lineno - 3, 1), self.lineno + 3),
+            highlight_lines={self.lineno},
+        )
 
 
 @auto
 class TestCollectionRecord(Timings):
     errors: dict[ModuleId, ErrorInfo] = Field(default_factory=dict)
-    skip: dict[NodeId, list[SkipInfo]] = Field(default_factory=dict)
+    node_ids: NodeIdTable = Field(default_factory=NodeIdTable, exclude=True)
+    skip: ClassificationTable = Field(
+        default_factory=lambda data: ClassificationTable(data["node_ids"])
+    )
     skip_reports: dict[NodeId, CollectReport] = Field(default_factory=dict)
 
-    xfail: dict[NodeId, list[XfailInfo]] = Field(default_factory=dict)
+    xfail: ClassificationTable = Field(
+        default_factory=lambda data: ClassificationTable(data["node_ids"])
+    )
     stats: CollectStats = Field(default_factory=CollectStats)
 
     @property
     def errors_count(self) -> int:
         return len(self.errors.keys())
 
-    def register_error(
-        self,
-        nodeid: str,
-        exception: BaseException,
-        pytest_report: pytest.CollectReport,
-        rich_report: PanelType,
-        syntax: Syntax,
-    ) -> None:
-        self.errors[nodeid] = ErrorInfo(
-            exception=exception, report=pytest_report, rich_report=rich_report, syntax=syntax
-        )
+    def register_error(self, error: ErrorInfo) -> None:
+        self.errors[error.nodeid] = error
+
+    @field_serializer("skip", "xfail")
+    def serialize_records(self, table: ClassificationTable, _info) -> dict[NodeId, list[Any]]:
+        return {
+            nodeid: [record.model_dump() for record in records]
+            for nodeid, records in table.to_dict().items()
+        }
 
     # @field_serializer("errors")
     # def serialize_exception(
@@ -359,6 +741,11 @@ class TestCollectionRecord(Timings):
 class TestRunResults(Timings):
     collect: TestCollectionRecord | None = Field(default=None)
     warnings: list[WarningReport] = Field(default_factory=list)
+    tests: ResultColumns = Field(default_factory=ResultColumns)
+
+    @field_serializer("tests")
+    def serialize_tests(self, tests: ResultColumns, _info) -> dict[str, list[Any]]:
+        return tests.to_dict()
 
     def create_collect(self, precise_start: PerfTime, start: DateTime) -> TestCollectionRecord:
         self.collect = TestCollectionRecord(precise_start=precise_start, start=start)
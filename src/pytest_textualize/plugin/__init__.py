@@ -3,15 +3,29 @@ from __future__ import annotations
 
 
 __all__ = (
+    "collect_profile_key",
     "console_key",
     "error_console_key",
+    "export_key",
+    "log_file_console_key",
+    "recorder_key",
     "settings_key",
+    "writer_key",
 )
 
 import pytest
 from rich.console import Console
+from pytest_textualize.plugin.helpers.collect_profile import CollectProfile
 from pytest_textualize.settings import TextualizeSettings
+from pytest_textualize.textualize.events import EventRecorder
+from pytest_textualize.textualize.export import StreamingRecordBuffer
+from pytest_textualize.textualize.writer import ConsoleWriter
 
+collect_profile_key = pytest.StashKey[CollectProfile]()
 console_key = pytest.StashKey[Console]()
 error_console_key = pytest.StashKey[Console]()
+export_key = pytest.StashKey[StreamingRecordBuffer]()
+log_file_console_key = pytest.StashKey[Console]()
 settings_key = pytest.StashKey[TextualizeSettings]()
+recorder_key = pytest.StashKey[EventRecorder]()
+writer_key = pytest.StashKey[ConsoleWriter]()
@@ -13,10 +13,13 @@ from pydantic import TypeAdapter
 from pydantic import field_validator
 from rich.console import Console
 
+from pytest_textualize import Textualize
 from pytest_textualize import Verbosity
 
 if TYPE_CHECKING:
     from argparse import Namespace as NamespaceType
+    from pytest_textualize.textualize.events import EventRecorder
+    from pytest_textualize.textualize.plain import PlainRenderer
     from pytest_textualize.typist import PytestPluginType
     from pytest_textualize.typist import TextualizeSettingsType
     from pytest_textualize.typist import VerboseLoggerType
@@ -70,10 +73,12 @@ class BaseTextualizePlugin(_BaseTextualizeSettingsPlugin):
     config: pytest.Config | None = None
     verbose_logger: VerboseLoggerType | None = None
     console: Console | None = None
+    headless: bool = False
 
     def configure(self, config: pytest.Config) -> None:
         from pytest_textualize.plugin import console_key
         from pytest_textualize.plugin import error_console_key
+        from pytest_textualize.plugin import log_file_console_key
         from pytest_textualize.textualize.logging import VerboseLogger
 
         super().configure(config)
@@ -83,10 +88,16 @@ class BaseTextualizePlugin(_BaseTextualizeSettingsPlugin):
         stderr = config.stash.get(error_console_key, None)
         consoles = ValidateConsole(console_stderr=stderr, console_stdout=stdout)
         self.console = consoles.console_stdout
+        self.headless = Textualize.is_null_console(stdout) and Textualize.is_null_console(stderr)
 
         self.verbose_logger = VerboseLogger(config)
         self.verbose_logger.add_console("<stdout>", consoles.console_stdout)
         self.verbose_logger.add_console("<stderr>", consoles.console_stderr)
+        log_file = config.stash.get(log_file_console_key, None)
+        if log_file is not None:
+            self.verbose_logger.add_sink(
+                "<log-file>", log_file, Verbosity(config.option.textualize_log_file_verbosity)
+            )
 
     @cached_property
     def my_property(self):
@@ -118,6 +129,18 @@ class BaseTextualizePlugin(_BaseTextualizeSettingsPlugin):
     def isatty(self) -> bool:
         return sys.stdout.isatty()
 
+    @property
+    def recorder(self) -> EventRecorder | None:
+        from pytest_textualize.plugin import recorder_key
+
+        return self.config.stash.get(recorder_key, None)
+
+    @property
+    def plain_renderer(self) -> PlainRenderer | None:
+        from pytest_textualize.textualize.plain import PlainRenderer
+
+        return PlainRenderer.from_console(self.console)
+
     @property
     def showcapture(self) -> bool:
         return self.options.showcapture
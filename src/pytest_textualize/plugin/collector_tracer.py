@@ -11,6 +11,8 @@ from pendulum import DateTime
 
 from rich.control import Control
 from rich.segment import ControlType
+from rich.segment import Segment
+from rich.segment import Segments
 from rich.text import Text
 
 from pytest_textualize import Textualize
@@ -21,6 +23,14 @@ from pytest_textualize.plugin.base import BaseTextualizePlugin
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from _pytest.skipping import Skip
+    from _pytest.skipping import Xfail
+    from pytest_textualize.plugin.helpers.collapse import CollapseTracker
+    from pytest_textualize.plugin.helpers.collapse import CollapsedGroup
+    from pytest_textualize.plugin.helpers.collect_plan import PlanWriter
+    from pytest_textualize.plugin.helpers.collect_profile import CollectProfile
+    from pytest_textualize.plugin.helpers.collect_progress import CollectProgress
+    from pytest_textualize.plugin.helpers.static_collect import StaticModule
     from collections.abc import Sequence
     from rich.console import RenderableType
     from pytest_textualize.typist import TestRunResultsType
@@ -43,6 +53,14 @@ class CollectorTracer(BaseTextualizePlugin):
         self._end_time: str | None = None
         self._last_write = timing.Instant()
         self._pytest_session: pytest.Session | None = None
+        self._collapse: CollapseTracker | None = None
+        self._pending: list[pytest.Item] = []
+        self._progress: CollectProgress | None = None
+        self._plan: PlanWriter | None = None
+
+        from pytest_textualize.model import CollectCounters
+
+        self.counters = CollectCounters()
 
     def __repr__(self) -> str:
         repr_str = (
@@ -71,7 +89,98 @@ class CollectorTracer(BaseTextualizePlugin):
     def pytest_configure(self, config: pytest.Config) -> None:
         super().configure(config)
         self.pluginmanager = config.pluginmanager
-        Textualize.print_pytest_textualize_sessionstart_header(self.console)
+        if not self.headless:
+            Textualize.print_pytest_textualize_sessionstart_header(self.console)
+        self.register_verbose_tracer()
+        self.register_profiler()
+        self.register_static_collector()
+        self.register_scheduler()
+
+    def register_verbose_tracer(self) -> None:
+        """Registers the hooks required only at -v and above, quiet and normal runs do not
+        dispatch them for every collector and item, unless a sink or the recorder wants them."""
+        if not self.verbose_logger.wants(Verbosity.VERBOSE):
+            return None
+        tracer_cls = (
+            CollectorDebugTracer
+            if self.verbose_logger.wants(Verbosity.VERY_VERBOSE)
+            else CollectorVerboseTracer
+        )
+        if not self.pluginmanager.has_plugin(tracer_cls.name):
+            self.pluginmanager.register(tracer_cls(), tracer_cls.name)
+        return None
+
+    def register_profiler(self) -> None:
+        """Registers the collection profiler, when the options ask for the profile."""
+        from pytest_textualize.plugin import collect_profile_key
+        from pytest_textualize.plugin.helpers.collect_profile import CollectProfile
+        from pytest_textualize.plugin.helpers.collect_profile import profile_requested
+
+        if not profile_requested(self.config.option):
+            return None
+        if self.pluginmanager.has_plugin(CollectorProfiler.name):
+            return None
+        profile = self.config.stash.get(collect_profile_key, None)
+        if profile is None:
+            # -- the plugin was registered by a conftest, after pytest_load_initial_conftests
+            profile = CollectProfile(self.config.rootpath)
+            profile.install(self.pluginmanager)
+            self.config.stash[collect_profile_key] = profile
+            self.verbose_logger.warning(
+                "the collection profile started after the initial conftests, "
+                "their import time is not profiled"
+            )
+        self.pluginmanager.register(CollectorProfiler(profile), CollectorProfiler.name)
+        return None
+
+    def register_static_collector(self) -> None:
+        """Registers the static collection of the test modules, for the collect-only runs."""
+        if not self.collectonly or not self.config.getoption("textualize_static", False, skip=True):
+            return None
+        if not self.pluginmanager.has_plugin(CollectorStatic.name):
+            self.pluginmanager.register(CollectorStatic(), CollectorStatic.name)
+        return None
+
+    def register_scheduler(self) -> None:
+        """Registers the reordering of the items, when an order was given."""
+        order = self.config.getoption("textualize_order", None, skip=True)
+        if order is None or self.pluginmanager.has_plugin(CollectorScheduler.name):
+            return None
+        self.pluginmanager.register(CollectorScheduler(order), CollectorScheduler.name)
+        return None
+
+    def prewarm(self) -> None:
+        """Compiles the test files and the conftests to bytecode, before they are imported."""
+        from pytest_textualize.plugin import collect_profile_key
+        from pytest_textualize.plugin.helpers.prewarm import BytecodePrewarmer
+
+        prewarmer = BytecodePrewarmer(self.config)
+        if not prewarmer.enabled:
+            self.verbose_logger.debug(f"{prewarmer!r} disabled")
+            return None
+        sources = prewarmer.find_sources()
+        shows_progress = not self.headless and self.verbosity >= Verbosity.NORMAL
+        if shows_progress and self.isatty:
+            with self.console.status(f"prewarming {len(sources)} modules ...") as status:
+                report = prewarmer.run(
+                    sources,
+                    lambda done, total: status.update(f"prewarming {done}/{total} modules ..."),
+                )
+        else:
+            report = prewarmer.run(sources)
+        if shows_progress:
+            self.console.print(
+                f"[b]▪ prewarmed[/] {report.compiled} {cardinalize("module", report.compiled)}, "
+                f"{report.fresh} up to date"
+                + (f", [error]{report.failed} failed[/]" if report.failed else "")
+                + f" in {report.wall_seconds:.2f}s"
+            )
+        for path, error in prewarmer.errors.items():
+            self.verbose_logger.debug(f"{path} not prewarmed: {error}")
+        profile = self.config.stash.get(collect_profile_key, None)
+        if profile is not None:
+            profile.prewarm = report
+        return None
 
     @pytest.hookimpl(tryfirst=True)
     def pytest_collection(self, session: pytest.Session) -> None:
@@ -79,11 +188,30 @@ class CollectorTracer(BaseTextualizePlugin):
         import time
 
         self._pytest_session = session
+        if self.config.getoption("textualize_prewarm", False, skip=True):
+            self.prewarm()
 
         precise_start = time.perf_counter()
         start = DateTime.now()
         self._start_time = start.to_time_string()
         self.results.create_collect(precise_start=precise_start, start=start)
+        plan_path = self.config.getoption("textualize_plan", None, skip=True)
+        if plan_path:
+            from pytest_textualize.plugin.helpers.collect_plan import PlanWriter
+            from pytest_textualize.plugin.helpers.collect_plan import historical_durations
+
+            self._plan = PlanWriter(plan_path, historical_durations(self.config))
+        if self.verbosity >= Verbosity.VERBOSE and not self.headless:
+            from pytest_textualize.plugin.helpers.collapse import CollapseTracker
+
+            threshold = self.config.getoption("textualize_collapse_threshold", 0, skip=True)
+            self._collapse = CollapseTracker(threshold, self.report_collapsed)
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import CollectStart
+
+            self.recorder.emit(CollectStart, self._start_time)
+        if self.headless:
+            return None
 
         if self.verbosity > Verbosity.NORMAL:
             Textualize.stage_rule(self.console, "collection", time_str=self._start_time)
@@ -103,24 +231,22 @@ class CollectorTracer(BaseTextualizePlugin):
     @pytest.hookimpl
     def pytest_collectreport(self, report: pytest.CollectReport) -> None:
         if report.failed:
-            self.results.collect.stats.total_errors += 1
+            self.counters.total_errors += 1
+            if self.recorder is not None:
+                from pytest_textualize.textualize.events import CollectError
+
+                self.recorder.emit(CollectError, report.nodeid, report.longreprtext)
             if report.head_line in self.results.collect.errors:
                 self.results.collect.errors[report.head_line].collect_report = report
         elif report.skipped:
-            self.results.collect.stats.total_skipped += 1
+            self.counters.total_skipped += 1
         if self.isatty:
             self.report_collect()
 
-    @pytest.hookimpl
-    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
-        hook, _, level = Textualize.hook_msg("pytest_collection_modifyitems")
-        self.verbose_logger.log(hook, level_text=level, verbosity=Verbosity.VERBOSE)
-        return None
-
     def report_collect(self, final: bool = False) -> None:
         from _pytest.terminal import REPORT_COLLECTING_RESOLUTION
 
-        if self.verbosity == Verbosity.QUIET:
+        if self.verbosity == Verbosity.QUIET or self.headless:
             return None
 
         if not final:
@@ -129,130 +255,167 @@ class CollectorTracer(BaseTextualizePlugin):
                 return None
             self._last_write = timing.Instant()
 
-        dump = self.results.collect.stats.model_dump(mode="python", by_alias=True)
-        prefix = ""
-        if self.isatty:
-            prefix = "▪"
-        row: list[RenderableType] = [
-            Text(f"{prefix}collected" if final else f"▪ collecting ", style="items"),
-            Text(f"{dump["collected"]} {cardinalize("item", dump["collected"])}", style="items"),
-        ]
-        if dump["errors"]:
-            row.append(
-                Text(f" / {dump["errors"]} {cardinalize("error", dump["errors"])}", style="error")
-            )
-        if dump["deselected"]:
-            row.append(Text(f" / {dump["deselected"]} deselected", style="deselected"))
-        if dump["skipped"]:
-            row.append(Text(f" / {dump["skipped"]} skipped", style="skipped"))
-        if dump["xfailed"]:
-            row.append(Text(f" / {dump["xfailed"]} xfailed", style="xfailed"))
-        if dump["collected"] > self.results.collect.stats.selected:
-            row.append(Text(f" / {self.results.collect.stats.selected} selected", style="selected"))
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([plain_renderer.collect_progress(self.counters, final)])
+            return None
+
+        if self._progress is None:
+            from pytest_textualize.plugin.helpers.collect_progress import CollectProgress
+
+            self._progress = CollectProgress(self.console)
+        prefix = "▪" if self.isatty else ""
+        segments = self._progress.segments(self.counters, final, prefix)
 
         if self.isatty and self.verbosity == Verbosity.NORMAL:
-            if self.verbosity == Verbosity.NORMAL:
-                self.console.control(Control((ControlType.ERASE_IN_LINE, 2)))
-                self.console.control(Control((ControlType.CURSOR_MOVE_TO_COLUMN, 0)))
-                self.console.print(*row, end="")
-                if final:
-                    self.console.line()
+            self.console.control(Control((ControlType.ERASE_IN_LINE, 2)))
+            self.console.control(Control((ControlType.CURSOR_MOVE_TO_COLUMN, 0)))
+            self.console.print(Segments(segments), end="")
+            if final:
+                self.console.line()
         else:
-            self.console.print(*row)
+            segments.append(Segment.line())
+            self.console.print(Segments(segments))
         return None
 
     @pytest.hookimpl(trylast=True, wrapper=True)
     def pytest_ignore_collect(self) -> Generator[None, object, object]:
         result = yield
         if result:
-            self.results.collect.stats.total_ignored_collected += 1
+            self.counters.total_ignored_collected += 1
         return result
 
-    def itemcollected(self, item: pytest.Item) -> None:
-        if self.verbosity < Verbosity.VERBOSE:
+    def itemcollected(
+        self,
+        item: pytest.Item,
+        markers: list[str],
+        skipped: Skip | None = None,
+        xfailed: Xfail | None = None,
+    ) -> None:
+        if not self.verbose_logger.wants(Verbosity.VERBOSE):
             return None
+        # -- the collapse applies to the terminal, the sinks and the recorder get every item
+        terminal = self.verbosity >= Verbosity.VERBOSE and not self.headless
+        if (
+            terminal
+            and self._collapse is not None
+            and not self._collapse.add(item.nodeid, skipped is not None, xfailed is not None)
+        ):
+            # -- the item is counted in the aggregated line, details stay in the results model
+            terminal = False
 
         hook, info, level = Textualize.hook_msg("pytest_itemcollected", info=item.nodeid)
-        self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
-
-        markers = list(item.iter_markers())
-        skip_markers = ", ".join([mark.name for mark in markers if mark.name.startswith("skip")])
-        xfail_markers = ", ".join([mark.name for mark in markers if mark.name.startswith("xfail")])
+        self.verbose_logger.log(
+            hook, info, level_text=level, verbosity=Verbosity.VERBOSE, terminal=terminal
+        )
 
-        from _pytest.skipping import evaluate_skip_marks, evaluate_xfail_marks
+        if not terminal or (skipped is None and xfailed is None):
+            return None
 
-        if skip_markers or xfail_markers:
-            skipped = evaluate_skip_marks(item)
-            if skipped is not None:
-                renderables = key_value_scope(
-                    [
-                        ("type", "[skip]skip[/]"),
-                        ("reason", Text(skipped.reason)),
-                        ("marker", Text(f"@{skip_markers}", style="#B3AE60")),
-                    ]
-                )
-                self.console.print(renderables)
+        skip_markers = ", ".join([name for name in markers if name.startswith("skip")])
 
-            xfailed = evaluate_xfail_marks(item)
-            if xfailed is not None:
-                xfail_list = [
-                    ("type", f"[xfail]xfail[/]"),
-                    ("reason", Text(xfailed.reason)),
-                    ("run", str(xfailed.run)),
-                    ("strict", str(xfailed.strict)),
+        if skipped is not None:
+            self.print_key_values(
+                [
+                    ("type", "[skip]skip[/]"),
+                    ("reason", Text(skipped.reason)),
+                    ("marker", Text(f"@{skip_markers}", style="#B3AE60")),
                 ]
-                if xfailed.raises:
-                    xfail_list.append(("raises", str(xfailed.raises)))
-                    xfail_list.append(("marker", Text(f"@{skip_markers}", style="#B3AE60")))
+            )
+
+        if xfailed is not None:
+            xfail_list = [
+                ("type", f"[xfail]xfail[/]"),
+                ("reason", Text(xfailed.reason)),
+                ("run", str(xfailed.run)),
+                ("strict", str(xfailed.strict)),
+            ]
+            if xfailed.raises:
+                xfail_list.append(("raises", str(xfailed.raises)))
+                xfail_list.append(("marker", Text(f"@{skip_markers}", style="#B3AE60")))
+
+            self.print_key_values(xfail_list)
+
+        return None
 
-                renderables = key_value_scope(xfail_list)
-                self.console.print(renderables)
+    def report_collapsed(self, group: CollapsedGroup) -> None:
+        hook, _, level = Textualize.hook_msg("pytest_itemcollected")
+        self.verbose_logger.log(
+            hook, Text(group.summary(), style="dim"), level_text=level, verbosity=Verbosity.VERBOSE
+        )
+        return None
+
+    def print_key_values(self, items: list[tuple[str, RenderableType]]) -> None:
+        from pytest_textualize.textualize.console import print_key_values
 
+        print_key_values(self.console, items)
         return None
 
     @pytest.hookimpl
     def pytest_itemcollected(self, item: pytest.Item) -> None:
-        from pytest_textualize.model import SkipInfo, XfailInfo, NodeId
-        from _pytest.skipping import evaluate_xfail_marks, evaluate_skip_marks
+        self.counters.total_collected += 1
+        self._pending.append(item)
+        return None
 
-        self.results.collect.stats.total_collected += 1
-        hook, info, level = Textualize.hook_msg("pytest_itemcollected", info=item.nodeid)
-        self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self) -> None:
+        # -- runs before the other plugins add or remove marks, as the per item evaluation did
+        self.classify_pending()
+        return None
 
-        markers = [mark.name for mark in item.iter_markers()]
+    def classify_pending(self) -> None:
+        """Classifies the items collected since the last call in one batch, see MarkClassifier."""
+        from pytest_textualize.plugin.helpers.classify import MarkClassifier
 
-        node_id = NodeId(item.nodeid)
-        skipped = evaluate_skip_marks(item)
-        if skipped is not None:
-            self.results.collect.stats.total_skipped += 1
-            skip_info = SkipInfo(
-                reason=skipped.reason,
-                markers=markers,
-            )
-            if node_id not in self.results.collect.skip:
-                self.results.collect.skip[node_id] = []
-            self.results.collect.skip[node_id].append(skip_info)
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, []
+        classifier = MarkClassifier()
+        collect = self.results.collect
+        for item, markers, skipped, xfailed in classifier.classify(pending):
+            if self._plan is not None:
+                self._plan.classified(item.nodeid, markers, skipped, xfailed)
+            if skipped is not None:
+                self.counters.total_skipped += 1
+                collect.skip.add_skip(item.nodeid, skipped.reason, markers)
 
-        xfailed = evaluate_xfail_marks(item)
-        if xfailed is not None:
-            self.results.collect.stats.total_xfailed += 1
-            xfail_info = XfailInfo(
-                reason=xfailed.reason,
-                raises=xfailed.raises,
-                run=xfailed.run,
-                strict=xfailed.strict,
-                markers=markers,
-            )
-            if node_id not in self.results.collect.xfail:
-                self.results.collect.xfail[node_id] = []
-            self.results.collect.xfail[node_id].append(xfail_info)
+            if xfailed is not None:
+                self.counters.total_xfailed += 1
+                collect.xfail.add_xfail(
+                    item.nodeid,
+                    xfailed.reason,
+                    xfailed.raises,
+                    xfailed.run,
+                    xfailed.strict,
+                    markers,
+                )
 
-        self.itemcollected(item)
+            if self.recorder is not None:
+                from pytest_textualize.textualize.events import ItemCollected
+
+                self.recorder.emit(
+                    ItemCollected,
+                    item.nodeid,
+                    markers,
+                    None if skipped is None else skipped.reason,
+                    (
+                        None
+                        if xfailed is None
+                        else (
+                            xfailed.reason,
+                            xfailed.run,
+                            xfailed.strict,
+                            None if xfailed.raises is None else repr(xfailed.raises),
+                        )
+                    ),
+                )
+            self.itemcollected(item, markers, skipped, xfailed)
+        self.verbose_logger.debug(repr(classifier))
         return None
 
     @pytest.hookimpl
     def pytest_deselected(self, items: Sequence[pytest.Item]) -> None:
-        self.results.collect.stats.total_deselected += len(items)
+        self.counters.total_deselected += len(items)
         return None
 
     def _pytest_pycollect_makemodule(
@@ -273,7 +436,7 @@ class CollectorTracer(BaseTextualizePlugin):
             from pathlib import Path
 
             # todo: is already counted?
-            self.results.collect.stats.total_collected += 1
+            self.counters.total_collected += 1
 
             hook, info, level = Textualize.hook_msg(
                 "pytest_pycollect_makemodule", info=parent.nodeid
@@ -368,7 +531,30 @@ class CollectorTracer(BaseTextualizePlugin):
 
         self.results.collect.precise_finish = time.perf_counter()
         self.results.collect.finish = DateTime.now()
+        # -- the items of an interrupted collection never reached modifyitems
+        self.classify_pending()
+        self.results.collect.stats = self.counters.to_stats()
         self._end_time = self.results.collect.finish.to_time_string()
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import CollectFinish
+
+            stats = self.counters
+            self.recorder.emit(
+                CollectFinish,
+                self._end_time,
+                stats.total_collected,
+                stats.total_errors,
+                stats.total_deselected,
+                stats.total_skipped,
+                stats.total_xfailed,
+            )
+        if self._plan is not None:
+            summary = self._plan.write(session.items)
+            self.verbose_logger.debug(f"{self._plan!r} written: {summary}")
+        if self.headless:
+            return None
+        if self._collapse is not None:
+            self._collapse.flush()
         self.report_collect(True)
 
         lines = self.config.hook.pytest_report_collectionfinish(
@@ -381,7 +567,12 @@ class CollectorTracer(BaseTextualizePlugin):
             self.console.print(line)
 
         if self.config.getoption("collectonly"):
-            if session.items:
+            if session.items and self.config.get_verbosity(self.config.VERBOSITY_TEST_CASES) >= 0:
+                from pytest_textualize.plugin.helpers.plan_tree import PlanTree
+
+                depth = self.config.getoption("textualize_plan_depth", 0, skip=True)
+                PlanTree(session.items, max_depth=depth).stream(self.console)
+            elif session.items:
                 renderable = collect_only_report(session)
                 self.console.print(Padding(renderable, (0, 0, 0, 3)), crop=False, overflow="ignore")
 
@@ -393,9 +584,161 @@ class CollectorTracer(BaseTextualizePlugin):
         Textualize.stage_rule(self.console, "collection", time_str=self._end_time, start=False)
         return None
 
+
+class CollectorProfiler(BaseTextualizePlugin):
+    """Times every collector and reports the slowest ones at the end of the collection."""
+
+    name = TextualizePlugins.COLLECTOR_PROFILER
+
+    def __init__(self, profile: CollectProfile) -> None:
+        self.profile = profile
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}' profile={self.profile!r}>"
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_make_collect_report(
+        self, collector: pytest.Collector
+    ) -> Generator[None, pytest.CollectReport, pytest.CollectReport]:
+        start = self.profile.start_collector()
+        try:
+            return (yield)
+        finally:
+            self.profile.time_collector(collector, start)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        self.profile.uninstall()
+        self.profile.count_items(session.items)
+        json_path = self.config.getoption("textualize_collect_profile_json", None, skip=True)
+        if json_path:
+            self.profile.dump(json_path)
+        top = self.config.getoption("textualize_collect_profile", 0, skip=True)
+        if top > 0 and not self.headless:
+            self.console.print(self.profile.table(top))
+        self.verbose_logger.debug(repr(self.profile))
+        return None
+
+
+class CollectorScheduler(BaseTextualizePlugin):
+    """Reorders the selected items by their duration history or their last failures."""
+
+    name = TextualizePlugins.COLLECTOR_SCHEDULER
+
+    def __init__(self, order: str) -> None:
+        self.order = order
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}' order='{self.order}'>"
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        # -- after the other plugins deselected and reordered the items
+        from pytest_textualize.plugin.helpers.scheduler import LASTFAILED_CACHE_KEY
+        from pytest_textualize.plugin.helpers.scheduler import make_scheduler
+
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not items:
+            return None
+        durations: dict[str, float] = {}
+        lastfailed: dict[str, object] = {}
+        if self.order == "failed-first":
+            lastfailed = cache.get(LASTFAILED_CACHE_KEY, {})
+        else:
+            from pytest_textualize.plugin.helpers.duration_history import DurationHistory
+
+            durations = DurationHistory(cache, self.config.rootpath).means()
+        scheduler = make_scheduler(self.order, durations, lastfailed)
+        items[:] = scheduler.order(items)
+        self.verbose_logger.debug(f"{scheduler!r} ordered {len(items)} items {self.order}")
+        return None
+
+
+class CollectorStatic(BaseTextualizePlugin):
+    """Collects the test modules from their source, without importing them."""
+
+    name = TextualizePlugins.COLLECTOR_STATIC
+
+    def __init__(self) -> None:
+        self.modules: list[StaticModule] = []
+
+    def __repr__(self) -> str:
+        collected = [module for module in self.modules if module.collected]
+        imported = sum(1 for module in collected if module.fallback is not None)
+        return (
+            f"<{self.__class__.__name__} name='{self.name}' "
+            f"static={len(collected) - imported} imported={imported}>"
+        )
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pycollect_makemodule(
+        self, module_path: Path, parent: pytest.Collector
+    ) -> pytest.Module:
+        from pytest_textualize.plugin.helpers.static_collect import StaticModule
+
+        module = StaticModule.from_parent(parent, path=module_path)
+        self.modules.append(module)
+        return module
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_finish(self, session: pytest.Session) -> None:
+        for module in self.modules:
+            if module.fallback is not None:
+                self.verbose_logger.debug(f"{module.nodeid} imported: {module.fallback}")
+        self.verbose_logger.debug(repr(self))
+        return None
+
+
+class CollectorVerboseTracer(BaseTextualizePlugin):
+    """The collection hooks that only log or render at -v, unregistered with the CollectorTracer."""
+
+    name = TextualizePlugins.COLLECTOR_VERBOSE_TRACER
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}'>"
+
+    @property
+    def collectonly(self) -> bool:
+        return self.config.getoption("collectonly")
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl
+    def pytest_collection_modifyitems(self, items: list[pytest.Item]) -> None:
+        hook, _, level = Textualize.hook_msg("pytest_collection_modifyitems")
+        self.verbose_logger.log(hook, level_text=level, verbosity=Verbosity.VERBOSE)
+        return None
+
+    @pytest.hookimpl
+    def pytest_report_collectionfinish(
+        self, items: Sequence[pytest.Item]
+    ) -> ConsoleRenderable | ListAny | str | None:
+        # -- registered for the sinks too, the report is for the terminal at -v only
+        if self.collectonly or self.headless or self.verbosity < Verbosity.VERBOSE:
+            return None
+        return collect_only_report(None, items)
+
+
+class CollectorDebugTracer(CollectorVerboseTracer):
+    """Adds the collect report of every collector, at -vv and above."""
+
     @pytest.hookimpl
     def pytest_make_collect_report(self, collector: pytest.Collector) -> None:
-        if self.verbosity <= Verbosity.VERBOSE or collector.nodeid == "":
+        if collector.nodeid == "":
             return
         if isinstance(collector, pytest.Session):
             info = f'pytest.Session -> "{collector.nodeid}"'
@@ -408,112 +751,16 @@ class CollectorTracer(BaseTextualizePlugin):
         hook, info, level = Textualize.hook_msg("pytest_make_collect_report", info=info)
         self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
 
-    @pytest.hookimpl
-    def pytest_report_collectionfinish(
-        self, items: Sequence[pytest.Item]
-    ) -> ConsoleRenderable | ListAny | str | None:
-        if not self.collectonly and self.verbosity > Verbosity.NORMAL:
-            return collect_only_report(None, items)
-        return None
-
-    @pytest.hookimpl
-    def pytest_unconfigure(self) -> None:
-        msg, info, level = Textualize.hook_msg("pytest_unconfigure", info=self.__class__.__name__)
-        self.verbose_logger.log(msg, info, level_text=level, verbosity=Verbosity.VERBOSE)
-
 
 def collect_only_report(
     session: Optional[pytest.Session], pyt_items: Optional[Sequence[pytest.Item]] = None
 ) -> ConsoleRenderable:
-    import inspect
-    from rich.tree import Tree
     from rich.panel import Panel
     from rich import box
     from rich.columns import Columns
-    from rich.console import Group
     from rich.markup import escape
-    from rich.table import Table
-    from _pytest.nodes import Node
     from collections import Counter
 
-    def collected_tree() -> ConsoleRenderable:
-
-        def _format_node(node: Node) -> RenderableType:
-            type_name = node.__class__.__name__.lower()
-            name_style = "i #BBE9FF"
-
-            match type_name:
-                case "dir":
-                    renderable = (
-                        Text(f"<Dir: ", style="#FFEEA9")
-                        .append(node.name, style=name_style)
-                        .append(">", style="#FFEEA9")
-                    )
-                case "package":
-                    renderable = (
-                        Text(f"<Package: ", style="#4CC9FE")
-                        .append(node.name, style=name_style)
-                        .append(">", style="#4CC9FE")
-                    )
-                case "module":
-                    renderable = (
-                        Text(f"<Module: ", style="#6FE6FC")
-                        .append(node.name, style=name_style)
-                        .append(">", style="#6FE6FC")
-                    )
-                case "function":
-                    renderable = (
-                        Text(f"<Function: ", style="#4ED7F1")
-                        .append(node.name, style=name_style)
-                        .append(">", style="#4ED7F1")
-                    )
-                case _:
-                    assert_never(type_name)
-
-            obj = getattr(node, "obj", None)
-            doc = inspect.getdoc(obj) if obj else None
-            if doc:
-                table = Table(show_header=False, safe_box=True, show_edge=True, style="#4CC9FE")
-                table.add_column("Doc", style="#BBE9FF", no_wrap=True)
-                for line in doc.splitlines():
-                    table.add_row(line)
-
-                return Group(renderable, table)
-
-            return renderable
-
-        root = Tree("pytest session", highlight=False, hide_root=True)
-        stack: list[Node] = []
-        tree_stack: list[Tree] = []
-        for item in session.items:
-            needed_collectors = item.listchain()[1:]  # strip root node
-            while stack:
-                if stack == needed_collectors[: len(stack)]:
-                    break
-                stack.pop()
-                tree_stack.pop()
-            for col in needed_collectors[len(stack) :]:
-                formatted_node = _format_node(col)
-                if len(stack) == 0:
-                    leaf = root.add(formatted_node, guide_style="#BBE9FF", highlight=False)
-                    tree_stack.append(leaf)
-                else:
-                    tree_stack.append(
-                        tree_stack[-1].add(formatted_node, guide_style="#BBE9FF", highlight=False)
-                    )
-                stack.append(col)
-        panel = Panel(
-            root,
-            expand=False,
-            box=box.DOUBLE,
-            padding=(1, 2, 1, 4),
-            title="Execution Plan",
-            style="#578FCA",
-            subtitle="collect-only",
-            subtitle_align="left",
-        )
-        return panel
-
     def collected_list() -> ConsoleRenderable:
         renderables: list[str] = []
         for i, item in enumerate(session.items, start=1):
@@ -556,13 +803,11 @@ def collect_only_report(
     if pyt_items:
         return collected_groups(pyt_items)
 
+    # -- the tree of the default verbosity is streamed, see PlanTree
     test_cases_verbosity = session.config.get_verbosity(pytest.Config.VERBOSITY_TEST_CASES)
-    if test_cases_verbosity < 0:
-        if test_cases_verbosity < -1:
-            return collected_groups()
-        else:
-            return collected_list()
-    return collected_tree()
+    if test_cases_verbosity < -1:
+        return collected_groups()
+    return collected_list()
 
 
 # if self.verbosity > Verbosity.VERBOSE and hasattr(item, "callspec"):
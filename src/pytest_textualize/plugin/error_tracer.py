@@ -7,10 +7,7 @@ import warnings
 from contextlib import suppress
 from types import ModuleType
 from typing import Any
-from typing import NotRequired
 from typing import TYPE_CHECKING
-from typing import TypedDict
-from typing import Unpack
 
 import pytest
 from rich.padding import Padding
@@ -84,15 +81,15 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
         warning_message: warnings.WarningMessage,
         nodeid: str,
     ) -> None:
-
-        hook, info, level = Textualize.hook_msg("pytest_warning_recorded", info=nodeid)
-        self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
-        key, val, level = Textualize.keyval_msg(
-            "category", warning_message.category.__name__, value_style="python.builtin"
-        )
-        self.verbose_logger.log(key, val, level_text=level, verbosity=Verbosity.VERBOSE)
-        key, val, level = Textualize.keyval_msg("doc", warning_message.category.__doc__)
-        self.verbose_logger.log(key, val, level_text=level, verbosity=Verbosity.VERBOSE)
+        if self.verbose_logger.wants(Verbosity.VERBOSE):
+            hook, info, level = Textualize.hook_msg("pytest_warning_recorded", info=nodeid)
+            self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
+            key, val, level = Textualize.keyval_msg(
+                "category", warning_message.category.__name__, value_style="python.builtin"
+            )
+            self.verbose_logger.log(key, val, level_text=level, verbosity=Verbosity.VERBOSE)
+            key, val, level = Textualize.keyval_msg("doc", warning_message.category.__doc__)
+            self.verbose_logger.log(key, val, level_text=level, verbosity=Verbosity.VERBOSE)
         encoded_string = str(warning_message.message).encode("utf-8")
         hasher = hashlib.sha256()
         hasher.update(encoded_string)
@@ -107,6 +104,17 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
             messages=str(warning_message.message).splitlines(),
         )
         self.results.warnings.append(wr)
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import WarningRecorded
+
+            self.recorder.emit(
+                WarningRecorded,
+                nodeid,
+                warning_message.category.__name__,
+                str(warning_message.message),
+                warning_message.filename,
+                warning_message.lineno,
+            )
 
     @pytest.hookimpl
     def pytest_internalerror(
@@ -114,6 +122,9 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
         excrepr: ExceptionRepr,
         excinfo: pytest.ExceptionInfo[BaseException],
     ) -> bool | None:
+        if self.headless:
+            # -- pytest writes the internal error to sys.stderr
+            return None
         import pluggy
         import _pytest
         import traceback
@@ -199,15 +210,17 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
         call: pytest.CallInfo[Any],
         report: pytest.CollectReport | pytest.TestReport,
     ) -> None:
-        hook, info, level = Textualize.hook_msg(
-            "pytest_exception_interact", info=f"[python.builtin]{call.excinfo.typename}[/]"
-        )
-        self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.NORMAL)
-        self.verbose_logger.warning("error message", str(call.excinfo.value))
+        if self.verbose_logger.wants(Verbosity.NORMAL):
+            hook, info, level = Textualize.hook_msg(
+                "pytest_exception_interact", info=f"[python.builtin]{call.excinfo.typename}[/]"
+            )
+            self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.NORMAL)
+        if self.verbose_logger.wants(Verbosity.VERBOSE):
+            self.verbose_logger.warning("error message", str(call.excinfo.value))
 
         if isinstance(report, pytest.CollectReport):
             self.make_error_report("pytest_exception_interact", node, call, report)
-        else:
+        elif self.verbose_logger.wants(Verbosity.NORMAL):
             self.verbose_logger.error(f"Error message ⟶ {str(call.excinfo.value)}.", highlight=True)
 
         # from boltons.tbutils import ExceptionInfo
@@ -245,98 +258,22 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
         #
         #         self.results.collect.errors[report.head_line] = record
 
-    class ReportTypeDict(TypedDict):
-        node: NotRequired[pytest.Item | pytest.Collector]
-        call: NotRequired[pytest.CallInfo[Any]]
-        report: NotRequired[pytest.CollectReport | pytest.TestReport]
-        message: NotRequired[str]
-        exception_info: NotRequired[ExceptionInfo[BaseException]]
-        collector: NotRequired[pytest.Collector]
-
-    def make_error_report(self, *args, **kwargs: Unpack[ReportTypeDict]) -> None:
-        import inspect
-        from rich.containers import Lines
-        from rich.console import Group
-        from rich.padding import Padding
-
-        from rich.table import Table
-        from pytest_textualize.factories.theme_factory import ThemeFactory
-
-        when = ""
-        nodeid = ""
-        node_name = ""
-        collector_type = ""
-        exc_info = None
-        caller = inspect.stack()[1].function
-        if caller == "pytest_pycollect_makemodule":
-            when = "collect"
-            exc_info = kwargs.pop("exception_info", None)
-            collector = kwargs.pop("collector", None)
-            nodeid = collector.nodeid
-            node_name = collector.name
-            collector_type = str(collector)
-            if "message" in kwargs:
-                message = kwargs.pop("message")
-                caller += "\n" + message
-
-        repr_h = ThemeFactory.repr_highlighter()
-        path_h = ThemeFactory.path_highlighter()
-
-        txt = Text(f" ≫ hook {caller} was invoked")
-        txt.highlight_words([caller], style="pyest.hook.name")
-
-        node_table = Table.grid(padding=(0, 1))
-        node_table.add_column(justify="left")
-        node_table.add_column(justify="left", style="scope.key_ni")
-        node_table.add_row("|", "when: ", when)
-        node_table.add_row("|", "node type: ", node.__class__.__name__)
-        node_table.add_row("|", "node name: ", node_name)
-        node_table.add_row("|", "node id: ", nodeid)
-        te = exc_info.traceback[-1]
-        relative = Textualize.relative_path(te.path)
-        link = Textualize.create_link(str(te.path), te.lineno, sys.stdout.isatty(), use_click=True)
-        lines = Lines(
-            [
-                Text(" | ".rjust(9))
-                .append("File")
-                .append(" = ", style="i")
-                .append_text(path_h(relative.as_posix())),
-                Text(" | ".rjust(9))
-                .append("Function")
-                .append(" = ", style="i")
-                .append(te.name, style="i"),
-                Text(" | ".rjust(9))
-                .append("Lineno")
-                .append(" = ", style="i")
-                .append_text(repr_h(str(te.lineno))),
-                Text(" | ".rjust(9))
-                .append("Statement ↦ ")
-                .append(Text("\n".join(te.statement).strip(), style="white")),
-                Text(" | ".rjust(9)).append(link).append(" ", style="reset"),
-            ]
-        )
-
-        group = Group(
-            txt,
-            Text("\n Node Details:", style="b"),
-            Padding(node_table, pad=(0, 0, 0, 8)),
-            Text("\n Documentation:", style="white b"),
-            Text(f"{" | ".rjust(9)}{exc_info.value.__doc__}", style="white", end="\n\n"),
-            Text(" Exception Message:", style="b"),
-            repr_h(f"{" | ".rjust(9)}{str(exc_info.value)}\n"),
-            Text(" Exception Details:", style="b"),
-            lines,
-        )
-        from rich.panel import Panel
+    def make_error_report(
+        self,
+        hook: str,
+        node: pytest.Item | pytest.Collector,
+        call: pytest.CallInfo[Any],
+        report: pytest.CollectReport,
+    ) -> None:
+        """Registers the facts of a collection error, the errors summary renders them."""
+        from pytest_textualize.model import ErrorInfo
 
-        title = f"[b]{str(exc_info.type)}[/b]"
-        panel = Panel(group, title=title, style="red", width=120)
+        if call.excinfo is None:
+            return None
         theme = self.settings.tracebacks_settings._syntax_theme
-        syntax = syntax_from_tb_entry(theme, te, self.console.width - 20)
-        if isinstance(report, pytest.CollectReport):
-            self.results.collect.register_error(
-                report.nodeid, exc_info.value, report, panel, syntax
-            )
+        self.results.collect.register_error(
+            ErrorInfo.from_exception_info(hook, node, call.excinfo, report, syntax_theme=theme)
+        )
         return None
 
     def makzzze_error_report(
@@ -441,6 +378,8 @@ class ErrorExecutionTracer(BaseTextualizePlugin):
     def report_keyboard_interrupt(self) -> None:
         from rich.text import Text
 
+        if self.headless:
+            return None
         excrepr = self._keyboard_interrupt_memo
         assert excrepr is not None
         assert excrepr.reprcrash is not None
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    import pytest
+    from _pytest.skipping import Skip
+    from _pytest.skipping import Xfail
+
+
+CONDITION_MARKS: Final = frozenset({"skip", "skipif", "xfail"})
+
+
+class MarkSignature(NamedTuple):
+    """The skip and xfail marks of an item, the items sharing it evaluate to the same result."""
+
+    key: str
+    markers: list[str]
+    dynamic: bool
+    """String conditions, evaluated against the module globals and the environment."""
+
+
+class Classified(NamedTuple):
+    item: pytest.Item
+    markers: list[str]
+    skipped: Skip | None
+    xfailed: Xfail | None
+
+
+def mark_signature(item: pytest.Item) -> MarkSignature:
+    """Walks the markers of the item once, for the marker names and the signature of the skip
+    and xfail marks."""
+    markers: list[str] = []
+    parts: list[tuple[str, tuple[Any, ...], tuple[tuple[str, Any], ...]]] = []
+    dynamic = False
+    for mark in item.iter_markers():
+        markers.append(mark.name)
+        if mark.name not in CONDITION_MARKS:
+            continue
+        if mark.name == "skip":
+            # -- the positional argument of a skip mark is its reason, not a condition
+            conditions: tuple[Any, ...] = ()
+        else:
+            conditions = mark.args if mark.args else (mark.kwargs.get("condition", True),)
+        dynamic = dynamic or any(isinstance(condition, str) for condition in conditions)
+        parts.append((mark.name, mark.args, tuple(sorted(mark.kwargs.items()))))
+    return MarkSignature(repr(parts), markers, dynamic)
+
+
+class MarkClassifier:
+    """Evaluates the skip and xfail marks once per unique marks signature.
+
+    The items of a parametrize family share their marks, so the evaluation cost follows the
+    number of unique signatures instead of the number of items. The signatures with string
+    conditions are grouped per test file, since the conditions are evaluated against the module
+    globals and the conftest namespace.
+    """
+
+    __slots__ = ("evaluations",)
+
+    def __init__(self) -> None:
+        self.evaluations = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} evaluations={self.evaluations}>"
+
+    def classify(self, items: Iterable[pytest.Item]) -> list[Classified]:
+        items = list(items)
+        signatures = [mark_signature(item) for item in items]
+        groups: dict[tuple[str, Path | None], list[int]] = {}
+        for index, (item, signature) in enumerate(zip(items, signatures)):
+            group_key = (signature.key, item.path if signature.dynamic else None)
+            groups.setdefault(group_key, []).append(index)
+
+        classified: dict[int, Classified] = {}
+        for indexes in groups.values():
+            skipped, xfailed = self.evaluate(items[indexes[0]])
+            for index in indexes:
+                classified[index] = Classified(
+                    items[index], signatures[index].markers, skipped, xfailed
+                )
+        return [classified[index] for index in range(len(items))]
+
+    def evaluate(self, item: pytest.Item) -> tuple[Skip | None, Xfail | None]:
+        """Evaluates the marks of the first item of a group, the result stands for the group."""
+        from _pytest.skipping import evaluate_skip_marks
+        from _pytest.skipping import evaluate_xfail_marks
+
+        self.evaluations += 1
+        return evaluate_skip_marks(item), evaluate_xfail_marks(item)
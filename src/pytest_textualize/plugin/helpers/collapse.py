@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+DEFAULT_COLLAPSE_THRESHOLD: Final = 100
+
+
+@dataclass(slots=True)
+class CollapsedGroup:
+    """The items of a module or a parametrize family that were not reported one by one."""
+
+    label: str
+    first: str
+    last: str
+    count: int = 0
+    skipped: int = 0
+    xfailed: int = 0
+
+    def add(self, nodeid: str, skipped: bool, xfailed: bool) -> None:
+        self.last = nodeid
+        self.count += 1
+        self.skipped += skipped
+        self.xfailed += xfailed
+        return None
+
+    def summary(self) -> str:
+        from boltons.strutils import cardinalize
+
+        parts = [f"{self.count} {cardinalize("item", self.count)} of {self.label} collapsed"]
+        if self.skipped:
+            parts.append(f"{self.skipped} skipped")
+        if self.xfailed:
+            parts.append(f"{self.xfailed} xfailed")
+        if self.count > 1:
+            parts.append(f"first {self.first}")
+            parts.append(f"last {self.last}")
+        else:
+            parts.append(self.first)
+        return ", ".join(parts)
+
+
+class CollapseTracker:
+    """Decides which collected items are reported individually.
+
+    Items are counted per module (the node id path) and per parametrize family (the node id
+    without the parameters id). Once one of the counts passes the threshold, the following items
+    are accumulated into a ``CollapsedGroup``, handed to ``on_collapse`` when the family or the
+    module changes, or on ``flush``. A threshold of 0 never collapses.
+    """
+
+    def __init__(self, threshold: int, on_collapse: Callable[[CollapsedGroup], None]) -> None:
+        self.threshold = threshold
+        self.on_collapse = on_collapse
+        self.module = ""
+        self.family = ""
+        self.module_count = 0
+        self.family_count = 0
+        self.collapsed_items = 0
+        self.group: CollapsedGroup | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} "
+            f"threshold={self.threshold} "
+            f"collapsed={self.collapsed_items}>"
+        )
+
+    def add(self, nodeid: str, skipped: bool = False, xfailed: bool = False) -> bool:
+        """Counts the item, returns True if the item should be reported individually."""
+        if not self.threshold:
+            return True
+        module = nodeid.partition("::")[0]
+        family = nodeid.partition("[")[0]
+        if module != self.module:
+            self.flush()
+            self.module, self.module_count = module, 0
+        if family != self.family:
+            if self.group is not None and self.group.label == self.family:
+                self.flush()
+            self.family, self.family_count = family, 0
+        self.module_count += 1
+        self.family_count += 1
+        if self.family_count <= self.threshold and self.module_count <= self.threshold:
+            return True
+
+        label = family if self.family_count > self.threshold else module
+        if self.group is None or self.group.label != label:
+            self.flush()
+            self.group = CollapsedGroup(label=label, first=nodeid, last=nodeid)
+        self.group.add(nodeid, skipped, xfailed)
+        self.collapsed_items += 1
+        return False
+
+    def flush(self) -> None:
+        if self.group is not None:
+            group, self.group = self.group, None
+            self.on_collapse(group)
+        return None
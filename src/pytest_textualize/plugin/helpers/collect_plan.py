@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from pytest_textualize.textualize.export import CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    import pytest
+    from _pytest.skipping import Skip
+    from _pytest.skipping import Xfail
+
+
+PLAN_VERSION: Final = 1
+
+
+def historical_durations(config: pytest.Config) -> dict[str, float]:
+    """The mean durations of the previous runs, empty without the cache provider."""
+    from pytest_textualize.plugin.helpers.duration_history import DurationHistory
+
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return {}
+    return DurationHistory(cache, config.rootpath).means()
+
+
+def raises_names(raises: Any) -> str | None:
+    if raises is None:
+        return None
+    excs = raises if isinstance(raises, tuple) else (raises,)
+    return ", ".join(exc.__name__ for exc in excs)
+
+
+class PlanEntry(NamedTuple):
+    """The classification of an item, kept until the plan is written."""
+
+    markers: list[str]
+    skip: str | None
+    xfail: dict[str, Any] | None
+
+
+class PlanWriter:
+    """Writes the execution plan of the session to a json file, one item at a time.
+
+    The entries are the marker names and the skip and xfail evaluations of the collection, the
+    items are written in the order of ``session.items``, after the deselection, with the
+    duration of their previous runs when the history knows them.
+    """
+
+    __slots__ = ("path", "durations", "_entries")
+
+    def __init__(self, path: str | Path, durations: Mapping[str, float] | None = None) -> None:
+        self.path = Path(path)
+        self.durations = durations or {}
+        self._entries: dict[str, PlanEntry] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} path='{self.path}' entries={len(self._entries)} "
+            f"durations={len(self.durations)}>"
+        )
+
+    def classified(
+        self,
+        nodeid: str,
+        markers: list[str],
+        skipped: Skip | None,
+        xfailed: Xfail | None,
+    ) -> None:
+        xfail = None
+        if xfailed is not None:
+            xfail = {
+                "reason": xfailed.reason,
+                "run": xfailed.run,
+                "strict": xfailed.strict,
+                "raises": raises_names(xfailed.raises),
+            }
+        self._entries[nodeid] = PlanEntry(
+            markers, None if skipped is None else skipped.reason, xfail
+        )
+        return None
+
+    def record(self, nodeid: str) -> dict[str, Any]:
+        entry = self._entries.get(nodeid)
+        if entry is None:
+            entry = PlanEntry([], None, None)
+        if entry.skip is not None:
+            status = "skip"
+        elif entry.xfail is not None:
+            status = "xfail"
+        else:
+            status = "run"
+        return {
+            "nodeid": nodeid,
+            "module": nodeid.partition("::")[0],
+            "markers": entry.markers,
+            "status": status,
+            "skip_reason": entry.skip,
+            "xfail": entry.xfail,
+            "duration": self.durations.get(nodeid),
+        }
+
+    def write(self, items: Iterable[pytest.Item]) -> dict[str, Any]:
+        """Writes the plan of the items, returns its summary."""
+        summary: dict[str, Any] = {
+            "items": 0,
+            "skip": 0,
+            "xfail": 0,
+            "with_duration": 0,
+            "estimated_duration": 0.0,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as file:
+            file.write(f'{{"version": {PLAN_VERSION}, "items": [')
+            fragments: list[str] = []
+            size = 0
+            for item in items:
+                record = self.record(item.nodeid)
+                summary["items"] += 1
+                if record["status"] != "run":
+                    summary[record["status"]] += 1
+                if record["duration"] is not None:
+                    summary["with_duration"] += 1
+                    summary["estimated_duration"] += record["duration"]
+                fragment = json.dumps(record)
+                fragments.append(f"\n  {fragment}" if summary["items"] == 1 else f",\n  {fragment}")
+                size += len(fragment)
+                if size >= CHUNK_SIZE:
+                    file.write("".join(fragments))
+                    fragments.clear()
+                    size = 0
+            file.write("".join(fragments))
+            summary["estimated_duration"] = round(summary["estimated_duration"], 6)
+            file.write(f'\n], "summary": {json.dumps(summary)}}}\n')
+        self._entries.clear()
+        return summary
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+    import pytest
+    from rich.console import ConsoleRenderable
+
+    from pytest_textualize.plugin.helpers.prewarm import PrewarmReport
+
+
+ProfileKind = Literal["module", "directory", "conftest"]
+PROFILE_KINDS: Final[tuple[ProfileKind, ...]] = ("module", "directory", "conftest")
+
+
+def profile_requested(options: Namespace) -> bool:
+    """Whether the options ask for the table or the json file of the collection profile."""
+    return bool(getattr(options, "textualize", False)) and (
+        getattr(options, "textualize_collect_profile", 0) > 0
+        or bool(getattr(options, "textualize_collect_profile_json", None))
+    )
+
+
+@dataclass(slots=True)
+class ProfileEntry:
+    kind: ProfileKind
+    path: Path
+    seconds: float = 0.0
+    items: int = 0
+
+    def to_dict(self, rootpath: Path) -> dict[str, Any]:
+        from _pytest.pathlib import bestrelpath
+
+        return {
+            "path": bestrelpath(rootpath, self.path),
+            "seconds": round(self.seconds, 6),
+            "items": self.items,
+        }
+
+
+class CollectProfile:
+    """The time spent collecting every module and directory and importing every conftest.
+
+    The times are exclusive: a conftest imported while a directory is collected is not counted
+    in the directory own time. The directory totals add the times of everything below them. The
+    conftests are timed by wrapping the private ``_importconftest`` of the plugin manager, pytest
+    has no hook around their import.
+    """
+
+    def __init__(self, rootpath: Path) -> None:
+        self.rootpath = rootpath
+        self.modules: dict[Path, ProfileEntry] = {}
+        self.own_directories: dict[Path, float] = {}
+        self.conftests: dict[Path, ProfileEntry] = {}
+        self.total = 0.0
+        self.prewarm: PrewarmReport | None = None
+        self._nested = 0.0
+        self._collecting = False
+        self._import_conftest: Callable[..., Any] | None = None
+        self._pluginmanager: pytest.PytestPluginManager | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} modules={len(self.modules)} "
+            f"conftests={len(self.conftests)} total={self.total:.3f}s>"
+        )
+
+    def start_collector(self) -> float:
+        self._collecting = True
+        self._nested = 0.0
+        return time.perf_counter()
+
+    def time_collector(self, collector: pytest.Collector, start: float) -> None:
+        """Adds the time since ``start`` to the module or the directory of the collector."""
+        import pytest
+
+        elapsed = time.perf_counter() - start
+        self.total += elapsed
+        own = elapsed - self._nested
+        self._collecting = False
+        if isinstance(collector, pytest.Session):
+            return None
+        if isinstance(collector, pytest.Directory):
+            self.own_directories[collector.path] = (
+                self.own_directories.get(collector.path, 0.0) + own
+            )
+            return None
+        # -- the classes are collected separately, their time goes to their module
+        entry = self.modules.get(collector.path)
+        if entry is None:
+            entry = self.modules[collector.path] = ProfileEntry("module", collector.path)
+        entry.seconds += own
+        return None
+
+    def install(self, pluginmanager: pytest.PytestPluginManager) -> None:
+        """Times the conftest imports of the plugin manager, until ``uninstall``."""
+        if self._import_conftest is not None:
+            return None
+        self._pluginmanager = pluginmanager
+        self._import_conftest = import_conftest = pluginmanager._importconftest
+
+        def timed_import_conftest(conftestpath: Path, *args: Any, **kwargs: Any) -> Any:
+            if conftestpath in self.conftests:
+                # -- already imported, the plugin manager returns the registered module
+                return import_conftest(conftestpath, *args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return import_conftest(conftestpath, *args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.conftests[conftestpath] = ProfileEntry("conftest", conftestpath, elapsed)
+                if self._collecting:
+                    self._nested += elapsed
+                else:
+                    # -- the initial conftests, imported before the collection starts
+                    self.total += elapsed
+
+        setattr(pluginmanager, "_importconftest", timed_import_conftest)
+        return None
+
+    def uninstall(self) -> None:
+        if self._pluginmanager is not None:
+            # -- removes the instance attribute, the class method is used again
+            vars(self._pluginmanager).pop("_importconftest", None)
+        self._pluginmanager = self._import_conftest = None
+        return None
+
+    def count_items(self, items: Iterable[pytest.Item]) -> None:
+        counts = Counter(item.path for item in items)
+        for path, count in counts.items():
+            entry = self.modules.get(path)
+            if entry is None:
+                entry = self.modules[path] = ProfileEntry("module", path)
+            entry.items = count
+        return None
+
+    def directories(self) -> dict[Path, ProfileEntry]:
+        """The directories with the total time and item count of everything below them."""
+        directories: dict[Path, ProfileEntry] = {}
+
+        def add(path: Path, seconds: float, items: int) -> None:
+            # -- up to the first directory that was not collected, out of the session
+            for parent in (path, *path.parents):
+                if parent not in self.own_directories:
+                    break
+                entry = directories.get(parent)
+                if entry is None:
+                    entry = directories[parent] = ProfileEntry("directory", parent)
+                entry.seconds += seconds
+                entry.items += items
+            return None
+
+        for path, seconds in self.own_directories.items():
+            add(path, seconds, 0)
+        for entry in self.modules.values():
+            add(entry.path.parent, entry.seconds, entry.items)
+        for entry in self.conftests.values():
+            add(entry.path.parent, entry.seconds, 0)
+        return directories
+
+    def slowest(self, kind: ProfileKind, top: int = 0) -> list[ProfileEntry]:
+        if kind == "directory":
+            entries = self.directories()
+        else:
+            entries = self.modules if kind == "module" else self.conftests
+        ordered = sorted(entries.values(), key=lambda entry: entry.seconds, reverse=True)
+        return ordered[:top] if top > 0 else ordered
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"total": round(self.total, 6)}
+        for kind in PROFILE_KINDS:
+            data[f"{kind}s" if kind != "directory" else "directories"] = [
+                entry.to_dict(self.rootpath) for entry in self.slowest(kind)
+            ]
+        if self.prewarm is not None:
+            data["prewarm"] = self.prewarm.to_dict()
+        return data
+
+    def dump(self, path: str | Path) -> None:
+        import json
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=2)
+        return None
+
+    def table(self, top: int) -> ConsoleRenderable:
+        from _pytest.pathlib import bestrelpath
+        from rich import box
+        from rich.table import Table
+
+        table = Table(
+            title="Collection profile",
+            title_justify="left",
+            box=box.SIMPLE_HEAD,
+            header_style="#4CC9FE",
+        )
+        table.add_column("kind", style="#FFEEA9")
+        table.add_column("path", style="i #BBE9FF", overflow="fold")
+        table.add_column("items", justify="right")
+        table.add_column("time", justify="right", style="#6FE6FC")
+        table.add_column("%", justify="right", style="dim")
+        for kind in PROFILE_KINDS:
+            rows: Sequence[ProfileEntry] = self.slowest(kind, top)
+            for entry in rows:
+                share = entry.seconds / self.total * 100 if self.total else 0.0
+                table.add_row(
+                    kind,
+                    bestrelpath(self.rootpath, entry.path),
+                    "" if kind == "conftest" else str(entry.items),
+                    f"{entry.seconds:.3f}s",
+                    f"{share:.1f}",
+                )
+            if rows:
+                table.add_section()
+        if self.prewarm is not None:
+            table.caption = (
+                f"prewarm: {self.prewarm.compiled} compiled, {self.prewarm.fresh} up to date, "
+                f"{self.prewarm.wall_seconds:.3f}s, ~{self.prewarm.saved:.3f}s saved"
+            )
+            table.caption_justify = "left"
+        return table
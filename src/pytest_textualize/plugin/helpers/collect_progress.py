@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Final
+from typing import TYPE_CHECKING
+
+from boltons.strutils import cardinalize
+from rich.segment import Segment
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.console import Console
+    from rich.style import Style
+
+    from pytest_textualize.model import CollectCounters
+
+
+SEPARATOR: Final = Segment(" ")
+
+
+def _collected(count: int) -> str:
+    return f"{count} {cardinalize("item", count)}"
+
+
+def _selected(count: int) -> str:
+    return f" / {count} selected"
+
+
+# -- (counter, style, text of the part), the parts are written only when the counter is set
+PARTS: Final[tuple[tuple[str, str, Callable[[int], str]], ...]] = (
+    ("total_errors", "error", lambda count: f" / {count} {cardinalize("error", count)}"),
+    ("total_deselected", "deselected", lambda count: f" / {count} deselected"),
+    ("total_skipped", "skipped", lambda count: f" / {count} skipped"),
+    ("total_xfailed", "xfailed", lambda count: f" / {count} xfailed"),
+)
+
+
+class CollectProgress:
+    """The segments of the collecting progress line.
+
+    The styles are resolved once and every part keeps the segment of its last number, a refresh
+    renders again only the parts whose number changed.
+    """
+
+    __slots__ = ("console", "_styles", "_parts")
+
+    def __init__(self, console: Console) -> None:
+        self.console = console
+        self._styles: dict[str, Style] = {}
+        self._parts: dict[str, tuple[int, Segment]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} parts={len(self._parts)}>"
+
+    def style(self, name: str) -> Style:
+        style = self._styles.get(name)
+        if style is None:
+            style = self._styles[name] = self.console.get_style(name, default="")
+        return style
+
+    def part(self, key: str, count: int, style: str, render: Callable[[int], str]) -> Segment:
+        cached = self._parts.get(key)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+        segment = Segment(render(count), self.style(style))
+        self._parts[key] = (count, segment)
+        return segment
+
+    def segments(self, counters: CollectCounters, final: bool, prefix: str = "") -> list[Segment]:
+        """The progress parts, separated by a space like the renderables of ``Console.print``."""
+        collected = counters.total_collected
+        label = f"{prefix}collected" if final else "▪ collecting "
+        segments = [
+            Segment(label, self.style("items")),
+            SEPARATOR,
+            self.part("total_collected", collected, "items", _collected),
+        ]
+        for key, style, render in PARTS:
+            count = getattr(counters, key)
+            if count:
+                segments.append(SEPARATOR)
+                segments.append(self.part(key, count, style, render))
+        if collected > counters.selected:
+            segments.append(SEPARATOR)
+            segments.append(self.part("selected", counters.selected, "selected", _selected))
+        return segments
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+    from rich.console import ConsoleRenderable
+
+    from pytest_textualize.model import ResultColumns
+
+
+DURATIONS_CACHE_KEY: Final = "textualize/durations"
+"""The duration history in the pytest cache, ``[mean, variance, runs]`` by node id."""
+ALPHA: Final = 0.3
+"""The weight of the last run in the moving average."""
+MIN_RUNS: Final = 3
+"""The runs of a test before its baseline is trusted."""
+MIN_DELTA: Final = 0.01
+"""The seconds a test must lose over its baseline, the sub millisecond tests are noise."""
+
+# -- an entry of the history: [mean, variance, runs]
+HistoryEntry = list[float]
+
+
+class Regression(NamedTuple):
+    nodeid: str
+    duration: float
+    mean: float
+    std: float
+    runs: int
+
+    @property
+    def sigmas(self) -> float:
+        return (self.duration - self.mean) / self.std if self.std else math.inf
+
+
+class DurationHistory:
+    """The durations of the passed tests across the runs, as an exponentially weighted mean and
+    variance per test, stored in the pytest cache.
+
+    The history is read once when the session starts and written once when it finishes, the
+    entries of the modules that no longer exist are dropped.
+    """
+
+    __slots__ = ("cache", "rootpath", "alpha", "entries", "_updated", "_modules")
+
+    def __init__(self, cache: pytest.Cache, rootpath: Path, alpha: float = ALPHA) -> None:
+        self.cache = cache
+        self.rootpath = rootpath
+        self.alpha = alpha
+        self.entries: dict[str, HistoryEntry] = {}
+        self._updated = 0
+        self._modules: set[str] = set()
+
+        stored = cache.get(DURATIONS_CACHE_KEY, None)
+        if isinstance(stored, dict):
+            self.entries = {
+                nodeid: entry
+                for nodeid, entry in stored.items()
+                if isinstance(entry, list) and len(entry) == 3
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} tests={len(self.entries)} updated={self._updated} "
+            f"alpha={self.alpha}>"
+        )
+
+    @classmethod
+    def from_config(cls, config: pytest.Config) -> DurationHistory | None:
+        cache = getattr(config, "cache", None)
+        if cache is None or not config.getoption("textualize_duration_history", True, skip=True):
+            return None
+        return cls(cache, config.rootpath)
+
+    def means(self) -> dict[str, float]:
+        return {nodeid: entry[0] for nodeid, entry in self.entries.items()}
+
+    def update(self, nodeid: str, duration: float) -> None:
+        entry = self.entries.get(nodeid)
+        if entry is None:
+            self.entries[nodeid] = [duration, 0.0, 1]
+        else:
+            mean, variance, runs = entry
+            diff = duration - mean
+            increment = self.alpha * diff
+            entry[:] = [
+                mean + increment,
+                (1 - self.alpha) * (variance + diff * increment),
+                runs + 1,
+            ]
+        self._updated += 1
+        return None
+
+    def regressions(self, tests: ResultColumns, sigma: float) -> list[Regression]:
+        """The passed tests slower than their baseline by more than ``sigma`` deviations."""
+        from pytest_textualize.model import OUTCOME_CODES
+        from pytest_textualize.model import TestResult
+
+        passed = OUTCOME_CODES[TestResult.Passed]
+        found: list[Regression] = []
+        for nodeid, code, setup, call, teardown in zip(
+            tests.nodeids, tests.outcomes, tests.setup, tests.call, tests.teardown
+        ):
+            entry = self.entries.get(nodeid)
+            if code != passed or entry is None or entry[2] < MIN_RUNS:
+                continue
+            duration, (mean, variance, runs) = setup + call + teardown, entry
+            std = math.sqrt(variance)
+            if duration - mean > max(sigma * std, MIN_DELTA):
+                found.append(Regression(nodeid, duration, mean, std, int(runs)))
+        found.sort(key=lambda regression: regression.duration - regression.mean, reverse=True)
+        return found
+
+    def record(self, tests: ResultColumns) -> None:
+        from pytest_textualize.model import OUTCOME_CODES
+        from pytest_textualize.model import TestResult
+
+        passed = OUTCOME_CODES[TestResult.Passed]
+        for nodeid, code, setup, call, teardown in zip(
+            tests.nodeids, tests.outcomes, tests.setup, tests.call, tests.teardown
+        ):
+            if code == passed:
+                self.update(nodeid, setup + call + teardown)
+                self._modules.add(nodeid.partition("::")[0])
+        return None
+
+    def save(self) -> None:
+        if not self._updated:
+            return None
+        # -- the node ids of the paths outside the rootdir are not relative to it
+        modules: dict[str, bool] = {module: True for module in self._modules}
+        entries: dict[str, list[Any]] = {}
+        for nodeid, (mean, variance, runs) in self.entries.items():
+            module = nodeid.partition("::")[0]
+            exists = modules.get(module)
+            if exists is None:
+                exists = modules[module] = (self.rootpath / module).exists()
+            if exists:
+                entries[nodeid] = [round(mean, 6), float(f"{variance:.4g}"), int(runs)]
+        self.cache.set(DURATIONS_CACHE_KEY, entries)
+        self._updated = 0
+        return None
+
+
+def regressions_table(regressions: list[Regression], sigma: float) -> ConsoleRenderable:
+    from rich import box
+    from rich.table import Table
+
+    from pytest_textualize.plugin.helpers.duration_report import format_seconds
+
+    table = Table(
+        title=f"Duration regressions, slower than their baseline by more than {sigma:g} σ",
+        title_justify="left",
+        box=box.SIMPLE_HEAD,
+        header_style="#4CC9FE",
+    )
+    table.add_column("test", style="i #BBE9FF", overflow="fold")
+    table.add_column("time", justify="right", style="#FF5151")
+    table.add_column("baseline", justify="right", style="#6FE6FC")
+    table.add_column("σ", justify="right")
+    table.add_column("slower", justify="right", style="#FFEEA9")
+    table.add_column("runs", justify="right", style="dim")
+    for regression in regressions:
+        sigmas = regression.sigmas
+        table.add_row(
+            regression.nodeid,
+            format_seconds(regression.duration),
+            format_seconds(regression.mean),
+            "∞" if math.isinf(sigmas) else f"{sigmas:.1f}",
+            f"x{regression.duration / regression.mean:.1f}" if regression.mean else "",
+            str(regression.runs),
+        )
+    return table
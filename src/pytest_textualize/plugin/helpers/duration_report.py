@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import heapq
+import math
+from itertools import count
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+    from rich.console import ConsoleRenderable
+
+    from pytest_textualize.model import ResultColumns
+
+
+PHASES: Final = ("setup", "call", "teardown")
+PERCENTILES: Final = (50, 90, 99)
+# -- the histogram buckets are the decades between 100µs and 10s, with one bucket on each side
+HISTOGRAM_DECADES: Final = range(-4, 1 + 1)
+
+
+class SlowTest(NamedTuple):
+    duration: float
+    nodeid: str
+
+
+class ModuleDurations(NamedTuple):
+    module: str
+    tests: int
+    total: float
+    percentiles: tuple[float, ...]
+    max: float
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1.0:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """The nearest rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def module_durations(tests: ResultColumns) -> list[ModuleDurations]:
+    """The percentiles of the test durations per module, the setup, call and teardown added."""
+    modules: dict[str, list[float]] = {}
+    for nodeid, setup, call, teardown in zip(
+        tests.nodeids, tests.setup, tests.call, tests.teardown
+    ):
+        modules.setdefault(nodeid.partition("::")[0], []).append(setup + call + teardown)
+    rows: list[ModuleDurations] = []
+    for module, durations in modules.items():
+        durations.sort()
+        rows.append(
+            ModuleDurations(
+                module,
+                len(durations),
+                math.fsum(durations),
+                tuple(percentile(durations, p) for p in PERCENTILES),
+                durations[-1],
+            )
+        )
+    rows.sort(key=lambda row: row.total, reverse=True)
+    return rows
+
+
+def log_histogram(values: Iterable[float]) -> list[tuple[str, int]]:
+    """The number of values per decade, the first and last buckets are open."""
+    first, last = HISTOGRAM_DECADES[0], HISTOGRAM_DECADES[-1]
+    counts = [0] * (len(HISTOGRAM_DECADES) + 1)
+    for value in values:
+        decade = math.floor(math.log10(value)) if value > 0 else first - 1
+        counts[min(max(decade, first - 1), last) - first + 1] += 1
+    labels = [f"< {format_seconds(10.0**first)}"]
+    labels.extend(
+        f"{format_seconds(10.0**decade)} - {format_seconds(10.0 ** (decade + 1))}"
+        for decade in HISTOGRAM_DECADES[:-1]
+    )
+    labels.append(f">= {format_seconds(10.0**last)}")
+    return list(zip(labels, counts))
+
+
+class DurationAnalytics:
+    """The slowest tests of every phase, kept in bounded heaps while the tests run.
+
+    A heap holds the ``top`` slowest reports seen so far, a report replaces the fastest of
+    them when it is slower, so the cost per report is ``O(log top)`` and nothing is sorted
+    but the heaps at the end. The percentiles and the histogram are computed from the duration
+    columns of the results, see ``ResultColumns``.
+    """
+
+    __slots__ = ("top", "heaps", "_order")
+
+    def __init__(self, top: int) -> None:
+        self.top = top
+        self.heaps: dict[str, list[tuple[float, int, str]]] = {phase: [] for phase in PHASES}
+        self._order = count()
+
+    def __repr__(self) -> str:
+        sizes = " ".join(f"{phase}={len(heap)}" for phase, heap in self.heaps.items())
+        return f"<{self.__class__.__name__} top={self.top} {sizes}>"
+
+    def add(self, nodeid: str, when: str, duration: float) -> None:
+        heap = self.heaps[when]
+        if len(heap) < self.top:
+            heapq.heappush(heap, (duration, next(self._order), nodeid))
+        elif duration > heap[0][0]:
+            heapq.heapreplace(heap, (duration, next(self._order), nodeid))
+        return None
+
+    def slowest(self, when: str) -> list[SlowTest]:
+        return [
+            SlowTest(duration, nodeid)
+            for duration, _, nodeid in sorted(self.heaps[when], key=lambda entry: -entry[0])
+        ]
+
+    def renderable(self, tests: ResultColumns, width: int = 40) -> ConsoleRenderable:
+        from rich import box
+        from rich.console import Group
+        from rich.table import Table
+
+        slowest = Table(
+            title=f"{self.top} slowest per phase",
+            title_justify="left",
+            box=box.SIMPLE_HEAD,
+            header_style="#4CC9FE",
+        )
+        slowest.add_column("phase", style="#FFEEA9")
+        slowest.add_column("time", justify="right", style="#6FE6FC")
+        slowest.add_column("test", style="i #BBE9FF", overflow="fold")
+        for phase in PHASES:
+            rows = self.slowest(phase)
+            for row in rows:
+                slowest.add_row(phase, format_seconds(row.duration), row.nodeid)
+            if rows:
+                slowest.add_section()
+
+        modules = Table(
+            title="Durations per module",
+            title_justify="left",
+            box=box.SIMPLE_HEAD,
+            header_style="#4CC9FE",
+        )
+        modules.add_column("module", style="i #BBE9FF", overflow="fold")
+        modules.add_column("tests", justify="right")
+        modules.add_column("total", justify="right", style="#6FE6FC")
+        for p in PERCENTILES:
+            modules.add_column(f"p{p}", justify="right")
+        modules.add_column("max", justify="right", style="#FFEEA9")
+        for module_row in module_durations(tests):
+            modules.add_row(
+                module_row.module,
+                str(module_row.tests),
+                format_seconds(module_row.total),
+                *map(format_seconds, module_row.percentiles),
+                format_seconds(module_row.max),
+            )
+
+        buckets = log_histogram(map(sum, zip(tests.setup, tests.call, tests.teardown)))
+        most = max((number for _, number in buckets), default=0)
+        histogram = Table(
+            title="Test durations histogram",
+            title_justify="left",
+            box=box.SIMPLE_HEAD,
+            header_style="#4CC9FE",
+        )
+        histogram.add_column("duration", justify="right")
+        histogram.add_column("tests", justify="right")
+        histogram.add_column("", style="#6FE6FC", no_wrap=True)
+        for label, number in buckets:
+            bar = "█" * math.ceil(number / most * width) if number else ""
+            histogram.add_row(label, str(number), bar)
+        return Group(slowest, modules, histogram)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+from typing import Final
+from typing import TYPE_CHECKING
+
+from rich.console import RenderHook
+from rich.control import Control
+from rich.segment import ControlType
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.console import ConsoleOptions
+    from rich.console import ConsoleRenderable
+    from rich.console import RenderResult
+
+
+DEFAULT_FPS: Final = 10
+OUTCOMES: Final = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+
+_ERASE_LINE: Final[tuple[ConsoleRenderable, ...]] = (
+    Control((ControlType.ERASE_IN_LINE, 2)),
+    Control((ControlType.CURSOR_MOVE_TO_COLUMN, 0)),
+)
+
+
+class _Frame:
+    """A frame of the dashboard, told apart from the other renderables by the render hook."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: Text) -> None:
+        self.text = text
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        yield self.text
+
+
+class ExecutionDashboard(RenderHook):
+    """A single line live view of the test execution, redrawn at most ``fps`` times per second.
+
+    Every report only increments counters and compares a duration, the line is built and written
+    when the next frame is due, so the per-test cost does not depend on the number of tests
+    finishing between two frames.
+
+    The dashboard is a render hook of the consoles, the line of the frame is erased before
+    anything else is printed and the frame is drawn again at the next report. The hook runs where
+    the output is rendered, so it stays in order with the writer thread of the background
+    consoles.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        total: int,
+        fps: int = DEFAULT_FPS,
+        error_console: Console | None = None,
+    ) -> None:
+        self.console = console
+        self.consoles = [console] if error_console is None else [console, error_console]
+        self.total = total
+        self.frame_interval = 1.0 / fps
+        self.counts: dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+        self.completed = 0
+        # -- the outcomes of the phases of the running test, counted when it finishes
+        self._outcomes: list[str] = []
+        self._drawn = False
+        self.module = ""
+        self.running: str | None = None
+        self.slowest: tuple[float, str] = (0.0, "")
+        self._running_start = 0.0
+        self._running_duration = 0.0
+        self._start = time.perf_counter()
+        self._next_frame = self._start
+        for hooked in self.consoles:
+            hooked.push_render_hook(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} "
+            f"completed={self.completed}/{self.total} "
+            f"fps={round(1 / self.frame_interval)}>"
+        )
+
+    def test_started(self, nodeid: str) -> None:
+        self.running = nodeid
+        self.module = nodeid.partition("::")[0]
+        self._running_duration = 0.0
+        self._running_start = now = time.perf_counter()
+        if now >= self._next_frame:
+            self.draw(now)
+        return None
+
+    def test_phase(self, outcome: str | None, duration: float, finished: bool) -> None:
+        if outcome is not None:
+            self._outcomes.append(outcome)
+        self._running_duration += duration
+        if finished:
+            self.completed += 1
+            for outcome in self._outcomes:
+                self.counts[outcome] += 1
+            self._outcomes.clear()
+            if self._running_duration > self.slowest[0] and self.running is not None:
+                self.slowest = (self._running_duration, self.running)
+            self.running = None
+        now = time.perf_counter()
+        if now >= self._next_frame:
+            self.draw(now)
+        return None
+
+    def render(self, now: float) -> Text:
+        elapsed = now - self._start
+        text = Text("▪ ", style="items", end="")
+        text.append(f"{self.completed}/{self.total}", style="items")
+        for outcome, count in self.counts.items():
+            if count:
+                text.append(" / ").append(f"{count} {outcome}", style=f"pytest.outcome.{outcome}")
+        if elapsed > 0:
+            text.append(f" | {self.completed / elapsed:.1f} tests/s", style="dim")
+        if self.module:
+            text.append(" | ").append(self.module, style="i #BBE9FF")
+        if self.running is not None and now - self._running_start > self.slowest[0]:
+            text.append(f" | running {self.running} ({now - self._running_start:.2f} s)")
+        elif self.slowest[1]:
+            text.append(f" | slowest {self.slowest[1]} ({self.slowest[0]:.2f} s)")
+        return text
+
+    def draw(self, now: float | None = None, end: str = "") -> None:
+        now = time.perf_counter() if now is None else now
+        self._next_frame = now + self.frame_interval
+        text = self.render(now)
+        text.end = end
+        self.console.print(_Frame(text), end="", no_wrap=True, overflow="ellipsis")
+        return None
+
+    def process_renderables(self, renderables: list[ConsoleRenderable]) -> list[ConsoleRenderable]:
+        if len(renderables) == 1 and isinstance(renderables[0], _Frame):
+            self._drawn = not renderables[0].text.end
+            return [*_ERASE_LINE, *renderables]
+        if not self._drawn:
+            return renderables
+        # -- the output takes the line of the frame, which is drawn again at the next report
+        self._drawn = False
+        self._next_frame = 0.0
+        return [*_ERASE_LINE, *renderables]
+
+    def finish(self) -> None:
+        """Draws the final frame and moves the cursor to the next line."""
+        self.running = None
+        self.draw(end="\n")
+        for hooked in self.consoles:
+            hooked.pop_render_hook()
+        return None
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import ConsoleRenderable
+
+
+TOP: Final = 10
+"""The fixtures listed by the profile."""
+CANDIDATE_MIN_SETUPS: Final = 5
+"""The setups of a function scoped fixture before it is worth widening."""
+CANDIDATE_MIN_MEAN_NS: Final = 1_000_000
+"""The mean setup and teardown cost of a function scoped fixture before it is worth widening."""
+
+
+class FixtureStats:
+    """The cumulative setup and teardown cost of a fixture definition."""
+
+    __slots__ = ("name", "baseid", "scope", "setups", "setup_ns", "teardowns", "teardown_ns")
+
+    def __init__(self, name: str, baseid: str, scope: str) -> None:
+        self.name = name
+        self.baseid = baseid
+        self.scope = scope
+        self.setups = 0
+        self.setup_ns = 0
+        self.teardowns = 0
+        self.teardown_ns = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} name='{self.name}' scope='{self.scope}' "
+            f"setups={self.setups} total_ns={self.total_ns}>"
+        )
+
+    @property
+    def total_ns(self) -> int:
+        return self.setup_ns + self.teardown_ns
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.setups if self.setups else 0.0
+
+    @property
+    def location(self) -> str:
+        return f"{self.baseid}::{self.name}" if self.baseid else self.name
+
+
+class FixtureProfile:
+    """The setup and teardown time of every fixture definition of the session.
+
+    The setup of a fixture requests its dependencies, their time is taken off the setup of the
+    fixture so every definition is charged its own cost only. The teardown is timed from a
+    finalizer added after the setup, it runs right before the teardown of the fixture since
+    the finalizers run last in first out, until ``pytest_fixture_post_finalizer``.
+    """
+
+    __slots__ = ("stats", "_nested", "_teardowns")
+
+    def __init__(self) -> None:
+        self.stats: dict[object, FixtureStats] = {}
+        # -- the setup time of the dependencies, one counter per setup in progress
+        self._nested: list[int] = []
+        self._teardowns: dict[object, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} fixtures={len(self.stats)}>"
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    def setup_started(self) -> int:
+        self._nested.append(0)
+        return perf_counter_ns()
+
+    def setup_finished(
+        self, fixturedef: object, name: str, baseid: str, scope: str, started: int
+    ) -> None:
+        elapsed = perf_counter_ns() - started
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        stats = self.stats.get(fixturedef)
+        if stats is None:
+            stats = self.stats[fixturedef] = FixtureStats(name, baseid, scope)
+        stats.setups += 1
+        stats.setup_ns += elapsed - nested
+        return None
+
+    def teardown_started(self, fixturedef: object) -> None:
+        self._teardowns[fixturedef] = perf_counter_ns()
+        return None
+
+    def teardown_finished(self, fixturedef: object) -> None:
+        # -- pytest finishes the fixtures that failed their setup or were never set up too
+        started = self._teardowns.pop(fixturedef, None)
+        if started is None:
+            return None
+        stats = self.stats[fixturedef]
+        stats.teardowns += 1
+        stats.teardown_ns += perf_counter_ns() - started
+        return None
+
+    def slowest(self, top: int = TOP) -> list[FixtureStats]:
+        return sorted(self.stats.values(), key=lambda stats: stats.total_ns, reverse=True)[:top]
+
+    def candidates(self, top: int = TOP) -> list[FixtureStats]:
+        """The expensive function scoped fixtures set up often, they may deserve a wider scope."""
+        found = [
+            stats
+            for stats in self.stats.values()
+            if stats.scope == "function"
+            and stats.setups >= CANDIDATE_MIN_SETUPS
+            and stats.mean_ns >= CANDIDATE_MIN_MEAN_NS
+        ]
+        found.sort(key=lambda stats: stats.total_ns, reverse=True)
+        return found[:top]
+
+    def renderable(self, top: int = TOP) -> ConsoleRenderable:
+        from rich.console import Group
+
+        tables: list[ConsoleRenderable] = [
+            fixtures_table(
+                f"The {top} fixtures with the most setup and teardown time", self.slowest(top)
+            )
+        ]
+        candidates = self.candidates(top)
+        if candidates:
+            tables.append(
+                fixtures_table(
+                    "Function scoped fixtures set up often, candidates for a wider scope",
+                    candidates,
+                )
+            )
+        return Group(*tables)
+
+
+def fixtures_table(title: str, fixtures: list[FixtureStats]) -> ConsoleRenderable:
+    from rich import box
+    from rich.table import Table
+
+    from pytest_textualize.plugin.helpers.duration_report import format_seconds
+
+    table = Table(title=title, title_justify="left", box=box.SIMPLE_HEAD, header_style="#4CC9FE")
+    table.add_column("fixture", style="i #BBE9FF", overflow="fold")
+    table.add_column("scope", style="#FFEEA9")
+    table.add_column("setups", justify="right", style="dim")
+    table.add_column("setup", justify="right", style="#6FE6FC")
+    table.add_column("teardown", justify="right", style="#6FE6FC")
+    table.add_column("total", justify="right", style="#FF5151")
+    table.add_column("mean", justify="right")
+    for stats in fixtures:
+        table.add_row(
+            stats.location,
+            stats.scope,
+            str(stats.setups),
+            format_seconds(stats.setup_ns / 1e9),
+            format_seconds(stats.teardown_ns / 1e9),
+            format_seconds(stats.total_ns / 1e9),
+            format_seconds(stats.mean_ns / 1e9),
+        )
+    return table
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+
+from rich.segment import Segment
+from rich.segment import Segments
+from rich.style import Style
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    import pytest
+    from rich.console import Console
+
+
+CHUNK_LINES: Final = 512
+GUIDE_STYLE: Final = Style.parse("#BBE9FF")
+NAME_STYLE: Final = Style.parse("i #BBE9FF")
+COUNT_STYLE: Final = Style.parse("dim")
+DOC_STYLE: Final = Style.parse("dim #BBE9FF")
+NODE_STYLES: Final = {
+    "Dir": Style.parse("#FFEEA9"),
+    "Package": Style.parse("#4CC9FE"),
+    "Module": Style.parse("#6FE6FC"),
+    "Class": Style.parse("#90D1CA"),
+    "Function": Style.parse("#4ED7F1"),
+}
+NEW_LINE: Final = Segment.line()
+GUIDES: Final = {
+    # -- (is last entry) -> (connector, continuation)
+    False: ("├── ", "│   "),
+    True: ("└── ", "    "),
+}
+
+NodeKind = Literal["Dir", "Package", "Module", "Class", "Function"]
+
+
+@dataclass(slots=True)
+class PlanNode:
+    """A collector of the execution plan, the items are only counted by their parent."""
+
+    kind: NodeKind
+    name: str
+    count: int = 0
+    """The number of items of the subtree."""
+    entries: int = 0
+    """The number of direct children written, collectors and items."""
+    children: list[PlanNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class _Frame:
+    node: PlanNode
+    last: bool = True
+    next_child: int = 0
+    written: int = 0
+
+
+def split_nodeid(nodeid: str) -> tuple[list[tuple[NodeKind, str]], str]:
+    """Returns the collectors and the name of an item, derived from its nodeid only."""
+    path, _, rest = nodeid.partition("::")
+    segments = [segment for segment in path.split("/") if segment not in ("..", ".", "")]
+    collectors: list[tuple[NodeKind, str]] = [("Dir", segment) for segment in segments[:-1]]
+    if not rest:
+        # -- a non python item, the file is the item itself
+        return collectors, segments[-1] if segments else path
+    names = rest.split("::")
+    collectors.append(("Module", segments[-1] if segments else path))
+    collectors.extend(("Class", name) for name in names[:-1])
+    return collectors, names[-1]
+
+
+class PlanTree:
+    """The collect-only execution plan, written line by line.
+
+    A first pass over the items builds a trie of the collectors with the number of items of each
+    subtree, the second pass writes the tree lines in chunks of segments, so neither the items
+    nor the lines are held in renderables. The collectors below ``max_depth`` are not stored,
+    they are counted by their ancestor. A collector seen again after other ones starts a new
+    branch, the plan follows the order the items run in.
+    """
+
+    def __init__(self, items: Sequence[pytest.Item], max_depth: int = 0) -> None:
+        self.items = items
+        self.max_depth = max_depth
+        self.root = PlanNode("Dir", "")
+        self._packages: dict[Path, bool] = {}
+        self._build()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} items={self.root.count} depth={self.max_depth}>"
+
+    def _depth(self, collectors: list[tuple[NodeKind, str]]) -> int:
+        if self.max_depth <= 0:
+            return len(collectors)
+        return min(len(collectors), self.max_depth)
+
+    def _shows_items(self, collectors: list[tuple[NodeKind, str]]) -> bool:
+        return self.max_depth <= 0 or len(collectors) < self.max_depth
+
+    def _build(self) -> None:
+        stack: list[PlanNode] = [self.root]
+        for item in self.items:
+            collectors, _ = split_nodeid(item.nodeid)
+            depth = self._depth(collectors)
+            self.root.count += 1
+            for level in range(1, depth + 1):
+                kind, name = collectors[level - 1]
+                if level < len(stack) and stack[level].name == name:
+                    node = stack[level]
+                else:
+                    if kind == "Dir" and self._is_package(item, collectors, level):
+                        kind = "Package"
+                    node = PlanNode(kind, name)
+                    stack[level - 1].children.append(node)
+                    stack[level - 1].entries += 1
+                    del stack[level:]
+                    stack.append(node)
+                node.count += 1
+            del stack[depth + 1 :]
+            if self._shows_items(collectors):
+                stack[depth].entries += 1
+        return None
+
+    def _is_package(
+        self, item: pytest.Item, collectors: list[tuple[NodeKind, str]], level: int
+    ) -> bool:
+        dirs = sum(1 for kind, _ in collectors if kind == "Dir")
+        try:
+            path = item.path.parents[dirs - level]
+        except IndexError:
+            return False
+        is_package = self._packages.get(path)
+        if is_package is None:
+            is_package = self._packages[path] = (path / "__init__.py").is_file()
+        return is_package
+
+    def lines(self) -> Iterator[list[Segment]]:
+        """Yields the segments of the tree lines in the order of the items, without new lines."""
+        stack: list[_Frame] = [_Frame(self.root)]
+        doc_obj: object = None
+        doc = ""
+        for item in self.items:
+            collectors, item_name = split_nodeid(item.nodeid)
+            depth = self._depth(collectors)
+            for level in range(1, depth + 1):
+                if level < len(stack) and stack[level].node.name == collectors[level - 1][1]:
+                    continue
+                del stack[level:]
+                parent = stack[-1]
+                node = parent.node.children[parent.next_child]
+                parent.next_child += 1
+                yield self._entry_line(stack, self._node_segments(node))
+                stack.append(_Frame(node, last=parent.written == parent.node.entries))
+            del stack[depth + 1 :]
+            if not self._shows_items(collectors):
+                continue
+
+            obj = getattr(item, "obj", None)
+            if obj is not doc_obj:
+                # -- the items of a parametrize family share the function and its docstring
+                doc_obj = obj
+                doc = (inspect.getdoc(obj) or "").partition("\n")[0] if obj is not None else ""
+            yield self._entry_line(stack, self._item_segments(item_name, doc))
+        return None
+
+    @staticmethod
+    def _entry_line(stack: list[_Frame], segments: list[Segment]) -> list[Segment]:
+        """Prefixes the guides of the entry, counted as written in its parent."""
+        parent = stack[-1]
+        parent.written += 1
+        if len(stack) == 1:
+            return segments
+        guides = "".join(GUIDES[frame.last][1] for frame in stack[2:])
+        connector = GUIDES[parent.written == parent.node.entries][0]
+        segments.insert(0, Segment(guides + connector, GUIDE_STYLE))
+        return segments
+
+    @staticmethod
+    def _node_segments(node: PlanNode) -> list[Segment]:
+        style = NODE_STYLES[node.kind]
+        return [
+            Segment(f"<{node.kind}: ", style),
+            Segment(node.name, NAME_STYLE),
+            Segment(">", style),
+            Segment(f" {node.count} {'item' if node.count == 1 else 'items'}", COUNT_STYLE),
+        ]
+
+    @staticmethod
+    def _item_segments(name: str, doc: str) -> list[Segment]:
+        style = NODE_STYLES["Function"]
+        segments = [Segment("<Function: ", style), Segment(name, NAME_STYLE), Segment(">", style)]
+        if doc:
+            segments.append(Segment(f"  {doc}", DOC_STYLE))
+        return segments
+
+    def stream(self, console: Console, indent: int = 3) -> None:
+        """Writes the plan to the console in chunks of lines."""
+        from rich.rule import Rule
+
+        console.print(Rule("Execution Plan", style="#578FCA", align="left"))
+        pad = Segment(" " * indent)
+        chunk: list[Segment] = []
+        lines = 0
+        for line in self.lines():
+            chunk.append(pad)
+            chunk.extend(line)
+            chunk.append(NEW_LINE)
+            lines += 1
+            if lines >= CHUNK_LINES:
+                console.print(Segments(chunk), crop=False, end="")
+                chunk, lines = [], 0
+        if chunk:
+            console.print(Segments(chunk), crop=False, end="")
+        return None
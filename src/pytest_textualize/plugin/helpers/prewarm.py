@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+    import pytest
+
+
+REWRITE_SIGNATURES: Final = {
+    "_rewrite_test": ("fn", "config"),
+    "_write_pyc": ("state", "co", "source_stat", "pyc"),
+}
+"""The private functions of pytest's assertion rewrite the prewarm calls, with their parameters."""
+
+
+@dataclass(slots=True)
+class PrewarmReport:
+    files: int = 0
+    compiled: int = 0
+    fresh: int = 0
+    """The files with an up-to-date pyc, not compiled again."""
+    failed: int = 0
+    cpu_seconds: float = 0.0
+    """The compile time of the workers, the time the collection would have spent compiling."""
+    wall_seconds: float = 0.0
+
+    @property
+    def saved(self) -> float:
+        return max(self.cpu_seconds - self.wall_seconds, 0.0)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "files": self.files,
+            "compiled": self.compiled,
+            "fresh": self.fresh,
+            "failed": self.failed,
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "wall_seconds": round(self.wall_seconds, 6),
+            "saved": round(self.saved, 6),
+        }
+
+
+def pyc_path(source: Path, rewrite: bool) -> Path:
+    """The pyc of a test file, in the assertion rewrite layout when pytest rewrites the asserts."""
+    if not rewrite:
+        return Path(importlib.util.cache_from_source(str(source)))
+    from _pytest.assertion.rewrite import PYC_TAIL
+    from _pytest.assertion.rewrite import get_cache_dir
+
+    return get_cache_dir(source) / (source.name[:-3] + PYC_TAIL)
+
+
+def is_fresh(source: Path, pyc: Path) -> bool:
+    """Checks the pyc header against the source, like the import system and pytest do."""
+    try:
+        stat = source.stat()
+        with open(pyc, "rb") as fp:
+            header = fp.read(16)
+    except OSError:
+        return False
+    return (
+        len(header) == 16
+        and header[:4] == importlib.util.MAGIC_NUMBER
+        and header[4:8] == b"\x00\x00\x00\x00"
+        and int.from_bytes(header[8:12], "little") == int(stat.st_mtime) & 0xFFFFFFFF
+        and int.from_bytes(header[12:16], "little") == stat.st_size & 0xFFFFFFFF
+    )
+
+
+@lru_cache(maxsize=None)
+def rewrite_supported() -> bool:
+    """Whether pytest's private rewrite functions still have the signatures of pytest 8.
+
+    The rewritten pycs are written with ``_rewrite_test`` and ``_write_pyc``, private functions
+    of pytest, called with a ``None`` config and a stand-in for the assertion state. With any
+    other pytest, the prewarm compiles the regular pycs instead.
+    """
+    import inspect
+
+    import pytest
+    from _pytest.assertion import rewrite
+
+    if pytest.version_tuple[0] != 8:
+        return False
+    try:
+        return all(
+            tuple(inspect.signature(getattr(rewrite, name)).parameters) == parameters
+            for name, parameters in REWRITE_SIGNATURES.items()
+        )
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+def write_rewritten_pyc(path: Path, pyc: Path) -> None:
+    """Rewrites the asserts of a test file and writes its pyc, like pytest's import hook.
+
+    The only use of pytest's private rewrite API, guarded by ``rewrite_supported``.
+    """
+    from types import SimpleNamespace
+
+    from _pytest.assertion.rewrite import _rewrite_test
+    from _pytest.assertion.rewrite import _write_pyc
+
+    # -- the config only enables the assertion pass hook, the state only traces the writes
+    source_stat, co = _rewrite_test(path, None)  # type: ignore[arg-type]
+    state = SimpleNamespace(trace=lambda message: None)
+    _write_pyc(state, co, source_stat, pyc)  # type: ignore[arg-type]
+    return None
+
+
+def compile_source(source: str, rewrite: bool) -> tuple[float, str | None]:
+    """Compiles a test file to its pyc, runs in the worker processes."""
+    start = time.perf_counter()
+    try:
+        if rewrite:
+            from _pytest.assertion.rewrite import try_makedirs
+
+            path = Path(source)
+            pyc = pyc_path(path, rewrite)
+            if not try_makedirs(pyc.parent):
+                return time.perf_counter() - start, f"read only directory: {pyc.parent}"
+            write_rewritten_pyc(path, pyc)
+        else:
+            import py_compile
+
+            py_compile.compile(source, doraise=True)
+    except Exception as exc:
+        # -- the collection reports the error when the module is imported
+        return time.perf_counter() - start, f"{exc.__class__.__name__}: {exc}"
+    return time.perf_counter() - start, None
+
+
+class BytecodePrewarmer:
+    """Compiles the test files and the conftests of the session to pyc in a process pool.
+
+    With the assertion rewriting the pycs are written in pytest's own layout, the
+    ``<name>.<tag>-pytest-<version>.pyc`` files the rewrite hook loads instead of rewriting the
+    module again, otherwise in the regular ``__pycache__`` layout. Only the files with a missing
+    or out of date pyc are compiled.
+    """
+
+    def __init__(self, config: pytest.Config, workers: int | None = None) -> None:
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        # -- without the private rewrite API of pytest 8, the regular pycs are compiled
+        self.rewrite = config.getoption("assertmode", "plain") == "rewrite" and rewrite_supported()
+        self.patterns: list[str] = config.getini("python_files")
+        self.norecursedirs: list[str] = config.getini("norecursedirs")
+        self.errors: dict[Path, str] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} workers={self.workers} rewrite={self.rewrite}>"
+
+    @property
+    def enabled(self) -> bool:
+        # -- the rewritten pycs do not record the assertion pass hook, pytest would reuse them
+        if self.rewrite and self.config.getini("enable_assertion_pass_hook"):
+            return False
+        return not sys.dont_write_bytecode
+
+    def roots(self) -> list[Path]:
+        """The paths of the command line, the rootpath without any."""
+        roots: list[Path] = []
+        invocation_dir = self.config.invocation_params.dir
+        for arg in self.config.args:
+            path = invocation_dir / arg.split("::")[0]
+            if path.exists():
+                roots.append(path.resolve())
+        return roots or [self.config.rootpath]
+
+    def is_test_file(self, path: Path) -> bool:
+        from _pytest.pathlib import fnmatch_ex
+
+        if path.name == "conftest.py":
+            return True
+        return any(fnmatch_ex(pattern, path) for pattern in self.patterns)
+
+    def find_sources(self) -> list[Path]:
+        import fnmatch
+
+        sources: dict[Path, None] = {}
+        for root in self.roots():
+            if root.is_file():
+                if root.suffix == ".py":
+                    sources[root] = None
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [
+                    name
+                    for name in dirnames
+                    if name != "__pycache__"
+                    and not any(fnmatch.fnmatch(name, pattern) for pattern in self.norecursedirs)
+                    and not os.path.exists(os.path.join(dirpath, name, "pyvenv.cfg"))
+                ]
+                for filename in filenames:
+                    path = Path(dirpath, filename)
+                    if filename.endswith(".py") and self.is_test_file(path):
+                        sources[path] = None
+        return list(sources)
+
+    def run(
+        self,
+        sources: Iterable[Path] | None = None,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> PrewarmReport:
+        start = time.perf_counter()
+        sources = self.find_sources() if sources is None else list(sources)
+        report = PrewarmReport(files=len(sources))
+        stale = [path for path in sources if not is_fresh(path, pyc_path(path, self.rewrite))]
+        report.fresh = len(sources) - len(stale)
+
+        for done, (path, (seconds, error)) in enumerate(zip(stale, self._compile(stale)), 1):
+            report.cpu_seconds += seconds
+            if error is None:
+                report.compiled += 1
+            else:
+                report.failed += 1
+                self.errors[path] = error
+            if progress is not None:
+                progress(done, len(stale))
+        report.wall_seconds = time.perf_counter() - start
+        return report
+
+    def _compile(self, stale: list[Path]) -> Iterable[tuple[float, str | None]]:
+        from itertools import repeat
+
+        workers = min(self.workers, len(stale))
+        if workers <= 1:
+            # -- a process pool costs more than compiling a single file
+            return map(compile_source, map(str, stale), repeat(self.rewrite))
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        def results() -> Iterable[tuple[float, str | None]]:
+            chunksize = max(1, len(stale) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(
+                    compile_source, map(str, stale), repeat(self.rewrite), chunksize=chunksize
+                )
+
+        return results()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    import pytest
+    from _pytest.nodes import Node
+
+
+ORDERS: Final = ("longest-first", "shortest-first", "failed-first")
+LASTFAILED_CACHE_KEY: Final = "cache/lastfailed"
+
+
+def higher_scope(item: pytest.Item) -> str | None:
+    """The widest scope of the parametrized fixtures of an item, above the function scope.
+
+    The scopes are those of the fixture definitions of the parameters, the direct
+    parametrizations have a definition of their scope there too. They are read from the private
+    ``_fixtureinfo`` of the item, which ties the scheduler to the fixture internals of pytest 8.
+    """
+    from _pytest.scope import Scope
+
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return None
+    name2fixturedefs = item._fixtureinfo.name2fixturedefs  # type: ignore[attr-defined]
+    scopes = [
+        scope
+        for scope in (Scope(name2fixturedefs[name][-1].scope) for name in callspec.params)
+        if scope is not Scope.Function
+    ]
+    return max(scopes).value if scopes else None
+
+
+class Block:
+    """A collector and the blocks or items below it, moved as a whole."""
+
+    __slots__ = ("children", "weight", "frozen", "_index")
+
+    def __init__(self) -> None:
+        self.children: list[Block | pytest.Item] = []
+        self.weight = 0.0
+        self.frozen = False
+        self._index: dict[Node, Block] = {}
+
+    def block(self, node: Node) -> Block:
+        block = self._index.get(node)
+        if block is None:
+            block = self._index[node] = Block()
+            self.children.append(block)
+        return block
+
+
+class ItemScheduler:
+    """Orders the items by weight without breaking the fixture scopes.
+
+    The items are arranged in the tree of their collectors, the packages, modules and classes
+    are ordered among their siblings by the weight of everything below them, so every scope
+    stays contiguous and its fixtures are set up once. The modules with fixtures parametrized
+    above the function scope keep the order pytest gave their items, and a session or package
+    scoped parametrization leaves the whole session untouched.
+    """
+
+    __slots__ = ("weight", "descending", "frozen")
+
+    def __init__(self, weight: Callable[[pytest.Item], float], descending: bool) -> None:
+        self.weight = weight
+        self.descending = descending
+        self.frozen: list[str] = []
+        """The modules left in their order, the first item when the session is."""
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} descending={self.descending} frozen={len(self.frozen)}>"
+
+    def order(self, items: Sequence[pytest.Item]) -> list[pytest.Item]:
+        import pytest
+
+        root = Block()
+        for item in items:
+            scope = higher_scope(item)
+            if scope in ("session", "package"):
+                self.frozen.append(item.nodeid)
+                return list(items)
+            block = root
+            for node in item.listchain()[1:-1]:
+                block = block.block(node)
+                if scope is not None and not block.frozen and isinstance(node, pytest.Module):
+                    # -- pytest groups the items of the module by parameter, across its classes
+                    block.frozen = True
+                    self.frozen.append(node.nodeid)
+            block.children.append(item)
+
+        position = {item: index for index, item in enumerate(items)}
+        ordered: list[pytest.Item] = []
+        self._weigh(root)
+        self._flatten(root, ordered, position)
+        return ordered
+
+    def _weigh(self, block: Block) -> float:
+        weight = 0.0
+        for child in block.children:
+            weight += self._weigh(child) if isinstance(child, Block) else self.weight(child)
+        block.weight = weight
+        return weight
+
+    def _flatten(
+        self, block: Block, ordered: list[pytest.Item], position: dict[pytest.Item, int]
+    ) -> None:
+        if block.frozen:
+            below: list[pytest.Item] = []
+            self._leaves(block, below)
+            ordered.extend(sorted(below, key=position.__getitem__))
+            return None
+        sign = -1.0 if self.descending else 1.0
+
+        def key(child: Block | pytest.Item) -> float:
+            return sign * (child.weight if isinstance(child, Block) else self.weight(child))
+
+        for child in sorted(block.children, key=key):
+            if isinstance(child, Block):
+                self._flatten(child, ordered, position)
+            else:
+                ordered.append(child)
+        return None
+
+    def _leaves(self, block: Block, leaves: list[pytest.Item]) -> None:
+        for child in block.children:
+            if isinstance(child, Block):
+                self._leaves(child, leaves)
+            else:
+                leaves.append(child)
+        return None
+
+
+def make_scheduler(
+    order: str, durations: Mapping[str, float], lastfailed: Mapping[str, object]
+) -> ItemScheduler:
+    """The scheduler of an order, the items without history weigh the mean known duration."""
+    default = sum(durations.values()) / len(durations) if durations else 0.0
+    if order == "failed-first":
+        return ItemScheduler(lambda item: 1.0 if item.nodeid in lastfailed else 0.0, True)
+    return ItemScheduler(lambda item: durations.get(item.nodeid, default), order == "longest-first")
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+    import pytest
+
+
+# -- the marks changing the outcome of the items, their arguments must be literals
+OUTCOME_MARKS: Final = frozenset({"skip", "skipif", "xfail", "parametrize", "usefixtures"})
+
+
+class NotStatic(Exception):
+    """The module cannot be collected without importing it."""
+
+
+@dataclass(slots=True)
+class MarkInfo:
+    name: str
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def to_decorator(self) -> pytest.MarkDecorator:
+        import pytest
+
+        decorator: pytest.MarkDecorator = getattr(pytest.mark, self.name)
+        return decorator.with_args(*self.args, **self.kwargs)
+
+
+@dataclass(slots=True)
+class FunctionInfo:
+    name: str
+    lineno: int
+    marks: list[MarkInfo] = field(default_factory=list)
+    """The decorator marks, the closest to the function first like ``pytestmark``."""
+
+
+@dataclass(slots=True)
+class ClassInfo:
+    name: str
+    lineno: int
+    marks: list[MarkInfo] = field(default_factory=list)
+    functions: list[FunctionInfo] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ModuleInfo:
+    marks: list[MarkInfo] = field(default_factory=list)
+    entries: list[FunctionInfo | ClassInfo] = field(default_factory=list)
+
+
+class _PytestNames:
+    """The names the module binds to pytest, ``pytest.mark`` and ``pytest.param``."""
+
+    def __init__(self) -> None:
+        self.modules: set[str] = set()
+        self.marks: set[str] = set()
+        self.params: set[str] = set()
+        self.fixtures: set[str] = set()
+
+    def add_import(self, node: ast.Import | ast.ImportFrom) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "pytest":
+                    self.modules.add(alias.asname or "pytest")
+            return None
+        if node.module != "pytest":
+            return None
+        for alias in node.names:
+            name = alias.asname or alias.name
+            {"mark": self.marks, "param": self.params, "fixture": self.fixtures}.get(
+                alias.name, set()
+            ).add(name)
+        return None
+
+    def is_attribute(self, node: ast.expr, attribute: str, names: set[str]) -> bool:
+        """``pytest.<attribute>`` or a name imported from pytest."""
+        if isinstance(node, ast.Name):
+            return node.id in names
+        return (
+            isinstance(node, ast.Attribute)
+            and node.attr == attribute
+            and isinstance(node.value, ast.Name)
+            and node.value.id in self.modules
+        )
+
+
+def literal(node: ast.expr, names: _PytestNames) -> Any:
+    """Evaluates a literal, ``pytest.param`` and ``range`` calls with literal arguments included."""
+    if isinstance(node, ast.Call) and names.is_attribute(node.func, "param", names.params):
+        import pytest
+
+        kwargs = {}
+        for keyword in node.keywords:
+            if keyword.arg != "id":
+                raise NotStatic(f"pytest.param with {keyword.arg}= at line {node.lineno}")
+            kwargs["id"] = literal(keyword.value, names)
+        return pytest.param(*(literal(arg, names) for arg in node.args), **kwargs)
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "range"
+        and not node.keywords
+    ):
+        # -- the argvalues written as a range of literal bounds
+        return list(range(*(literal(arg, names) for arg in node.args)))
+    if isinstance(node, (ast.List, ast.Tuple)):
+        values = [literal(element, names) for element in node.elts]
+        return values if isinstance(node, ast.List) else tuple(values)
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise NotStatic(f"not a literal at line {node.lineno}") from None
+
+
+def parse_mark(node: ast.expr, names: _PytestNames) -> MarkInfo:
+    """Parses ``pytest.mark.<name>`` with or without arguments, any other expression raises."""
+    call = node if isinstance(node, ast.Call) else None
+    target = call.func if call is not None else node
+    if not (
+        isinstance(target, ast.Attribute) and names.is_attribute(target.value, "mark", names.marks)
+    ):
+        raise NotStatic(f"decorator at line {node.lineno}")
+    if call is None:
+        return MarkInfo(target.attr)
+    if any(isinstance(arg, ast.Starred) for arg in call.args):
+        raise NotStatic(f"unpacked mark arguments at line {node.lineno}")
+    keywords: dict[str, ast.expr] = {}
+    for keyword in call.keywords:
+        if keyword.arg is None:
+            raise NotStatic(f"unpacked mark arguments at line {node.lineno}")
+        keywords[keyword.arg] = keyword.value
+    try:
+        args = tuple(literal(arg, names) for arg in call.args)
+        kwargs = {name: literal(value, names) for name, value in keywords.items()}
+    except NotStatic:
+        if target.attr in OUTCOME_MARKS:
+            raise
+        # -- the arguments of the other marks are not used by the collection
+        return MarkInfo(target.attr)
+    return MarkInfo(target.attr, args, kwargs)
+
+
+def parse_marks(node: ast.expr, names: _PytestNames) -> list[MarkInfo]:
+    """Parses a ``pytestmark`` value, a mark or a list of marks."""
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [parse_mark(element, names) for element in node.elts]
+    return [parse_mark(node, names)]
+
+
+def first_line(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> int:
+    """The first line of the definition, its decorators included like ``inspect``."""
+    return node.decorator_list[0].lineno if node.decorator_list else node.lineno
+
+
+def bound_names(node: ast.stmt) -> Iterable[tuple[str, int]]:
+    """The names bound by a statement and the statements nested in it."""
+    for child in ast.walk(node):
+        if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            yield child.name, child.lineno
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            for alias in child.names:
+                if alias.name == "*":
+                    raise NotStatic(f"star import at line {child.lineno}")
+                yield (alias.asname or alias.name).split(".")[0], child.lineno
+        elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            yield child.id, child.lineno
+
+
+class StaticAnalyzer:
+    """Finds the test functions and classes of a module from its source, without importing it.
+
+    The module is analysed only when its tests are all plain definitions, decorated with literal
+    ``pytest.mark`` marks. Anything that could add, remove or parametrize tests at import time,
+    like conditional definitions, imported tests, other decorators, base classes, fixture params
+    or ``pytest_generate_tests``, raises ``NotStatic``.
+    """
+
+    def __init__(
+        self, is_test_function: Callable[[str], bool], is_test_class: Callable[[str], bool]
+    ) -> None:
+        self.is_test_function = is_test_function
+        self.is_test_class = is_test_class
+
+    def is_test_name(self, name: str) -> bool:
+        return self.is_test_function(name) or self.is_test_class(name)
+
+    def analyse(self, source: str | bytes, filename: str = "<unknown>") -> ModuleInfo:
+        try:
+            tree = ast.parse(source, filename)
+        except (SyntaxError, ValueError) as exc:
+            raise NotStatic(f"cannot be parsed: {exc}") from None
+
+        names = _PytestNames()
+        info = ModuleInfo()
+        # -- the module namespace keeps the position of the first binding of a name
+        entries: dict[str, FunctionInfo | ClassInfo | None] = {}
+        for node in tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                names.add_import(node)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._check_function_definition(node, names)
+                is_test = self.is_test_function(node.name)
+                entries[node.name] = self._function(node, names) if is_test else None
+            elif isinstance(node, ast.ClassDef):
+                is_test = self.is_test_class(node.name)
+                entries[node.name] = self._class(node, names) if is_test else None
+            elif (
+                isinstance(node, (ast.Assign, ast.AnnAssign))
+                and node.value is not None
+                and self._is_pytestmark(node)
+            ):
+                info.marks = parse_marks(node.value, names)
+            else:
+                for name, lineno in bound_names(node):
+                    if name == "__test__" or self.is_test_name(name):
+                        raise NotStatic(f"{name} bound at line {lineno}")
+        info.entries = [entry for entry in entries.values() if entry is not None]
+        return info
+
+    @staticmethod
+    def _is_pytestmark(node: ast.Assign | ast.AnnAssign) -> bool:
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return (
+            len(targets) == 1 and isinstance(targets[0], ast.Name) and targets[0].id == "pytestmark"
+        )
+
+    def _check_function_definition(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, names: _PytestNames
+    ) -> None:
+        if node.name == "pytest_generate_tests":
+            raise NotStatic(f"pytest_generate_tests at line {node.lineno}")
+        for decorator in node.decorator_list:
+            target = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if not names.is_attribute(target, "fixture", names.fixtures):
+                continue
+            if isinstance(decorator, ast.Call) and any(
+                keyword.arg == "params" for keyword in decorator.keywords
+            ):
+                raise NotStatic(f"parametrized fixture {node.name} at line {node.lineno}")
+        return None
+
+    def _function(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, names: _PytestNames
+    ) -> FunctionInfo:
+        marks = [parse_mark(decorator, names) for decorator in node.decorator_list]
+        marks.reverse()
+        return FunctionInfo(node.name, first_line(node), marks)
+
+    def _class(self, node: ast.ClassDef, names: _PytestNames) -> ClassInfo:
+        if node.bases or node.keywords:
+            raise NotStatic(f"class {node.name} has bases at line {node.lineno}")
+        marks = [parse_mark(decorator, names) for decorator in node.decorator_list]
+        marks.reverse()
+        static_class = ClassInfo(node.name, first_line(node))
+        functions: dict[str, FunctionInfo | None] = {}
+        for child in node.body:
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if child.name in ("__init__", "__new__"):
+                    raise NotStatic(f"class {node.name} has a constructor")
+                self._check_function_definition(child, names)
+                is_test = self.is_test_function(child.name)
+                functions[child.name] = self._function(child, names) if is_test else None
+            elif (
+                isinstance(child, (ast.Assign, ast.AnnAssign))
+                and child.value is not None
+                and self._is_pytestmark(child)
+            ):
+                marks = parse_marks(child.value, names) + marks
+            else:
+                for name, lineno in bound_names(child):
+                    if name == "__test__" or self.is_test_name(name):
+                        raise NotStatic(f"{name} bound at line {lineno}")
+        static_class.marks = marks
+        static_class.functions = [entry for entry in functions.values() if entry is not None]
+        return static_class
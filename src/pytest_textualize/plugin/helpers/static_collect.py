@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_textualize.plugin.helpers.static_analysis import ClassInfo
+from pytest_textualize.plugin.helpers.static_analysis import NotStatic
+from pytest_textualize.plugin.helpers.static_analysis import StaticAnalyzer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from pytest_textualize.plugin.helpers.static_analysis import FunctionInfo
+    from pytest_textualize.plugin.helpers.static_analysis import MarkInfo
+    from pytest_textualize.plugin.helpers.static_analysis import ModuleInfo
+
+BUILTIN_GENERATE_TESTS: Final = frozenset({"_pytest.python", "_pytest.fixtures"})
+"""The modules of pytest's own ``pytest_generate_tests``, the parametrize marks and fixtures."""
+
+
+def _parametrize_args(
+    argnames: Any, argvalues: Any, indirect: Any = False, ids: Any = None, scope: Any = None
+) -> tuple[Any, Any, Any]:
+    return argnames, argvalues, ids
+
+
+class FunctionEntry(NamedTuple):
+    """A test function of the module and the names of its items."""
+
+    info: FunctionInfo
+    names: list[str]
+
+
+class ClassEntry(NamedTuple):
+    """A test class of the module and the names of the items of each of its functions."""
+
+    info: ClassInfo
+    names: list[list[str]]
+
+
+class StaticModule(pytest.Module):
+    """A test module collected from its source, the module is imported only when it cannot be
+    analysed statically, see ``StaticAnalyzer``."""
+
+    fallback: str | None = None
+    """The reason the module was imported, None when it was collected statically."""
+    collected: bool = False
+
+    def collect(self) -> Iterable[pytest.Item | pytest.Collector]:
+        self.collected = True
+        analyzer = StaticAnalyzer(self.funcnamefilter, self.classnamefilter)
+        try:
+            self._check_generate_tests()
+            self._check_fixtures()
+            info = analyzer.analyse(self.path.read_bytes(), str(self.path))
+            return self._collect_static(info)
+        except NotStatic as exc:
+            self.fallback = str(exc)
+            return super().collect()
+
+    def _check_generate_tests(self) -> None:
+        """A ``pytest_generate_tests`` of a conftest or a plugin may parametrize any test.
+
+        The one of the module itself is found by the analysis, the parametrized fixtures of
+        pytest's own implementation are checked by ``_check_fixtures``.
+        """
+        for hookimpl in self.ihook.pytest_generate_tests.get_hookimpls():
+            if hookimpl.function.__module__ not in BUILTIN_GENERATE_TESTS:
+                raise NotStatic(f"pytest_generate_tests of {hookimpl.plugin_name}")
+        return None
+
+    def _check_fixtures(self) -> None:
+        """The parametrized fixtures visible from the module multiply the items.
+
+        The fixtures requested by other fixtures or autouse are not known from the source, so any
+        parametrized fixture visible from the module falls back. They are read from the private
+        ``_arg2fixturedefs`` of the fixture manager, pytest has no public listing of the fixture
+        definitions, which ties the static collection to the fixture internals of pytest 8.
+        """
+        for name, fixturedefs in self.session._fixturemanager._arg2fixturedefs.items():
+            for fixturedef in fixturedefs:
+                if fixturedef.params is not None and self.nodeid.startswith(fixturedef.baseid):
+                    raise NotStatic(f"parametrized fixture {name}")
+        return None
+
+    def _collect_static(self, info: ModuleInfo) -> list[pytest.Item | pytest.Collector]:
+        # -- everything is computed before the nodes are created, the ids may still fall back
+        entries: list[FunctionEntry | ClassEntry] = []
+        for entry in info.entries:
+            if isinstance(entry, ClassInfo):
+                class_names = [
+                    self._item_names(function, entry.name, [*entry.marks, *info.marks])
+                    for function in entry.functions
+                ]
+                entries.append(ClassEntry(entry, class_names))
+            else:
+                entries.append(FunctionEntry(entry, self._item_names(entry, None, info.marks)))
+
+        for mark in info.marks:
+            self.add_marker(mark.to_decorator())
+        collected: list[pytest.Item | pytest.Collector] = []
+        for static_entry in entries:
+            if isinstance(static_entry, ClassEntry):
+                collected.append(
+                    StaticClass.from_parent(
+                        self,
+                        name=static_entry.info.name,
+                        static=static_entry.info,
+                        item_names=static_entry.names,
+                    )
+                )
+            else:
+                collected.extend(StaticFunction.create(self, static_entry.info, static_entry.names))
+        return collected
+
+    def _item_names(
+        self, function: FunctionInfo, class_name: str | None, parent_marks: list[MarkInfo]
+    ) -> list[str]:
+        """The names of the items of a function, one per parametrize combination."""
+        marks = [mark for mark in (*function.marks, *parent_marks) if mark.name == "parametrize"]
+        if not marks:
+            return [function.name]
+        nodeid = "::".join(filter(None, (self.nodeid, class_name, function.name)))
+        id_lists = [self._parametrize_ids(mark, function.name, nodeid) for mark in marks]
+        return [f"{function.name}[{'-'.join(ids)}]" for ids in itertools.product(*id_lists)]
+
+    def _parametrize_ids(self, mark: MarkInfo, func_name: str, nodeid: str) -> list[str]:
+        from _pytest.mark.structures import ParameterSet
+        from _pytest.python import IdMaker
+
+        try:
+            argnames, argvalues, ids = _parametrize_args(*mark.args, **mark.kwargs)
+        except TypeError:
+            raise NotStatic(f"invalid parametrize of {func_name}") from None
+        try:
+            argnames, parametersets = ParameterSet._for_parametrize(
+                argnames, argvalues, None, self.config, nodeid
+            )
+        except (pytest.fail.Exception, TypeError, ValueError):
+            raise NotStatic(f"invalid parametrize of {func_name}") from None
+        if any(parameterset.marks for parameterset in parametersets):
+            # -- the empty parameter set mark, argvalues computed at runtime
+            raise NotStatic(f"empty parametrize of {func_name}")
+        if ids is not None:
+            if not isinstance(ids, (list, tuple)) or len(ids) not in (0, len(parametersets)):
+                raise NotStatic(f"invalid parametrize ids of {func_name}")
+            ids = list(ids) or None
+        id_maker = IdMaker(
+            argnames, parametersets, None, ids, self.config, nodeid=nodeid, func_name=func_name
+        )
+        return [str(id_) for id_ in id_maker.make_unique_parameterset_ids()]
+
+
+class StaticClass(pytest.Class):
+    """A test class collected from the source of its module, the class object is never used."""
+
+    def __init__(self, *, static: ClassInfo, item_names: list[list[str]], **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.static = static
+        self.item_names = item_names
+
+    def collect(self) -> Iterable[pytest.Item | pytest.Collector]:
+        for mark in self.static.marks:
+            self.add_marker(mark.to_decorator())
+        collected: list[pytest.Item] = []
+        for function, names in zip(self.static.functions, self.item_names):
+            collected.extend(StaticFunction.create(self, function, names))
+        return collected
+
+
+class StaticFunction(pytest.Item):
+    """A test function found in the source of its module, for the collect-only runs."""
+
+    def __init__(self, *, originalname: str, lineno: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.originalname = originalname
+        self.lineno = lineno
+
+    @classmethod
+    def create(
+        cls, parent: pytest.Collector, function: FunctionInfo, names: list[str]
+    ) -> Iterable[StaticFunction]:
+        for name in names:
+            item = cls.from_parent(
+                parent, name=name, originalname=function.name, lineno=function.lineno
+            )
+            for mark in function.marks:
+                item.add_marker(mark.to_decorator())
+            yield item
+
+    def runtest(self) -> None:
+        raise RuntimeError(f"{self.nodeid} was collected statically, it can only be listed")
+
+    def reportinfo(self) -> tuple[Path, int, str]:
+        modpath = (
+            self.name
+            if not isinstance(self.parent, pytest.Class)
+            else (f"{self.parent.name}.{self.name}")
+        )
+        return self.path, self.lineno - 1, modpath
@@ -16,6 +16,9 @@ from pytest_textualize import Textualize
 
 # from pytest_textualize import TextualizeFactory
 from pytest_textualize import TextualizePlugins
+from pytest_textualize import Verbosity
+from pytest_textualize.plugin.helpers.collapse import DEFAULT_COLLAPSE_THRESHOLD
+from pytest_textualize.plugin.helpers.execution_dashboard import DEFAULT_FPS
 
 #
 # from pytest_textualize import get_bool_opt
@@ -25,6 +28,7 @@ from pytest_textualize import TextualizePlugins
 
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pytest_textualize.typist import TextualizeSettingsType
 
 PLUGIN_NAME = TextualizePlugins.PLUGIN
@@ -57,12 +61,217 @@ def pytest_addoption(parser: pytest.Parser, pluginmanager: pytest.PytestPluginMa
         default=True,
         help="Disable using RichHandler for python logging. Default to %(default)s",
     )
+    group.addoption(
+        "--textualize-async-output",
+        action="store_true",
+        dest="textualize_async_output",
+        default=False,
+        help="Render and write the console output on a background thread. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-headless",
+        action="store_true",
+        dest="textualize_headless",
+        default=False,
+        help="Discard the console output without rendering it, the results are still collected "
+        "for --textualize-record. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-renderer",
+        action="store",
+        dest="textualize_renderer",
+        choices=("auto", "rich", "plain"),
+        default="auto",
+        help="Renderer of the console output, 'auto' uses plain text when the output is not a "
+        "terminal. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-record",
+        action="store",
+        dest="textualize_record",
+        metavar="PATH",
+        default=None,
+        help="Record the session events into a JSONL log, rendered later with "
+        "'pytest-textualize replay PATH'. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-log-file",
+        action="store",
+        dest="textualize_log_file",
+        metavar="PATH",
+        default=None,
+        help="Mirror the verbose logger messages into a file. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-log-file-verbosity",
+        action="store",
+        dest="textualize_log_file_verbosity",
+        type=int,
+        choices=[int(v) for v in Verbosity],
+        default=int(Verbosity.DEBUG),
+        help="Verbosity of the messages written to the log file. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-html",
+        action="store",
+        dest="textualize_html",
+        metavar="PATH",
+        default=None,
+        help="Export the console output to an html file, written while the session runs. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-svg",
+        action="store",
+        dest="textualize_svg",
+        metavar="PATH",
+        default=None,
+        help="Export the console output to an svg file, written while the session runs. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-fps",
+        action="store",
+        dest="textualize_fps",
+        type=int,
+        default=DEFAULT_FPS,
+        help="Maximum redraws per second of the live execution dashboard, 0 disables it. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-collapse-threshold",
+        action="store",
+        dest="textualize_collapse_threshold",
+        type=int,
+        default=DEFAULT_COLLAPSE_THRESHOLD,
+        help="Number of items of a module or a parametrize family reported one by one at -v, "
+        "the following items collapse into one line, 0 disables it. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-plan-depth",
+        action="store",
+        dest="textualize_plan_depth",
+        type=int,
+        default=0,
+        help="Number of levels shown in the --collect-only execution plan, the items and "
+        "collectors below are counted by their ancestors, 0 shows every level. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-collect-profile",
+        action="store",
+        dest="textualize_collect_profile",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Show the N slowest modules, directories and conftests to collect, 0 disables it. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-collect-profile-json",
+        action="store",
+        dest="textualize_collect_profile_json",
+        metavar="PATH",
+        default=None,
+        help="Export the collection profile of every module, directory and conftest to a json "
+        "file. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-prewarm",
+        action="store_true",
+        dest="textualize_prewarm",
+        default=False,
+        help="Compile the test files and the conftests to bytecode in a process pool before the "
+        "collection, in the assertion rewrite layout when the asserts are rewritten.",
+    )
+    group.addoption(
+        "--textualize-static",
+        action="store_true",
+        dest="textualize_static",
+        default=False,
+        help="With --collect-only, find the tests in the source of the test modules instead of "
+        "importing them, the modules that cannot be analysed statically are imported.",
+    )
+    group.addoption(
+        "--textualize-plan",
+        action="store",
+        dest="textualize_plan",
+        metavar="PATH",
+        default=None,
+        help="Write the execution plan of the collected items to a json file, with their module, "
+        "markers, skip and xfail status and their duration in the previous runs. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-durations",
+        action="store",
+        dest="textualize_durations",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Show the N slowest setups, calls and teardowns, the duration percentiles of every "
+        "module and a histogram of the test durations, 0 disables it. Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-fixtures-profile",
+        action="store",
+        dest="textualize_fixtures_profile",
+        metavar="N",
+        type=int,
+        default=0,
+        help="Time the setup and the teardown of every fixture, show the N fixtures with the most "
+        "wall time and the expensive function scoped fixtures set up often, 0 disables it. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--textualize-order",
+        action="store",
+        dest="textualize_order",
+        choices=("longest-first", "shortest-first", "failed-first"),
+        default=None,
+        help="Reorder the items by their duration history or their last failures, the packages, "
+        "modules and classes are moved as a whole so their fixtures are set up once. "
+        "Default to %(default)s",
+    )
+    group.addoption(
+        "--no-duration-history",
+        action="store_false",
+        dest="textualize_duration_history",
+        default=True,
+        help="Do not record the durations of the passed tests in the pytest cache, nor compare "
+        "them to the previous runs.",
+    )
+    group.addoption(
+        "--textualize-regression-sigma",
+        action="store",
+        dest="textualize_regression_sigma",
+        metavar="K",
+        type=float,
+        default=3.0,
+        help="Report the tests slower than their duration history by more than K standard "
+        "deviations. Default to %(default)s",
+    )
     parser.addini("project_paths", type="paths", default=[], help="project paths")
     parser.addini(
         "env_file", type="string", default=str(TS_BASE_PATH / ".env"), help="the env file used"
     )
 
 
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_load_initial_conftests(early_config: pytest.Config) -> Generator[None, None, None]:
+    # -- the profile starts before the initial conftests are imported
+    from pytest_textualize.plugin.helpers.collect_profile import profile_requested
+
+    if profile_requested(early_config.known_args_namespace):
+        from pytest_textualize.plugin import collect_profile_key
+        from pytest_textualize.plugin.helpers.collect_profile import CollectProfile
+
+        profile = CollectProfile(early_config.rootpath)
+        profile.install(early_config.pluginmanager)
+        early_config.stash[collect_profile_key] = profile
+    return (yield)
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_configure(config: pytest.Config) -> None:
 
@@ -102,6 +311,22 @@ def pytest_configure(config: pytest.Config) -> None:
     assert config.stash.get(console_key, None) is not None
     assert config.stash.get(error_console_key, None) is not None
 
+    # -- the events recorder is available before the tracers configuration
+    if config.option.textualize_record:
+        from pytest_textualize.plugin import recorder_key
+        from pytest_textualize.textualize.events import EventRecorder
+
+        config.stash[recorder_key] = EventRecorder.open(config.option.textualize_record)
+
+    if config.option.textualize_log_file:
+        from pytest_textualize.factories.console_factory import ConsoleFactory
+
+        ConsoleFactory.console_log_file(
+            config,
+            config.option.textualize_log_file,
+            width=config.stash[console_key].width,
+        )
+
     # verbose_logger = textualize().verbose_logger(config)
     # verbose_logger.add_console("<stdout>", config.stash.get(console_key, None))
     # verbose_logger.add_console("<stderr>", config.stash.get(error_console_key, None))
@@ -124,11 +349,33 @@ def pytest_configure(config: pytest.Config) -> None:
 
 @pytest.hookimpl(trylast=True)
 def pytest_unconfigure(config: pytest.Config) -> None:
+    from pytest_textualize.plugin import export_key
+    from pytest_textualize.plugin import log_file_console_key
+    from pytest_textualize.plugin import recorder_key
     from pytest_textualize.plugin import settings_key
+    from pytest_textualize.plugin import writer_key
 
     if not config.getoption("--textualize", False, skip=True):
         return None
 
+    # -- drains the queued output and stops the background writer thread
+    if writer_key in config.stash:
+        config.stash[writer_key].close()
+        del config.stash[writer_key]
+
+    # -- after the writer is drained, every segment was streamed to the export files
+    if export_key in config.stash:
+        config.stash[export_key].close()
+        del config.stash[export_key]
+
+    if recorder_key in config.stash:
+        config.stash[recorder_key].close()
+        del config.stash[recorder_key]
+
+    if log_file_console_key in config.stash:
+        config.stash[log_file_console_key].file.close()
+        del config.stash[log_file_console_key]
+
     if settings_key in config.stash:
         del config.stash[settings_key]
 
@@ -6,12 +6,22 @@ import pytest
 
 
 from pytest_textualize import TextualizePlugins
+from pytest_textualize import Verbosity
 from pytest_textualize.plugin.base import BaseTextualizePlugin
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pytest_textualize.plugin.helpers.execution_dashboard import ExecutionDashboard
     from pytest_textualize.typist import TestRunResultsType
 
 
+def report_outcome(report: pytest.TestReport) -> str:
+    """The report outcome, telling apart the xfailed and xpassed tests."""
+    if hasattr(report, "wasxfail"):
+        return "xfailed" if report.skipped else "xpassed"
+    return report.outcome
+
+
 class RunTestTracer(BaseTextualizePlugin):
 
     name = TextualizePlugins.RUNTEST_TRACER
@@ -20,6 +30,7 @@ class RunTestTracer(BaseTextualizePlugin):
         self.results = results
         self.pluginmanager: pytest.PytestPluginManager | None = None
         self._started = False
+        self.dashboard: ExecutionDashboard | None = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} " f"name='{self.name}' " f"started={self._started!r}>"
@@ -28,3 +39,72 @@ class RunTestTracer(BaseTextualizePlugin):
     def pytest_configure(self, config: pytest.Config) -> None:
         super().configure(config)
         self.pluginmanager = config.pluginmanager
+
+    @property
+    def show_dashboard(self) -> bool:
+        assert self.config is not None and self.console is not None
+        fps = self.config.getoption("textualize_fps", 0, skip=True)
+        return (
+            fps > 0
+            and not self.headless
+            and self.verbosity == Verbosity.NORMAL
+            and self.console.is_terminal
+            and self.plain_renderer is None
+        )
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> Generator[None, object, object]:
+        from pytest_textualize.plugin import error_console_key
+        from pytest_textualize.plugin.helpers.execution_dashboard import ExecutionDashboard
+
+        if self.show_dashboard and session.items:
+            assert self.config is not None and self.console is not None
+            self.dashboard = ExecutionDashboard(
+                self.console,
+                len(session.items),
+                fps=self.config.option.textualize_fps,
+                error_console=self.config.stash.get(error_console_key, None),
+            )
+        try:
+            return (yield)
+        finally:
+            if self.dashboard is not None:
+                self.dashboard.finish()
+                self.dashboard = None
+
+    @pytest.hookimpl
+    def pytest_runtest_logstart(self, nodeid: str) -> None:
+        if self.dashboard is not None:
+            self.dashboard.test_started(nodeid)
+        return None
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        self._started = True
+        self.results.tests.record(
+            report.nodeid, report.when, report_outcome(report), report.duration
+        )
+        if self.dashboard is not None:
+            outcome: str | None = None
+            if report.when == "call":
+                outcome = report_outcome(report)
+            elif report.failed:
+                outcome = "error"
+            elif report.skipped:
+                outcome = report_outcome(report)
+            self.dashboard.test_phase(outcome, report.duration, report.when == "teardown")
+
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import RunTestReport
+
+            outcome, longrepr = report_outcome(report), None
+            if hasattr(report, "wasxfail"):
+                longrepr = report.wasxfail
+            elif report.failed:
+                longrepr = report.longreprtext
+            elif report.skipped and isinstance(report.longrepr, tuple):
+                longrepr = report.longrepr[2]
+            self.recorder.emit(
+                RunTestReport, report.nodeid, report.when, outcome, report.duration, longrepr
+            )
+        return None
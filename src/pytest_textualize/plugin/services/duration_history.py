@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_textualize import TextualizePlugins
+from pytest_textualize import Verbosity
+from pytest_textualize.plugin.base import BaseTextualizePlugin
+
+if TYPE_CHECKING:
+    from pytest_textualize.plugin.helpers.duration_history import DurationHistory
+
+
+class DurationHistoryService(BaseTextualizePlugin):
+    """Compares the test durations of the session to their history, then records them."""
+
+    name = TextualizePlugins.DURATION_HISTORY_SERVICE
+
+    def __init__(self, history: DurationHistory) -> None:
+        self.history = history
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}' history={self.history!r}>"
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_stats_summary(
+        self, config: pytest.Config, terminalreporter: pytest.TerminalReporter
+    ) -> None:
+        from pytest_textualize.plugin.helpers.duration_history import regressions_table
+
+        tests = getattr(terminalreporter, "results").tests
+        sigma = config.getoption("textualize_regression_sigma", 3.0, skip=True)
+        # -- the baseline excludes the durations of this session
+        regressions = self.history.regressions(tests, sigma)
+        self.history.record(tests)
+        self.history.save()
+        self.verbose_logger.debug(f"{self.history!r} saved, {len(regressions)} regressions")
+        if not regressions or self.headless or self.verbosity < Verbosity.NORMAL:
+            return None
+        self.console.rule("[#FF5151]DURATION REGRESSIONS[/]", characters="=", style="#FF5151")
+        self.console.print(regressions_table(regressions, sigma))
+        return None
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from _pytest.python import get_direct_param_fixture_func
+
+from pytest_textualize import TextualizePlugins
+from pytest_textualize import Verbosity
+from pytest_textualize.plugin.base import BaseTextualizePlugin
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_textualize.plugin.helpers.fixture_profile import FixtureProfile
+
+
+class FixtureProfilerService(BaseTextualizePlugin):
+    """Times the setup and the teardown of every fixture, then reports the most expensive."""
+
+    name = TextualizePlugins.FIXTURE_PROFILER_SERVICE
+
+    def __init__(self, profile: FixtureProfile, top: int) -> None:
+        self.profile = profile
+        self.top = top
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name='{self.name}' profile={self.profile!r}>"
+
+    @pytest.hookimpl
+    def pytest_configure(self, config: pytest.Config) -> None:
+        super().configure(config)
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_fixture_setup(
+        self, fixturedef: pytest.FixtureDef[object], request: pytest.FixtureRequest
+    ) -> Generator[None, object, object]:
+        if fixturedef.func is get_direct_param_fixture_func:
+            # -- the direct parametrization arguments are fixtures for pytest only
+            return (yield)
+        profile = self.profile
+        started = profile.setup_started()
+        try:
+            result = yield
+        finally:
+            profile.setup_finished(
+                fixturedef, fixturedef.argname, fixturedef.baseid, fixturedef.scope, started
+            )
+        # -- added after the teardown of the fixture, so it runs right before it
+        fixturedef.addfinalizer(lambda: profile.teardown_started(fixturedef))
+        return result
+
+    @pytest.hookimpl
+    def pytest_fixture_post_finalizer(
+        self, fixturedef: pytest.FixtureDef[object], request: pytest.FixtureRequest
+    ) -> None:
+        self.profile.teardown_finished(fixturedef)
+
+    @pytest.hookimpl
+    def pytest_stats_summary(
+        self, config: pytest.Config, terminalreporter: pytest.TerminalReporter
+    ) -> None:
+        self.verbose_logger.debug(f"{self.profile!r} summarized")
+        if not self.profile or self.headless or self.verbosity < Verbosity.NORMAL:
+            return None
+        self.console.rule("[#6FE6FC]FIXTURES PROFILE[/]", characters="=", style="#6FE6FC")
+        self.console.print(self.profile.renderable(self.top))
+        return None
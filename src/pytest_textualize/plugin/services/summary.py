@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from rich.console import Console
     from collections.abc import Generator
     from collections.abc import Callable
+    from pytest_textualize.plugin.helpers.duration_report import DurationAnalytics
     from pytest_textualize.typist import TestRunResultsType
     from pytest_textualize.typist import WarningReportType
 
@@ -28,6 +29,7 @@ class SummaryService(BaseTextualizePlugin):
 
     def __init__(self) -> None:
         self.results: TestRunResultsType | None = None
+        self.durations: DurationAnalytics | None = None
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} " f"name='{self.name}'>"
@@ -35,6 +37,17 @@ class SummaryService(BaseTextualizePlugin):
     @pytest.hookimpl(tryfirst=True)
     def pytest_configure(self, config: pytest.Config) -> None:
         super().configure(config)
+        top = config.getoption("textualize_durations", 0, skip=True)
+        if top > 0 and not config.getoption("collectonly"):
+            from pytest_textualize.plugin.helpers.duration_report import DurationAnalytics
+
+            self.durations = DurationAnalytics(top)
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if self.durations is not None:
+            self.durations.add(report.nodeid, report.when, report.duration)
+        return None
 
     @pytest.hookimpl
     def pytest_stats_summary(
@@ -52,6 +65,16 @@ class SummaryService(BaseTextualizePlugin):
 
         duration = f" in {fmt}"
         msg += duration
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import StatsSummary
+
+            self.recorder.emit(StatsSummary, msg)
+        if self.headless:
+            return None
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([plain_renderer.rule(msg)])
+            return None
         self.console.rule(msg, characters="=", style="#68D2E8")
         return None
 
@@ -63,6 +86,9 @@ class SummaryService(BaseTextualizePlugin):
         config: pytest.Config,
     ) -> Generator[None]:
         self.results = getattr(terminalreporter, "results")
+        if self.headless:
+            # -- nothing would be shown, the sections are not built
+            return (yield)
 
         hook, info, level = Textualize.hook_msg("pytest_terminal_summary", info=str(exitstatus))
         self.verbose_logger.log(hook, info, level_text=level, verbosity=Verbosity.VERBOSE)
@@ -78,6 +104,9 @@ class SummaryService(BaseTextualizePlugin):
         summary_passes()
         self.verbose_logger.debug("summarizing [pytest.xpassed]xpasses[/]")
         summary_xpasses()
+        if self.durations is not None:
+            self.verbose_logger.debug(f"summarizing durations {self.durations!r}")
+            summary_durations(self.durations, self.results, self.console)
         try:
             return (yield)
         finally:
@@ -93,14 +122,14 @@ def summary_errors(config: pytest.Config, results: TestRunResultsType, console:
 
         console.rule("[#FF5151]ERRORS SUMMARY[/]", characters="=", style="pytest.outcome.error")
         for name, err_info in results.collect.errors.items():
-            if err_info.report.when == "collect":
+            if err_info.when == "collect":
                 msg = "ERROR collecting " + name
             else:
                 msg = f"ERROR at {err_info.when} of {name}"
             console.rule(f"[#FF5151]{msg}[/]", characters="_", style="pytest.outcome.error")
             console.print(err_info.rich_report)
             # todo: should traceback print?
-            if config.option.showcapture == "no":
+            if config.option.showcapture == "no" or err_info.collect_report is None:
                 return None
             for section_name, content in err_info.collect_report.sections:
                 if (
@@ -172,6 +201,16 @@ def summary_warnings(
     return None
 
 
+def summary_durations(
+    durations: DurationAnalytics, results: TestRunResultsType, console: Console
+) -> None:
+    if not results.tests:
+        return None
+    console.rule("[#6FE6FC]DURATIONS[/]", characters="=", style="#6FE6FC")
+    console.print(Padding(durations.renderable(results.tests), (0, 0, 0, 1)))
+    return None
+
+
 def summary_passes():
     pass
 
@@ -188,7 +227,7 @@ def _build_summary_stats_line(collectonly: bool, results: TestRunResultsType) ->
     if collectonly:
         return _build_collect_only_summary_stats_line(results)
     else:
-        return _build_normal_summary_stats_line()
+        return _build_normal_summary_stats_line(results)
 
 
 def _build_collect_only_summary_stats_line(results: TestRunResultsType) -> list[str]:
@@ -222,5 +261,34 @@ def _build_collect_only_summary_stats_line(results: TestRunResultsType) -> list[
     return parts
 
 
-def _build_normal_summary_stats_line() -> list[str]:
-    pass
+def _build_normal_summary_stats_line(results: TestRunResultsType) -> list[str]:
+    from pytest_textualize.model import TestResult
+
+    counts = results.tests.counts()
+    errors = counts.get(TestResult.Error, 0) + results.collect.stats.total_errors
+    if errors:
+        counts[TestResult.Error] = errors
+    deselected = results.collect.stats.total_deselected
+    if deselected:
+        counts[TestResult.Deselected] = deselected
+    if not any(counts.get(outcome) for outcome in TestResult if outcome != TestResult.Unknown):
+        return ["[#FFCF50]no tests ran[/]"]
+
+    styles = {
+        TestResult.Failed: "#FF0000",
+        TestResult.Error: "#FF0000",
+        TestResult.Passed: "#A4B465",
+        TestResult.Skipped: "#FFCF50",
+        TestResult.XFailed: "#FFCF50",
+        TestResult.XPassed: "#FFCF50",
+        TestResult.Deselected: "#FFCF50",
+    }
+    from boltons.strutils import cardinalize
+
+    parts: list[str] = []
+    for outcome, style in styles.items():
+        number = counts.get(outcome, 0)
+        if number:
+            name = cardinalize(str(outcome), number) if outcome == TestResult.Error else outcome
+            parts.append(f"[{style}]{number} {name}[/]")
+    return parts
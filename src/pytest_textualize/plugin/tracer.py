@@ -41,7 +41,7 @@ class TextualizeTracer(BaseTextualizePlugin):
 
     @property
     def show_header(self) -> bool:
-        return self.verbosity >= Verbosity.NORMAL
+        return self.verbosity >= Verbosity.NORMAL and not self.headless
 
     @property
     def no_summary(self) -> bool:
@@ -91,6 +91,16 @@ class TextualizeTracer(BaseTextualizePlugin):
         self._start_time = start.to_time_string()
         self.results = TestRunResults(precise_start=precise_start, start=start)
         session.name = "pyest-textualize"
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import SessionStart
+
+            self.recorder.emit(
+                SessionStart,
+                self._start_time,
+                str(session.config.rootpath),
+                int(self.verbosity),
+                self.console.width,
+            )
 
         # -- registering the error observer plugin to report detailed errors asap
         error_tracer_plugin = ErrorExecutionTracer(self.results)
@@ -141,10 +151,79 @@ class TextualizeTracer(BaseTextualizePlugin):
             runtest_tracer = RunTestTracer(self.results)
             self.pluginmanager.register(runtest_tracer, runtest_tracer.name)
             self.cleanup_factory(runtest_tracer)
+            self.register_duration_history()
+            self.register_fixture_profiler()
+
+        for name in (
+            TextualizePlugins.COLLECTOR_TRACER,
+            TextualizePlugins.COLLECTOR_VERBOSE_TRACER,
+            TextualizePlugins.COLLECTOR_PROFILER,
+            TextualizePlugins.COLLECTOR_STATIC,
+            TextualizePlugins.COLLECTOR_SCHEDULER,
+        ):
+            plugin = session.config.pluginmanager.get_plugin(name)
+            if plugin:
+                session.config.pluginmanager.unregister(plugin, plugin.name)
+
+    def register_duration_history(self) -> None:
+        """Registers the duration history, unless disabled or without the cache provider."""
+        from pytest_textualize.plugin.helpers.duration_history import DurationHistory
+        from pytest_textualize.plugin.services.duration_history import DurationHistoryService
+
+        history = DurationHistory.from_config(self.config)
+        if history is None or self.pluginmanager.has_plugin(DurationHistoryService.name):
+            return None
+        service = DurationHistoryService(history)
+        self.pluginmanager.register(service, service.name)
+        self.cleanup_factory(service)
+        return None
+
+    def register_fixture_profiler(self) -> None:
+        """Registers the fixture profiler when ``--textualize-fixtures-profile`` is set."""
+        from pytest_textualize.plugin.helpers.fixture_profile import FixtureProfile
+        from pytest_textualize.plugin.services.fixture_profile import FixtureProfilerService
+
+        top = self.config.getoption("textualize_fixtures_profile", 0, skip=True)
+        if not top or self.pluginmanager.has_plugin(FixtureProfilerService.name):
+            return None
+        service = FixtureProfilerService(FixtureProfile(), top)
+        self.pluginmanager.register(service, service.name)
+        self.cleanup_factory(service)
+        return None
+
+    def flush_writer(self) -> None:
+        """Blocks until the background writer of ``--textualize-async-output`` wrote its queue."""
+        from pytest_textualize.plugin import writer_key
+
+        writer = self.config.stash.get(writer_key, None)
+        if writer is not None:
+            writer.flush()
+        return None
 
-        plugin = session.config.pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_TRACER)
-        if plugin:
-            session.config.pluginmanager.unregister(plugin, plugin.name)
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_keyboard_interrupt(self) -> None:
+        # -- the queued output was produced before the interruption, write it before anything else
+        self.flush_writer()
+
+    # -- the writer thread writes to the sys.stdout of the moment, the queued output is written
+    # -- before the capture of the test phase resumes, or the tests would capture it
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_setup(self, item: pytest.Item) -> Generator[None]:
+        self.flush_writer()
+        return (yield)
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Generator[None]:
+        self.flush_writer()
+        return (yield)
+
+    @pytest.hookimpl(wrapper=True, tryfirst=True)
+    def pytest_runtest_teardown(
+        self, item: pytest.Item, nextitem: pytest.Item | None
+    ) -> Generator[None]:
+        self.flush_writer()
+        return (yield)
 
     @pytest.hookimpl
     def pytest_unconfigure(self, config: pytest.Config) -> None:
@@ -157,12 +236,34 @@ class TextualizeTracer(BaseTextualizePlugin):
         self, session: pytest.Session, exitstatus: int | pytest.ExitCode
     ) -> Generator[None]:
 
-        if not self.collectonly:
+        if not self.collectonly and self.verbose_logger.wants(Verbosity.VERBOSE):
             msg, info, level = Textualize.hook_msg("pytest_sessionfinish", info=repr(exitstatus))
             self.verbose_logger.log(msg, info, level_text=level, verbosity=Verbosity.VERBOSE)
 
         result = yield
 
+        if not self.headless:
+            self.report_session_end(session, exitstatus)
+
+        self.results.precise_finish = time.perf_counter()
+        self.results.finish = DateTime.now()
+        self.config.hook.pytest_stats_summary(config=self.config, terminalreporter=self)
+        if self.recorder is not None:
+            from pytest_textualize.textualize.events import SessionFinish
+
+            self.recorder.emit(
+                SessionFinish, self.results.finish.to_time_string(), int(session.exitstatus)
+            )
+        if not self.collectonly and not self.headless:
+            Textualize.stage_rule(
+                self.console, "session", time_str=self.results.finish.to_time_string(), start=False
+            )
+
+        return result
+
+    def report_session_end(
+        self, session: pytest.Session, exitstatus: int | pytest.ExitCode
+    ) -> None:
         summary_exit_codes = (
             pytest.ExitCode.OK,
             pytest.ExitCode.TESTS_FAILED,
@@ -183,13 +284,4 @@ class TextualizeTracer(BaseTextualizePlugin):
             error_tracer.keyboard_interrupt_memo = None
         elif session.shouldstop:
             self.console.rule(str(session.shouldstop), characters="!", style="bright_red")
-
-        self.results.precise_finish = time.perf_counter()
-        self.results.finish = DateTime.now()
-        self.config.hook.pytest_stats_summary(config=self.config, terminalreporter=self)
-        if not self.collectonly:
-            Textualize.stage_rule(
-                self.console, "session", time_str=self.results.finish.to_time_string(), start=False
-            )
-
-        return result
+        return None
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated
 from typing import Optional
 from typing import TYPE_CHECKING
 
-from pydantic import StringConstraints
-from pydantic import TypeAdapter
 from rich import box
 from rich.padding import Padding
 from rich.table import Column
@@ -13,9 +10,15 @@ from rich.table import Table
 from rich.text import Text
 
 from pytest_textualize.factories.theme_factory import ThemeFactory
+from pytest_textualize.textualize.templates import KEY_VALUE_KEY
+from pytest_textualize.textualize.templates import KEY_VALUE_LEVEL
+from pytest_textualize.textualize.templates import is_markup
+from pytest_textualize.textualize.templates import single_char_adapter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Sequence
+    from rich.console import Console
     from rich.text import TextType
     from rich.style import StyleType
     from rich.console import ConsoleRenderable
@@ -23,13 +26,6 @@ if TYPE_CHECKING:
     from pytest_textualize.typist import TextAlias
 
 
-def is_markup(string: str) -> bool:
-    if string:
-        text = Text.from_markup(string)
-        return len(text.spans) > 0
-    return False
-
-
 class KeyValueMessage:
     def __init__(
         self,
@@ -49,17 +45,14 @@ class KeyValueMessage:
         self.value = key_value
         self.highlight = highlight
 
-        validator = Annotated[
-            str, StringConstraints(strip_whitespace=True, min_length=1, max_length=1)
-        ]
-        self.level = TypeAdapter(validator).validate_python(level)
-        self.kv_separator = TypeAdapter(validator).validate_python(kv_separator)
+        self.level = single_char_adapter.validate_python(level)
+        self.kv_separator = single_char_adapter.validate_python(kv_separator)
 
     def __call__(self) -> tuple[TextAlias, TextAlias, TextAlias]:
         value = Text()
 
-        level = Text(self.level.rjust(9), style="#B0D9B1")
-        key = Text(self.key_name.ljust(20), style="#CBFFA9").append(self.kv_separator, style="none")
+        level = KEY_VALUE_LEVEL.render(level=self.level)
+        key = KEY_VALUE_KEY.render(key=self.key_name, separator=self.kv_separator)
 
         if isinstance(self.value, str):
             if is_markup(self.value):
@@ -92,3 +85,14 @@ def key_value_scope(items: Iterable[tuple[str, RenderableType]]) -> RenderableTy
 
         table.add_row(f" - {k}", v)
     return Padding(table, (0, 0, 0, 6))
+
+
+def print_key_values(console: Console, items: Sequence[tuple[str, RenderableType]]) -> None:
+    from pytest_textualize.textualize.plain import PlainRenderer
+
+    plain_renderer = PlainRenderer.from_console(console)
+    if plain_renderer is not None:
+        plain_renderer.write_lines(plain_renderer.key_values(items))
+    else:
+        console.print(key_value_scope(items))
+    return None
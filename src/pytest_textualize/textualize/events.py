@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from rich.markup import escape
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from typing import TextIO
+
+
+EVENTS_FORMAT: Final = "textualize-events"
+EVENTS_VERSION: Final = 1
+
+
+class SessionStart(NamedTuple):
+    t: float
+    time_str: str
+    rootdir: str
+    verbosity: int
+    width: int
+
+
+class LogMessage(NamedTuple):
+    t: float
+    verbosity: int
+    level: int
+    level_text: str | None
+    filename: str
+    line_no: int
+    renderables: list[str]
+    style: str | None
+
+
+class CollectStart(NamedTuple):
+    t: float
+    time_str: str
+
+
+class ItemCollected(NamedTuple):
+    t: float
+    nodeid: str
+    markers: list[str]
+    skip_reason: str | None
+    xfail: tuple[str, bool, bool, str | None] | None
+
+
+class CollectError(NamedTuple):
+    t: float
+    nodeid: str
+    longrepr: str
+
+
+class CollectFinish(NamedTuple):
+    t: float
+    time_str: str
+    collected: int
+    errors: int
+    deselected: int
+    skipped: int
+    xfailed: int
+
+
+class RunTestReport(NamedTuple):
+    t: float
+    nodeid: str
+    when: str
+    outcome: str
+    duration: float
+    longrepr: str | None
+
+
+class WarningRecorded(NamedTuple):
+    t: float
+    nodeid: str
+    category: str
+    message: str
+    filename: str
+    lineno: int
+
+
+class StatsSummary(NamedTuple):
+    t: float
+    message: str
+
+
+class SessionFinish(NamedTuple):
+    t: float
+    time_str: str
+    exitstatus: int
+
+
+type Event = (
+    SessionStart
+    | LogMessage
+    | CollectStart
+    | ItemCollected
+    | CollectError
+    | CollectFinish
+    | RunTestReport
+    | WarningRecorded
+    | StatsSummary
+    | SessionFinish
+)
+
+EVENT_KINDS: Final[dict[type[Event], str]] = {
+    SessionStart: "session_start",
+    LogMessage: "log",
+    CollectStart: "collect_start",
+    ItemCollected: "item",
+    CollectError: "collect_error",
+    CollectFinish: "collect_finish",
+    RunTestReport: "report",
+    WarningRecorded: "warning",
+    StatsSummary: "summary",
+    SessionFinish: "session_finish",
+}
+"""The kind of every event, the first field of its line in the log."""
+EVENT_TYPES: Final[dict[str, type[Event]]] = {kind: cls for cls, kind in EVENT_KINDS.items()}
+
+
+def markup(renderable: object) -> str:
+    """Returns the console markup of a renderable, other objects are escaped by their str."""
+    if isinstance(renderable, str):
+        return renderable
+    if isinstance(renderable, Text):
+        return renderable.markup
+    return escape(str(renderable))
+
+
+def encode(event: Event) -> str:
+    return json.dumps([EVENT_KINDS[type(event)], *event], separators=(",", ":"), default=str)
+
+
+def decode(line: str) -> Event:
+    kind, *fields = json.loads(line)
+    try:
+        event_cls = EVENT_TYPES[kind]
+    except KeyError:
+        raise ValueError(f"Unknown event kind {kind!r}") from None
+    return event_cls(*fields)
+
+
+class EventRecorder:
+    """Append-only writer of the session events, one compact JSON array per line.
+
+    Every line is ``[kind, t, *fields]``, where ``t`` is the number of seconds since the recorder
+    was opened. The first line is the ``[format, version]`` header.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self._file = file
+        self._start = time.perf_counter()
+        self._file.write(json.dumps([EVENTS_FORMAT, EVENTS_VERSION]) + "\n")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} file='{getattr(self._file, "name", "<?>")}'>"
+
+    @classmethod
+    def open(cls, path: str | Path) -> EventRecorder:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return cls(path.open("w", encoding="utf-8"))
+
+    @property
+    def is_closed(self) -> bool:
+        return self._file.closed
+
+    def emit(self, event_cls: type[Event], *fields: Any) -> None:
+        if self._file.closed:
+            return None
+        t = round(time.perf_counter() - self._start, 6)
+        self._file.write(encode(event_cls(t, *fields)) + "\n")
+        return None
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        return None
+
+
+def read_events(path: str | Path) -> Iterator[Event]:
+    with Path(path).open(encoding="utf-8") as file:
+        yield from iter_events(file)
+
+
+def iter_events(lines: Iterable[str]) -> Iterator[Event]:
+    lines = iter(lines)
+    header = json.loads(next(lines, "null"))
+    if not isinstance(header, list) or header[:1] != [EVENTS_FORMAT]:
+        raise ValueError("Not a pytest-textualize events log")
+    if header[1] > EVENTS_VERSION:
+        raise ValueError(f"Unsupported events log version {header[1]}")
+    for line in lines:
+        if line.strip():
+            yield decode(line)
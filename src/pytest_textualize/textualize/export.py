@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import zlib
+from abc import ABC
+from abc import abstractmethod
+from html import escape
+from math import ceil
+from pathlib import Path
+from typing import Final
+from typing import TYPE_CHECKING
+
+from rich._export_format import CONSOLE_HTML_FORMAT
+from rich._export_format import CONSOLE_SVG_FORMAT
+from rich.cells import cell_len
+from rich.color import blend_rgb
+from rich.segment import ControlType
+from rich.segment import Segment
+from rich.style import Style
+from rich.terminal_theme import DEFAULT_TERMINAL_THEME
+from rich.terminal_theme import SVG_EXPORT_THEME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import TextIO
+    from rich.console import Console
+    from rich.terminal_theme import TerminalTheme
+
+
+CHUNK_SIZE: Final = 64 * 1024
+# -- the controls that redraw the current line, the text written on it so far is discarded
+LINE_RESETS: Final = frozenset({ControlType.ERASE_IN_LINE, ControlType.CARRIAGE_RETURN})
+
+
+class StreamingExporter(ABC):
+    """Converts the recorded segments to an export format and writes them to disk in chunks."""
+
+    def __init__(self, path: str | Path, theme: TerminalTheme) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.theme = theme
+        self._fragments: list[str] = []
+        self._size = 0
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path='{self.path}' closed={self._closed!r}>"
+
+    @property
+    @abstractmethod
+    def file(self) -> TextIO:
+        raise NotImplementedError
+
+    def append(self, fragment: str) -> None:
+        self._fragments.append(fragment)
+        self._size += len(fragment)
+        if self._size >= CHUNK_SIZE:
+            self.flush()
+        return None
+
+    def flush(self) -> None:
+        if self._fragments:
+            self.file.write("".join(self._fragments))
+            self._fragments.clear()
+            self._size = 0
+        return None
+
+    @abstractmethod
+    def write(self, segments: Iterable[Segment]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def finalize(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self._closed:
+            return None
+        self._closed = True
+        self.flush()
+        self.finalize()
+        return None
+
+
+class HtmlStreamExporter(StreamingExporter):
+    """Streams the console output as the rich html export.
+
+    The stylesheet is known only when the session ends, it is written in a second style element
+    after the code block.
+    """
+
+    def __init__(self, path: str | Path, theme: TerminalTheme = DEFAULT_TERMINAL_THEME) -> None:
+        super().__init__(path, theme)
+        head, _, self._tail = CONSOLE_HTML_FORMAT.partition("{code}")
+        self._styles: dict[str, int] = {}
+        self._file = self.path.open("w", encoding="utf-8")
+        self._file.write(
+            head.format(
+                stylesheet="",
+                foreground=theme.foreground_color.hex,
+                background=theme.background_color.hex,
+            )
+        )
+
+    @property
+    def file(self) -> TextIO:
+        return self._file
+
+    def write(self, segments: Iterable[Segment]) -> None:
+        styles = self._styles
+        for text, style, _ in Segment.filter_control(Segment.simplify(segments)):
+            text = escape(text)
+            if style:
+                rule = style.get_html_style(self.theme)
+                style_number = styles.setdefault(rule, len(styles) + 1)
+                if style.link:
+                    text = f'<a class="r{style_number}" href="{style.link}">{text}</a>'
+                else:
+                    text = f'<span class="r{style_number}">{text}</span>'
+            self.append(text)
+        return None
+
+    def finalize(self) -> None:
+        rules = "\n".join(
+            f".r{style_number} {{{rule}}}" for rule, style_number in self._styles.items() if rule
+        )
+        code_end, _, tail = self._tail.partition("\n")
+        self._file.write(f"{code_end}\n<style>\n{rules}\n</style>\n")
+        self._file.write(tail.replace("{{", "{").replace("}}", "}"))
+        self._file.close()
+        return None
+
+
+class SvgStreamExporter(StreamingExporter):
+    """Streams the console output as the rich svg export.
+
+    The svg header requires the number of lines, the text matrix is written to a ``.part`` file
+    and prefixed by the header when the session ends.
+    """
+
+    char_height: Final = 20
+    line_height: Final = char_height * 1.22
+    padding: Final = (40, 8, 8, 8)
+
+    def __init__(
+        self,
+        path: str | Path,
+        width: int,
+        theme: TerminalTheme = SVG_EXPORT_THEME,
+        title: str = "pytest-textualize",
+        font_aspect_ratio: float = 0.61,
+    ) -> None:
+        super().__init__(path, theme)
+        self.width = width
+        self.title = title
+        self.char_width = self.char_height * font_aspect_ratio
+        self.unique_id = f"terminal-{zlib.adler32(f"{title}{self.path}".encode())}"
+        self._part_path = self.path.with_name(f"{self.path.name}.part")
+        self._file = self._part_path.open("w", encoding="utf-8")
+        self._classes: dict[str, int] = {}
+        self._style_cache: dict[Style, str] = {}
+        self._x = 0
+        self._y = 0
+
+    @property
+    def file(self) -> TextIO:
+        return self._file
+
+    def _svg_style(self, style: Style) -> str:
+        if style in self._style_cache:
+            return self._style_cache[style]
+        theme = self.theme
+        color = (
+            theme.foreground_color
+            if (style.color is None or style.color.is_default)
+            else style.color.get_truecolor(theme)
+        )
+        bgcolor = (
+            theme.background_color
+            if (style.bgcolor is None or style.bgcolor.is_default)
+            else style.bgcolor.get_truecolor(theme)
+        )
+        if style.reverse:
+            color, bgcolor = bgcolor, color
+        if style.dim:
+            color = blend_rgb(color, bgcolor, 0.4)
+        css_rules = [f"fill: {color.hex}"]
+        if style.bold:
+            css_rules.append("font-weight: bold")
+        if style.italic:
+            css_rules.append("font-style: italic;")
+        if style.underline:
+            css_rules.append("text-decoration: underline;")
+        if style.strike:
+            css_rules.append("text-decoration: line-through;")
+        css = self._style_cache[style] = ";".join(css_rules)
+        return css
+
+    def _write_text(self, text: str, style: Style) -> None:
+        x, y = self._x * self.char_width, self._y * self.line_height
+        length = cell_len(text)
+        bgcolor = style.bgcolor
+        if style.reverse or (bgcolor is not None and not bgcolor.is_default):
+            # -- a reversed style is drawn on its foreground, the theme one without a color
+            color = style.color if style.reverse else bgcolor
+            background = (
+                self.theme.foreground_color if color is None else color.get_truecolor(self.theme)
+            )
+            self.append(
+                f'<rect fill="{background.hex}" x="{x:g}" y="{y + 1.5:g}" '
+                f'width="{self.char_width * length:g}" height="{self.line_height + 0.25:g}" '
+                f'shape-rendering="crispEdges"/>'
+            )
+        if text.strip(" "):
+            class_number = self._classes.setdefault(self._svg_style(style), len(self._classes) + 1)
+            self.append(
+                f'<text class="{self.unique_id}-r{class_number}" x="{x:g}" '
+                f'y="{y + self.char_height:g}" textLength="{self.char_width * len(text):g}">'
+                f"{escape(text).replace(" ", "&#160;")}</text>"
+            )
+        self._x += length
+        return None
+
+    def write(self, segments: Iterable[Segment]) -> None:
+        for text, style, _ in Segment.filter_control(segments):
+            style = style or Style()
+            lines = text.split("\n")
+            for line_no, line in enumerate(lines):
+                if line_no:
+                    self._x = 0
+                    self._y += 1
+                if line and self._x < self.width:
+                    self._write_text(line, style)
+        return None
+
+    def finalize(self) -> None:
+        self._file.close()
+        theme = self.theme
+        padding_top, padding_right, padding_bottom, padding_left = self.padding
+        lines = self._y + (1 if self._x else 0)
+        terminal_width = ceil(self.width * self.char_width + padding_left + padding_right)
+        terminal_height = lines * self.line_height + padding_top + padding_bottom
+        chrome = (
+            f'<rect fill="{theme.background_color.hex}" stroke="rgba(255,255,255,0.35)" '
+            f'stroke-width="1" x="1" y="1" width="{terminal_width}" height="{terminal_height:g}" '
+            f'rx="8"/>'
+            f'<text class="{self.unique_id}-title" fill="{theme.foreground_color.hex}" '
+            f'text-anchor="middle" x="{terminal_width // 2}" y="{self.char_height + 7}">'
+            f"{escape(self.title)}</text>"
+            '<g transform="translate(26,22)">'
+            '<circle cx="0" cy="0" r="7" fill="#ff5f57"/>'
+            '<circle cx="22" cy="0" r="7" fill="#febc2e"/>'
+            '<circle cx="44" cy="0" r="7" fill="#28c840"/>'
+            "</g>"
+        )
+        styles = "\n".join(
+            f".{self.unique_id}-r{number} {{ {css} }}" for css, number in self._classes.items()
+        )
+        head, _, tail = CONSOLE_SVG_FORMAT.partition("{matrix}")
+        values = dict(
+            unique_id=self.unique_id,
+            char_width=self.char_width,
+            char_height=self.char_height,
+            line_height=self.line_height,
+            terminal_width=self.char_width * self.width - 1,
+            terminal_height=(lines + 1) * self.line_height - 1,
+            width=terminal_width + 2,
+            height=terminal_height + 2,
+            terminal_x=1 + padding_left,
+            terminal_y=1 + padding_top,
+            styles=styles,
+            chrome=chrome,
+            backgrounds="",
+            lines="",
+        )
+        with self.path.open("w", encoding="utf-8") as file:
+            file.write(head.format(**values))
+            with self._part_path.open(encoding="utf-8") as part:
+                shutil.copyfileobj(part, file, CHUNK_SIZE)
+            file.write(tail.format(**values))
+        os.remove(self._part_path)
+        return None
+
+
+class StreamingRecordBuffer(list[Segment]):
+    """Replaces the record buffer of a console, streams the segments instead of keeping them.
+
+    Rich extends the record buffer with every segment written to the console, this buffer
+    forwards them to the exporters and stays empty, so the memory is flat however long the
+    session is. The buffer can be shared by several consoles.
+
+    The segments of the current line are held until the line ends. A line erased or returned
+    to its start, as the frames of the live dashboard are, is dropped, so the export has the
+    final state of every line and the held segments never exceed one line.
+    """
+
+    def __init__(self, exporters: Iterable[StreamingExporter]) -> None:
+        super().__init__()
+        self.exporters = list(exporters)
+        self._line: list[Segment] = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} exporters={self.exporters!r}>"
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        with self._lock:
+            line = self._line
+            lines: list[Segment] = []
+            for segment in segments:
+                if segment.control:
+                    if any(control[0] in LINE_RESETS for control in segment.control):
+                        line.clear()
+                    continue
+                text = segment.text
+                if "\n" not in text:
+                    line.append(segment)
+                    continue
+                ended, _, rest = text.rpartition("\n")
+                lines.extend(line)
+                lines.append(Segment(f"{ended}\n", segment.style))
+                line.clear()
+                if rest:
+                    line.append(Segment(rest, segment.style))
+            if lines:
+                for exporter in self.exporters:
+                    exporter.write(lines)
+        return None
+
+    def attach(self, console: Console) -> Console:
+        console.record = True
+        setattr(console, "_record_buffer", self)
+        return console
+
+    def close(self) -> None:
+        with self._lock:
+            for exporter in self.exporters:
+                if self._line:
+                    exporter.write(self._line)
+                exporter.close()
+            self._line.clear()
+        return None
@@ -25,7 +25,6 @@ from pydantic_core import PydanticCustomError
 from rich._log_render import LogRender
 
 # noinspection PyProtectedMember
-from rich._null_file import NullFile
 from rich.logging import RichHandler
 from rich.segment import Segment
 from rich.styled import Styled
@@ -53,6 +52,7 @@ if TYPE_CHECKING:
     from rich.console import JustifyMethod
     from rich.console import RenderableType
     from rich.console import ConsoleRenderable
+    from pytest_textualize.textualize.events import EventRecorder
 
 
 class TextualizeHandler(RichHandler):
@@ -62,8 +62,9 @@ class TextualizeHandler(RichHandler):
         super().__init__(level, console, **kwargs)
 
     def emit(self, record: logging.LogRecord) -> None:
+        from pytest_textualize import Textualize
 
-        if isinstance(self.console.file, NullFile):
+        if Textualize.is_null_console(self.console):
             return None
 
         message = self.format(record)
@@ -274,9 +275,18 @@ class VerboseLogRecord(NamedTuple):
     exc_info: ExcInfoType
     justify: JustifyMethod
     locals: DictStrAny
+    verbosity: Verbosity = Verbosity.NORMAL
 
 
 VerboseLogRecord.__doc__ = "Stores the information of the logging instance"
+
+
+class VerboseLogSink(NamedTuple):
+    console: Console
+    verbosity: Verbosity
+
+
+VerboseLogSink.__doc__ = "A console receiving every record up to its own verbosity threshold"
 type SysExcInfoType = tuple[type[BaseException], BaseException, TracebackType | None] | tuple[
     None, None, None
 ]
@@ -307,17 +317,39 @@ class VerboseLogger:
         from collections.abc import MutableMapping
         from pytest_textualize.plugin import settings_key
 
+        from pytest_textualize.plugin import recorder_key
+
         settings = config.stash.get(settings_key, None)
         if settings is None:
             raise RuntimeError(
                 "Expecting that config.stash[settings_key] was already initialized, but is None"
             )
 
+        self._setup(
+            Verbosity(config.option.verbose),
+            show_locals=settings.tracebacks_settings.show_locals,
+            recorder=config.stash.get(recorder_key, None),
+        )
+
+    @classmethod
+    def detached(cls, verbosity: Verbosity, show_locals: bool = False) -> VerboseLogger:
+        """Creates a logger that is not bound to a pytest session, e.g. to replay an events log."""
+        logger = cls.__new__(cls)
+        logger._setup(verbosity, show_locals=show_locals, recorder=None)
+        return logger
+
+    def _setup(
+        self, verbosity: Verbosity, show_locals: bool, recorder: EventRecorder | None
+    ) -> None:
         self._prefix: str = "\u2bc8"
         self._disabled: bool = False
-        self._verbosity = Verbosity(config.option.verbose)
-        self._consoles: MutableMapping[str, Console] = {}
-        self.show_locals = settings.tracebacks_settings.show_locals
+        self._verbosity = verbosity
+        self._consoles: dict[str, Console] = {}
+        self._headless: bool = False
+        self._sinks: dict[str, VerboseLogSink] = {}
+        self._sinks_verbosity: Verbosity | None = None
+        self._recorder = recorder
+        self.show_locals = show_locals
         self.raise_exceptions = True
         self._log_render = TextualizeLogRender(
             level_width=3,
@@ -345,6 +377,7 @@ class VerboseLogger:
             )
         if not self._consoles:
             self._consoles[name] = console
+            self._update_headless()
             return True, f"Console {name} added successfully."
         else:
             if name in self._consoles:
@@ -353,21 +386,61 @@ class VerboseLogger:
                 if c.file is console.file:
                     return False, f"Console exists with different name -> '{n}'"
             self._consoles[name] = console
+        self._update_headless()
         return True, f"Console {name} added successfully."
 
     def remove_console(self, name: str) -> bool:
         if name not in self._consoles:
             return False
         del self._consoles[name]
+        self._update_headless()
         return True
 
     def remove_all_consoles(self) -> None:
         self._consoles.clear()
+        self._update_headless()
+        return None
+
+    def _update_headless(self) -> None:
+        from pytest_textualize import Textualize
+
+        self._headless = bool(self._consoles) and all(
+            Textualize.is_null_console(console) for console in self._consoles.values()
+        )
         return None
 
+    @property
+    def is_headless(self) -> bool:
+        """All the consoles discard their output, the records are only sent to sinks or recorded."""
+        return self._headless
+
     def has_console(self, name: str) -> bool:
         return name in self._consoles
 
+    def add_sink(self, name: str, console: Console, verbosity: Verbosity) -> None:
+        """Adds a console receiving every record up to the sink verbosity.
+
+        Unlike the consoles, that receive the records by level when the logger verbosity is
+        enabled, all the sinks receive the record. Sinks sharing the width and the color system
+        share the rendered segments.
+        """
+        ConsoleValidator(console=console)
+        if name in self._sinks or name in self._consoles:
+            raise NameError(f"Duplicate sink name: {name}")
+        self._sinks[name] = VerboseLogSink(console, Verbosity(verbosity))
+        self._sinks_verbosity = max(sink.verbosity for sink in self._sinks.values())
+        return None
+
+    def remove_sink(self, name: str) -> bool:
+        if self._sinks.pop(name, None) is None:
+            return False
+        self._sinks_verbosity = max((s.verbosity for s in self._sinks.values()), default=None)
+        return True
+
+    @property
+    def sinks(self) -> Mapping[str, VerboseLogSink]:
+        return self._sinks
+
     @property
     def is_disabled(self) -> bool:
         return self._disabled
@@ -396,36 +469,55 @@ class VerboseLogger:
             yield n, c
 
     def debug(self, *objects: Any, **kwargs: Unpack[MypyTypeDict]) -> None:
-        if self._is_enabled_for(Verbosity.DEBUG):
-            self._log(*objects, level=logging.DEBUG, style="dim", **kwargs)
+        if self._is_wanted(Verbosity.DEBUG):
+            self._log(
+                *objects, level=logging.DEBUG, style="dim", verbosity=Verbosity.DEBUG, **kwargs
+            )
         return None
 
     def info(self, *objects: Any, **kwargs: Unpack[MypyTypeDict]) -> None:
-        if self._is_enabled_for(Verbosity.VERY_VERBOSE):
-            self._log(*objects, level=logging.INFO, **kwargs)
+        if self._is_wanted(Verbosity.VERY_VERBOSE):
+            self._log(*objects, level=logging.INFO, verbosity=Verbosity.VERY_VERBOSE, **kwargs)
         return None
 
     def warning(self, *objects: Any, **kwargs: Unpack[MypyTypeDict]) -> None:
-        if self._is_enabled_for(Verbosity.VERBOSE):
-            self._log(*objects, level=logging.WARNING, **kwargs)
+        if self._is_wanted(Verbosity.VERBOSE):
+            self._log(*objects, level=logging.WARNING, verbosity=Verbosity.VERBOSE, **kwargs)
 
     def error(self, *objects: Any, **kwargs: Unpack[MypyTypeDict]) -> None:
-        if self._is_enabled_for(Verbosity.NORMAL):
-            self._log(*objects, level=logging.ERROR, style="#ff4242", **kwargs)
+        if self._is_wanted(Verbosity.NORMAL):
+            self._log(
+                *objects, level=logging.ERROR, style="#ff4242", verbosity=Verbosity.NORMAL, **kwargs
+            )
 
     def critical(self, *objects: Any, **kwargs: Unpack[MypyTypeDict]) -> None:
-        if self._is_enabled_for(Verbosity.QUIET):
-            self._log(*objects, level=logging.CRITICAL, style="textualize.log.critical", **kwargs)
+        if self._is_wanted(Verbosity.QUIET):
+            self._log(
+                *objects,
+                level=logging.CRITICAL,
+                style="textualize.log.critical",
+                verbosity=Verbosity.QUIET,
+                **kwargs,
+            )
 
     def log(
         self,
         *objects: Any,
         level_text: TextAlias,
         verbosity: Verbosity = Verbosity.VERBOSE,
+        terminal: bool = True,
         **kwargs: Unpack[VerboseLogRecord],
     ) -> None:
-        if self._is_enabled_for(verbosity):
-            self._log(*objects, level=logging.NOTSET, level_text=level_text, **kwargs)
+        """Logs a hook message, ``terminal=False`` sends it to the sinks and the recorder only."""
+        if self._is_wanted(verbosity):
+            self._log(
+                *objects,
+                level=logging.NOTSET,
+                level_text=level_text,
+                verbosity=verbosity,
+                terminal=terminal,
+                **kwargs,
+            )
 
     def _log(
         self,
@@ -440,6 +532,8 @@ class VerboseLogger:
         log_locals: bool = False,
         exc_info: ExcInfoType | None = None,
         level_text: TextAlias | None = None,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        terminal: bool = True,
     ) -> None:
         filename, line_no, f_locals = self._caller_frame_info(2)
         if exc_info:
@@ -467,86 +561,203 @@ class VerboseLogger:
             markup=markup,
             highlight=highlight,
             log_locals=log_locals,
+            verbosity=verbosity,
+        )
+        if self._recorder is not None:
+            self._record(record, verbosity)
+        self.handle(record, terminal)
+
+    def _record(self, record: VerboseLogRecord, verbosity: Verbosity) -> None:
+        from pytest_textualize.textualize.events import LogMessage
+        from pytest_textualize.textualize.events import markup
+
+        level_text = record.level_text
+        self._recorder.emit(
+            LogMessage,
+            int(verbosity),
+            record.level,
+            None if level_text is None else markup(level_text),
+            record.filename,
+            record.line_no,
+            [markup(renderable) for renderable in record.renderables],
+            record.style if isinstance(record.style, str) else None,
         )
-        self.handle(record)
 
-    def handle(self, record: VerboseLogRecord) -> None:
+    def handle(self, record: VerboseLogRecord, terminal: bool = True) -> None:
+        if self._disabled:
+            return None
         try:
-            logged = False
-            for name, console in self.iter_consoles():
-
-                if record.level >= logging.ERROR and console.stderr:
-                    self.process_record(console, record)
-                    logged = True
-                    break
-                if record.level < logging.ERROR and console.stderr is False:
-                    self.process_record(console, record)
-                    logged = True
-                    break
-            else:
-                if record.exc_info:
-                    pass
-
-            if record.level >= logging.ERROR and not logged:
-                sys.stderr.write(
-                    "No stderr consoles could be found, generating message via standard logging module\n"
-                )
-            elif record.level < logging.ERROR and not logged:
-                sys.stderr.write("No consoles could be found, log message is omitted\n")
+            consoles: list[Console] = []
+            if terminal and self._is_enabled_for(record.verbosity):
+                console = self._route(record)
+                if console is not None:
+                    consoles.append(console)
+            if self._sinks:
+                for sink in self._sinks.values():
+                    if sink.verbosity >= record.verbosity and sink.console not in consoles:
+                        consoles.append(sink.console)
+
+            if len(consoles) == 1:
+                self._dispatch(consoles[0], record)
+            elif consoles:
+                self._fan_out(consoles, record)
         except (KeyboardInterrupt, SystemExit, Exception) as e:
             pass
 
+    def _route(self, record: VerboseLogRecord) -> Console | None:
+        fallback: Console | None = None
+        for name, console in self.iter_consoles():
+            if record.level >= logging.ERROR and console.stderr:
+                return console
+            if record.level < logging.ERROR and console.stderr is False:
+                return console
+            fallback = fallback or console
+
+        if fallback is not None:
+            # -- a single console, e.g. a replay to one stream, gets every level
+            return fallback
+        sys.stderr.write("No consoles could be found, log message is omitted\n")
+        return None
+
+    def _fan_out(self, consoles: list[Console], record: VerboseLogRecord) -> None:
+        """Renders the record once per (width, color_system) and writes it to every console."""
+        from pytest_textualize.textualize.writer import BackgroundConsole
+
+        if not record.renderables:
+            return None
+
+        rendered: dict[tuple[object, ...], str | list[Segment] | None] = {}
+        for console in consoles:
+            if isinstance(console, BackgroundConsole):
+                # -- rendered by the writer thread too, in order with the console prints
+                console.defer(self._write_shared, console, record, rendered)
+            else:
+                self._write_shared(console, record, rendered)
+        return None
+
+    def _write_shared(
+        self,
+        console: Console,
+        record: VerboseLogRecord,
+        rendered: dict[tuple[object, ...], str | list[Segment] | None],
+    ) -> None:
+        """Writes the record to the console, reusing the renders of the other consoles."""
+        from pytest_textualize.textualize.plain import PlainRenderer
+
+        if getattr(console, "_render_hooks"):
+            # -- the render hooks are specific to the console (e.g. a live display)
+            self.process_record(console, record)
+            return None
+
+        plain_renderer = PlainRenderer.from_console(console)
+        if plain_renderer is not None and not self.show_locals:
+            key: tuple[object, ...] = ("plain", plain_renderer.width)
+            if key not in rendered:
+                rendered[key] = plain_renderer.format_record(record)
+            line = rendered[key]
+            if line is not None:
+                plain_renderer.write(f"{line}{record.end}")
+                return None
+
+        key = (console.width, console.color_system)
+        segments = rendered.get(key)
+        if segments is None:
+            segments = rendered[key] = self.render_record(console, record)
+        with console:
+            getattr(console, "_buffer").extend(segments)
+        return None
+
+    def _dispatch(self, console: Console, record: VerboseLogRecord) -> None:
+        from pytest_textualize.textualize.writer import BackgroundConsole
+
+        if isinstance(console, BackgroundConsole):
+            # -- the record is rendered by the writer thread, in order with the console prints
+            console.defer(self.process_record, console, record)
+        else:
+            self.process_record(console, record)
+
+    @staticmethod
+    def _process_plain(console: Console, record: VerboseLogRecord) -> bool:
+        from pytest_textualize.textualize.plain import PlainRenderer
+
+        plain_renderer = PlainRenderer.from_console(console)
+        if plain_renderer is None:
+            return False
+        line = plain_renderer.format_record(record)
+        if line is None:
+            # -- not a text renderable, requires the rich layout
+            return False
+        plain_renderer.write(f"{line}{record.end}")
+        return True
+
     def process_record(self, console: Console, record: VerboseLogRecord) -> None:
         if not record.renderables:
             return None
 
-        render_hooks = getattr(console, "_render_hooks")[:]
+        render_hooks = getattr(console, "_render_hooks")
+        if not render_hooks and not self.show_locals and self._process_plain(console, record):
+            return None
+        segments = self.render_record(console, record)
         with console:
-            renderables: list[ConsoleRenderable] = getattr(console, "_collect_renderables")(
-                record.renderables,
-                record.sep,
-                record.end,
-                justify=record.justify,
-                markup=record.markup,
-                highlight=record.highlight,
-            )
-            if record.style is not None:
-                renderables = [Styled(renderable, record.style) for renderable in renderables]
-            link_path = (
-                None if record.filename.startswith("<") else os.path.abspath(record.filename)
-            )
-            path = record.filename.rpartition(os.sep)[-1]
-            if self.show_locals:
-                locals_map = {
-                    key: value for key, value in record.locals.items() if not key.startswith("__")
-                }
-                renderables.append(render_scope(locals_map, title="[i]locals[/]"))
-            renderables = [
-                self._log_render(
-                    console,
-                    renderables,
-                    level=record.level_text,
-                    path=path,
-                    line_no=record.line_no,
-                    link_path=link_path,
-                )
-            ]
-            for hook in render_hooks:
-                renderables = hook.process_renderables(renderables)
-            new_segments: list[Segment] = []
-            extend = new_segments.extend
-            render = console.render
-            render_options = console.options
-            for renderable in renderables:
-                extend(render(renderable, render_options))
-            buffer_extend = getattr(console, "_buffer").extend
-            for line in Segment.split_and_crop_lines(new_segments, console.width, pad=False):
-                buffer_extend(line)
+            getattr(console, "_buffer").extend(segments)
         return None
 
+    def render_record(self, console: Console, record: VerboseLogRecord) -> list[Segment]:
+        """Renders the record, as lines cropped to the console width, without writing them."""
+        render_hooks = getattr(console, "_render_hooks")[:]
+        renderables: list[ConsoleRenderable] = getattr(console, "_collect_renderables")(
+            record.renderables,
+            record.sep,
+            record.end,
+            justify=record.justify,
+            markup=record.markup,
+            highlight=record.highlight,
+        )
+        if record.style is not None:
+            renderables = [Styled(renderable, record.style) for renderable in renderables]
+        link_path = None if record.filename.startswith("<") else os.path.abspath(record.filename)
+        path = record.filename.rpartition(os.sep)[-1]
+        if self.show_locals:
+            locals_map = {
+                key: value for key, value in record.locals.items() if not key.startswith("__")
+            }
+            renderables.append(render_scope(locals_map, title="[i]locals[/]"))
+        renderables = [
+            self._log_render(
+                console,
+                renderables,
+                level=record.level_text,
+                path=path,
+                line_no=record.line_no,
+                link_path=link_path,
+            )
+        ]
+        for hook in render_hooks:
+            renderables = hook.process_renderables(renderables)
+        new_segments: list[Segment] = []
+        extend = new_segments.extend
+        render = console.render
+        render_options = console.options
+        for renderable in renderables:
+            extend(render(renderable, render_options))
+        segments: list[Segment] = []
+        for line in Segment.split_and_crop_lines(new_segments, console.width, pad=False):
+            segments.extend(line)
+        return segments
+
+    def wants(self, verbosity: Verbosity) -> bool:
+        """Should the caller build a message of this verbosity, False if it would be discarded."""
+        return self._is_wanted(verbosity)
+
+    def _is_wanted(self, verbosity: Verbosity) -> bool:
+        """The message is either rendered, sent to a sink or recorded for a replay."""
+        if self._recorder is not None or self._is_enabled_for(verbosity):
+            return True
+        return self._sinks_verbosity is not None and self._sinks_verbosity >= verbosity
+
     def _is_enabled_for(self, verbosity: Verbosity) -> bool:
         """Is this logger enabled for level 'level'?"""
-        if self._disabled:
+        if self._disabled or self._headless:
             return False
         return self.effective_verbose >= verbosity
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import os
+from typing import Final
+from typing import Literal
+from typing import TYPE_CHECKING
+
+import pytest
+from rich.text import Text
+
+from pytest_textualize.textualize.templates import strip_markup
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from rich.console import Console
+    from pytest_textualize.model import CollectCounters
+    from pytest_textualize.model import CollectStats
+    from pytest_textualize.textualize.logging import VerboseLogRecord
+
+
+RendererVariant = Literal["auto", "rich", "plain"]
+
+_KEY_WIDTH: Final = 14
+_KEY_INDENT: Final = " " * 6
+
+
+def plain_text(renderable: object) -> str | None:
+    """Returns the plain text of a str or Text, None for any other renderable."""
+    if isinstance(renderable, str):
+        return strip_markup(renderable)
+    if isinstance(renderable, Text):
+        return renderable.plain
+    return None
+
+
+class PlainRenderer:
+    """Formats the textualize messages straight into plain strings.
+
+    Used for non-interactive outputs (CI logs, pipes), where Rich would lay out grids, panels and
+    rules cell by cell only to emit lines without any style. The widths are computed once from
+    the console, and every message is written as a single string to the console file.
+    """
+
+    def __init__(self, console: Console) -> None:
+        self.console = console
+        self.width = console.width
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} width={self.width}>"
+
+    @classmethod
+    def select(cls, config: pytest.Config, console: Console) -> PlainRenderer | None:
+        """Attaches a plain renderer to the console when its output is not interactive."""
+        renderer: RendererVariant = config.getoption("textualize_renderer", "auto", skip=True)
+        if renderer == "rich" or (renderer == "auto" and console.is_terminal):
+            return None
+        if console.record:
+            # -- recording requires the rendered segments
+            return None
+        return cls.attach(console)
+
+    @classmethod
+    def attach(cls, console: Console) -> PlainRenderer:
+        plain_renderer = cls(console)
+        setattr(console, "_plain_renderer", plain_renderer)
+        return plain_renderer
+
+    @staticmethod
+    def from_console(console: Console) -> PlainRenderer | None:
+        return getattr(console, "_plain_renderer", None)
+
+    # ----------------------------------------------------------------------------------- writing
+
+    def write(self, text: str) -> None:
+        from pytest_textualize.textualize.writer import BackgroundConsole
+
+        if isinstance(self.console, BackgroundConsole):
+            self.console.defer(self._write_file, text)
+        else:
+            self._write_file(text)
+        return None
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        self.write("".join(f"{line}\n" for line in lines))
+        return None
+
+    def _write_file(self, text: str) -> None:
+        with getattr(self.console, "_lock"):
+            self.console.file.write(text)
+        return None
+
+    # -------------------------------------------------------------------------------- formatting
+
+    def rule(self, title: str = "", characters: str = "=") -> str:
+        title = strip_markup(title)
+        if not title:
+            return (characters * self.width)[: self.width]
+        return f" {title} ".center(self.width, characters[0])
+
+    def stage_rule(self, title: str) -> str:
+        return f"\n{self.rule(title)}\n"
+
+    def log_line(self, level: str, message: str, path: str | None = None) -> str:
+        """Formats a verbose logger line, as TextualizeLogRender columns: level, message, path."""
+        if not path:
+            return f"{level} {message}"
+        lines = message.splitlines() or [""]
+        message_width = self.width - len(level) - len(path) - 2
+        first = f"{level} {lines[0].ljust(message_width)} {path}"
+        if len(lines) == 1:
+            return first
+        indent = " " * (len(level) + 1)
+        return "\n".join([first, *(f"{indent}{line}" for line in lines[1:])])
+
+    def format_record(self, record: VerboseLogRecord) -> str | None:
+        """Formats the record, returns None if one of the renderables is not text."""
+        parts: list[str] = []
+        for renderable in record.renderables:
+            text = plain_text(renderable)
+            if text is None:
+                return None
+            parts.append(text)
+        path = record.filename.rpartition(os.sep)[-1]
+        if record.line_no:
+            path = f"{path}:{record.line_no}"
+        return self.log_line(record.level_text.plain, record.sep.join(parts), path)
+
+    def key_values(self, items: Iterable[tuple[str, object]]) -> list[str]:
+        lines: list[str] = []
+        for key, value in items:
+            text = plain_text(value)
+            lines.append(
+                f"{_KEY_INDENT}{f" - {key}".ljust(_KEY_WIDTH)}│{text if text is not None else value}"
+            )
+        return lines
+
+    @staticmethod
+    def collect_progress(stats: CollectStats | CollectCounters, final: bool = False) -> str:
+        from boltons.strutils import cardinalize
+
+        collected = stats.total_collected
+        parts = [
+            "collected " if final else "▪ collecting ",
+            f"{collected} {cardinalize("item", collected)}",
+        ]
+        if stats.total_errors:
+            parts.append(f" / {stats.total_errors} {cardinalize("error", stats.total_errors)}")
+        if stats.total_deselected:
+            parts.append(f" / {stats.total_deselected} deselected")
+        if stats.total_skipped:
+            parts.append(f" / {stats.total_skipped} skipped")
+        if stats.total_xfailed:
+            parts.append(f" / {stats.total_xfailed} xfailed")
+        if collected > stats.selected:
+            parts.append(f" / {stats.selected} selected")
+        return "".join(parts)
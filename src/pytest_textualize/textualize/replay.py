@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+from rich.text import Text
+
+from pytest_textualize import Textualize
+from pytest_textualize import Verbosity
+from pytest_textualize.textualize.events import CollectError
+from pytest_textualize.textualize.events import CollectFinish
+from pytest_textualize.textualize.events import CollectStart
+from pytest_textualize.textualize.events import ItemCollected
+from pytest_textualize.textualize.events import LogMessage
+from pytest_textualize.textualize.events import RunTestReport
+from pytest_textualize.textualize.events import SessionFinish
+from pytest_textualize.textualize.events import SessionStart
+from pytest_textualize.textualize.events import StatsSummary
+from pytest_textualize.textualize.events import WarningRecorded
+from pytest_textualize.textualize.events import read_events
+from pytest_textualize.textualize.plain import PlainRenderer
+from pytest_textualize.textualize.plain import RendererVariant
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+    from rich.console import RenderableType
+    from pytest_textualize.textualize.events import Event
+    from pytest_textualize.typist import ThemeType
+
+
+OUTCOME_STYLES = {
+    "passed": "pytest.outcome.passed",
+    "failed": "pytest.outcome.error",
+    "skipped": "pytest.outcome.skipped",
+    "xfailed": "pytest.outcome.xfailed",
+    "xpassed": "pytest.outcome.xpassed",
+}
+
+
+class EventReplay:
+    """Renders a recorded events log, as the tracers would have rendered the live session.
+
+    The verbosity of the replay is independent of the recorded session, log messages are recorded
+    regardless of the session verbosity.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        verbosity: Verbosity = Verbosity.NORMAL,
+        error_console: Console | None = None,
+    ) -> None:
+        from pytest_textualize.textualize.logging import TextualizeLogRender
+        from pytest_textualize.textualize.logging import VerboseLogger
+
+        TextualizeLogRender.override_log_render(console=console)
+        self.console = console
+        self.verbosity = verbosity
+        self.verbose_logger = VerboseLogger.detached(verbosity)
+        self.verbose_logger.add_console("<stdout>", console)
+        if error_console is not None:
+            # -- the error records are written to stderr, as in the recorded session
+            TextualizeLogRender.override_log_render(console=error_console)
+            self.verbose_logger.add_console("<stderr>", error_console)
+        self.collect_errors: list[CollectError] = []
+        self.failures: list[RunTestReport] = []
+        self.warnings: list[WarningRecorded] = []
+        self.outcomes: Counter[str] = Counter()
+        self._start: float = 0.0
+        self._summarized = False
+        self._handlers: dict[type[Event], Callable[..., None]] = {
+            SessionStart: self.session_start,
+            LogMessage: self.log,
+            CollectStart: self.collect_start,
+            ItemCollected: self.item_collected,
+            CollectError: self.collect_errors.append,
+            CollectFinish: self.collect_finish,
+            RunTestReport: self.report,
+            WarningRecorded: self.warnings.append,
+            StatsSummary: self.stats_summary,
+            SessionFinish: self.session_finish,
+        }
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} verbosity={self.verbosity!r}>"
+
+    @property
+    def plain_renderer(self) -> PlainRenderer | None:
+        return PlainRenderer.from_console(self.console)
+
+    def replay(self, events: Iterable[Event]) -> None:
+        handlers = self._handlers
+        for event in events:
+            handlers[type(event)](event)
+        return None
+
+    def rule(self, title: str, characters: str = "=", style: str = "none") -> None:
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([plain_renderer.rule(title, characters)])
+        else:
+            self.console.rule(title, characters=characters, style=style)
+        return None
+
+    def session_start(self, event: SessionStart) -> None:
+        self._start = event.t
+        if self.verbosity >= Verbosity.NORMAL:
+            Textualize.stage_rule(self.console, "session", time_str=event.time_str)
+        return None
+
+    def log(self, event: LogMessage) -> None:
+        from pytest_textualize.textualize.logging import VerboseLogRecord
+
+        if self.verbose_logger.effective_verbose < event.verbosity:
+            return None
+        level_text = (
+            Text(self.verbose_logger.prefix, end="")
+            if event.level_text is None
+            else Text.from_markup(event.level_text, end="")
+        )
+        record = VerboseLogRecord(
+            sep=" ",
+            end="\n",
+            level=event.level,
+            highlight=False,
+            markup=True,
+            level_text=level_text,
+            filename=event.filename,
+            line_no=event.line_no,
+            log_locals=False,
+            style=event.style or "",
+            renderables=event.renderables,
+            exc_info=None,
+            justify="left",
+            locals={},
+        )
+        self.verbose_logger.handle(record)
+        return None
+
+    def collect_start(self, event: CollectStart) -> None:
+        if self.verbosity > Verbosity.NORMAL:
+            Textualize.stage_rule(self.console, "collection", time_str=event.time_str)
+        return None
+
+    def item_collected(self, event: ItemCollected) -> None:
+        from pytest_textualize.textualize.console import print_key_values
+
+        if self.verbosity < Verbosity.VERBOSE:
+            return None
+        markers = ", ".join(event.markers)
+        if event.skip_reason is not None:
+            print_key_values(
+                self.console,
+                [
+                    ("type", "[skip]skip[/]"),
+                    ("reason", Text(event.skip_reason)),
+                    ("marker", Text(f"@{markers}", style="#B3AE60")),
+                ],
+            )
+        if event.xfail is not None:
+            reason, run, strict, raises = event.xfail
+            items: list[tuple[str, RenderableType]] = [
+                ("type", "[xfail]xfail[/]"),
+                ("reason", Text(reason)),
+                ("run", str(run)),
+                ("strict", str(strict)),
+            ]
+            if raises is not None:
+                items.append(("raises", raises))
+            print_key_values(self.console, items)
+        return None
+
+    def collect_finish(self, event: CollectFinish) -> None:
+        from pytest_textualize.model import CollectStats
+
+        if self.verbosity < Verbosity.NORMAL:
+            return None
+        stats = CollectStats(
+            collected=event.collected,
+            errors=event.errors,
+            deselected=event.deselected,
+            skipped=event.skipped,
+            xfailed=event.xfailed,
+        )
+        progress = PlainRenderer.collect_progress(stats, final=True)
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([progress])
+        else:
+            self.console.print(Text(progress, style="items"))
+        Textualize.stage_rule(self.console, "collection", time_str=event.time_str, start=False)
+        return None
+
+    def report(self, event: RunTestReport) -> None:
+        if event.outcome == "failed":
+            self.failures.append(event)
+            self.outcomes["failed" if event.when == "call" else "error"] += 1
+        elif event.when == "call" or event.outcome != "passed":
+            self.outcomes[event.outcome] += 1
+        if self.verbosity < Verbosity.VERBOSE:
+            return None
+        if event.when != "call" and event.outcome == "passed":
+            return None
+        outcome = event.outcome.upper()
+        if event.when != "call" and event.outcome == "failed":
+            outcome = f"ERROR at {event.when}"
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([f"{event.nodeid} {outcome}"])
+        else:
+            style = OUTCOME_STYLES.get(event.outcome, "none")
+            self.console.print(Text(f"{event.nodeid} ").append(outcome, style=style))
+        return None
+
+    def stats_summary(self, event: StatsSummary) -> None:
+        self._summarized = True
+        if self.verbosity < Verbosity.NORMAL:
+            return None
+        if self.collect_errors:
+            self.rule("[#FF5151]ERRORS SUMMARY[/]", style="pytest.outcome.error")
+            for error in self.collect_errors:
+                self.rule(
+                    f"[#FF5151]ERROR collecting {error.nodeid}[/]", "_", "pytest.outcome.error"
+                )
+                self.print_text(error.longrepr)
+        if self.failures:
+            self.rule("[#FF5151]FAILURES[/]", style="pytest.outcome.error")
+            for failure in self.failures:
+                title = failure.nodeid
+                if failure.when != "call":
+                    title = f"ERROR at {failure.when} of {failure.nodeid}"
+                self.rule(f"[#FF5151]{title}[/]", "_", "pytest.outcome.error")
+                self.print_text(failure.longrepr or "")
+        if self.warnings:
+            self.rule("[#ffe0b1]WARNINGS SUMMARY[/]", style="pytest.outcome.warnings")
+            for warning in self.warnings:
+                self.print_text(
+                    f"{warning.nodeid}\n  {warning.filename}:{warning.lineno}: "
+                    f"{warning.category}: {warning.message}"
+                )
+        self.rule(event.message, style="#68D2E8")
+        return None
+
+    def session_finish(self, event: SessionFinish) -> None:
+        if not self._summarized and self.outcomes:
+            # -- the session did not summarize, e.g. recorded with --quiet
+            parts = [f"{count} {outcome}" for outcome, count in self.outcomes.items()]
+            message = f"{", ".join(parts)} in {event.t - self._start:.2f} s"
+            self.stats_summary(StatsSummary(event.t, message))
+        if self.verbosity >= Verbosity.NORMAL:
+            Textualize.stage_rule(self.console, "session", time_str=event.time_str, start=False)
+        return None
+
+    def print_text(self, text: str) -> None:
+        plain_renderer = self.plain_renderer
+        if plain_renderer is not None:
+            plain_renderer.write_lines([text])
+        else:
+            self.console.print(Text(text), soft_wrap=True)
+        return None
+
+
+def replay_theme() -> ThemeType | None:
+    from pytest_textualize.settings import ConsolePyProjectSettingsModel
+
+    try:
+        return ConsolePyProjectSettingsModel().get_theme("truecolor")
+    except FileNotFoundError:
+        return None
+
+
+def replay_console(
+    width: int | None,
+    renderer: RendererVariant,
+    theme: ThemeType | None = None,
+    stderr: bool = False,
+) -> Console:
+    console = Console(width=width, theme=theme, log_time=False, stderr=stderr)
+    if renderer == "plain" or theme is None or (renderer == "auto" and not console.is_terminal):
+        # -- the textualize styles are required by the rich renderer
+        PlainRenderer.attach(console)
+    return console
+
+
+def replay(args: argparse.Namespace) -> int:
+    events = read_events(args.log)
+    try:
+        first = next(events, None)
+    except (OSError, ValueError) as exc:
+        print(f"pytest-textualize: {args.log}: {exc}", file=sys.stderr)
+        return 1
+    if first is None:
+        return 0
+
+    width = args.width or (first.width if isinstance(first, SessionStart) else None)
+    theme = replay_theme()
+    console = replay_console(width, args.renderer, theme)
+    error_console = replay_console(width, args.renderer, theme, stderr=True)
+    verbosity = Verbosity(max(Verbosity.QUIET, min(Verbosity.DEBUG, args.verbose - args.quiet)))
+    event_replay = EventReplay(console, verbosity, error_console)
+    event_replay.replay([first])
+    event_replay.replay(events)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from rich_argparse_plus import RichHelpFormatterPlus
+
+    parser = argparse.ArgumentParser(
+        prog="pytest-textualize", formatter_class=RichHelpFormatterPlus
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    replay_parser = commands.add_parser(
+        "replay",
+        help="Render a session recorded with --textualize-record",
+        formatter_class=RichHelpFormatterPlus,
+    )
+    replay_parser.add_argument("log", type=Path, help="The recorded events log")
+    replay_parser.add_argument(
+        "-v", "--verbose", action="count", default=0, help="Increase the replay verbosity"
+    )
+    replay_parser.add_argument(
+        "-q", "--quiet", action="count", default=0, help="Decrease the replay verbosity"
+    )
+    replay_parser.add_argument(
+        "--width", type=int, default=None, help="Console width, defaults to the recorded width"
+    )
+    replay_parser.add_argument(
+        "--renderer",
+        choices=("auto", "rich", "plain"),
+        default="auto",
+        help="Renderer of the replayed output. Default to %(default)s",
+    )
+    replay_parser.set_defaults(handler=replay)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Annotated
+from typing import Final
+from typing import Literal
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+from pydantic import StringConstraints
+from pydantic import TypeAdapter
+from rich.control import strip_control_codes
+from rich.markup import render as render_markup
+from rich.text import Span
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.style import StyleType
+
+
+SingleChar = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=1)]
+single_char_adapter: Final = TypeAdapter(SingleChar)
+
+
+@lru_cache(maxsize=4096)
+def is_markup(string: str) -> bool:
+    """Returns True if the string has console markup tags, the result is cached per string."""
+    if not string or "[" not in string:
+        return False
+    return len(render_markup(string).spans) > 0
+
+
+@lru_cache(maxsize=4096)
+def strip_markup(string: str) -> str:
+    """Returns the plain text of a console markup string, the result is cached per string."""
+    if "[" not in string:
+        return string
+    return render_markup(string).plain
+
+
+class Slot(NamedTuple):
+    """A placeholder of a template, padded to ``width`` cells."""
+
+    name: str
+    width: int = 0
+    align: Literal["left", "right"] = "left"
+
+    @lru_cache(maxsize=1024)
+    def fill(self, value: str) -> str:
+        """Returns the sanitized and padded value, cached since the same values keep coming."""
+        value = strip_control_codes(value)
+        if self.align == "left":
+            return value.ljust(self.width)
+        return value.rjust(self.width)
+
+
+class MessageTemplate:
+    """A message shape compiled once into fixed strings, slots and their styles.
+
+    The fixed strings are sanitized when the template is compiled and the slot values are cached
+    once padded, so rendering only joins the strings and creates a single ``Text``. When every
+    slot has a width, the spans are computed once and only recomputed for the values overflowing
+    their slot.
+    """
+
+    __slots__ = ("parts", "style", "end", "_spans", "_static")
+
+    def __init__(
+        self, *parts: tuple[str | Slot, StyleType | None], style: StyleType = "", end: str = "\n"
+    ) -> None:
+        self.parts = tuple(
+            (part if isinstance(part, Slot) else strip_control_codes(part), part_style)
+            for part, part_style in parts
+        )
+        self.style = style
+        self.end = end
+        self._spans: list[Span] | None = None
+        self._static: str | None = None
+        slots = [part for part, _ in self.parts if isinstance(part, Slot)]
+        if not slots:
+            self._static = "".join(part for part, _ in self.parts if isinstance(part, str))
+        if all(slot.width for slot in slots):
+            self._spans = self._compute_spans(
+                [part.width if isinstance(part, Slot) else len(part) for part, _ in self.parts]
+            )
+
+    def __repr__(self) -> str:
+        slots = [part.name for part, _ in self.parts if isinstance(part, Slot)]
+        return f"<{self.__class__.__name__} slots={slots!r}>"
+
+    def _compute_spans(self, lengths: list[int]) -> list[Span]:
+        spans: list[Span] = []
+        offset = 0
+        for (_, style), length in zip(self.parts, lengths):
+            if style and length:
+                spans.append(Span(offset, offset + length, style))
+            offset += length
+        return spans
+
+    def render(self, **values: str) -> Text:
+        if self._static is not None:
+            return self._text(self._static, self._spans)
+        strings = [
+            part.fill(values[part.name]) if isinstance(part, Slot) else part
+            for part, _ in self.parts
+        ]
+        spans = self._spans
+        if spans is None or any(
+            len(string) > part.width
+            for (part, _), string in zip(self.parts, strings)
+            if isinstance(part, Slot)
+        ):
+            spans = self._compute_spans([len(string) for string in strings])
+        return self._text("".join(strings), spans)
+
+    def _text(self, plain: str, spans: list[Span] | None) -> Text:
+        # -- the spans of the template are shared, every text gets its own list
+        return Text(plain, style=self.style, end=self.end, spans=list(spans or ()))
+
+
+HOOK_LEVEL: Final = MessageTemplate(("\u2bc0", None), style="pyest.hook.prefix")
+HOOK_MESSAGE: Final = MessageTemplate(
+    ("hook: ", None), (Slot("hookname", width=30), "pyest.hook.name"), style="pyest.hook.tag"
+)
+KEY_VALUE_LEVEL: Final = MessageTemplate(
+    (Slot("level", width=9, align="right"), None), style="#B0D9B1"
+)
+KEY_VALUE_KEY: Final = MessageTemplate(
+    (Slot("key", width=20), None), (Slot("separator"), "none"), style="#CBFFA9"
+)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from rich.console import RenderHook
+    from rich.control import Control
+
+
+DEFAULT_QUEUE_SIZE: Final = 1024
+_STOP: Final = object()
+
+
+class ConsoleWriter:
+    """Renders and writes console output on a dedicated background thread.
+
+    All the consoles sharing the same writer are served by a single FIFO queue, so the output
+    keeps the order in which the hooks produced it, regardless of the target stream.
+    The queue is bounded, when the terminal cannot keep up the producer blocks instead of
+    buffering without limit.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name="textualize-console-writer", daemon=True
+        )
+        self._closed = False
+        self._thread.start()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} "
+            f"pending={self._queue.qsize()} "
+            f"alive={self._thread.is_alive()!r}>"
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def in_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Enqueue a call, runs it synchronously if the writer is closed or is the caller."""
+        if self._closed or self.in_writer_thread():
+            fn(*args, **kwargs)
+            return None
+        self._queue.put((fn, args, kwargs))
+        return None
+
+    def flush(self) -> None:
+        """Blocks until every pending call was rendered and written."""
+        if self._closed or self.in_writer_thread():
+            return None
+        self._queue.join()
+        return None
+
+    def close(self) -> None:
+        """Flush the pending output and stop the writer thread, further calls run inline."""
+        if self._closed:
+            return None
+        self.flush()
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        return None
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return None
+                fn, args, kwargs = item
+                fn(*args, **kwargs)
+            except Exception as exc:
+                sys.stderr.write(f"textualize console writer failed to write output: {exc!r}\n")
+            finally:
+                self._queue.task_done()
+
+
+class BackgroundConsole(Console):
+    """A rich Console that delegates rendering and writing to a ``ConsoleWriter``.
+
+    ``print`` (and therefore ``rule``, ``line`` and ``out``) and ``control`` return as soon as
+    the call is queued. ``log`` inspects the caller frame, so it drains the queue and logs inline.
+    """
+
+    def __init__(self, *args: Any, writer: ConsoleWriter, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.writer = writer
+
+    def defer(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.writer.submit(fn, *args, **kwargs)
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        self.writer.submit(super().print, *objects, **kwargs)
+
+    def control(self, *control: Control) -> None:
+        self.writer.submit(super().control, *control)
+
+    def push_render_hook(self, hook: RenderHook) -> None:
+        # -- the hook applies to the output queued after it, not to the output rendered meanwhile
+        self.writer.submit(super().push_render_hook, hook)
+
+    def pop_render_hook(self) -> None:
+        self.writer.submit(super().pop_render_hook)
+
+    def log(self, *objects: Any, **kwargs: Any) -> None:
+        self.writer.flush()
+        kwargs["_stack_offset"] = kwargs.get("_stack_offset", 1) + 1
+        super().log(*objects, **kwargs)
@@ -0,0 +1,82 @@
+"""Memory held by the skip and xfail records of a large parametrized suite, one pydantic
+record with its own markers list per item against the shared records of the classification
+table.
+
+Usage: python tests/benchmarks/bench_classification_table.py [--modules N] [--cases N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pytest_textualize.model import ClassificationTable
+from pytest_textualize.model import SkipInfo
+from pytest_textualize.model import XfailInfo
+
+
+def nodeids(modules: int, cases: int):
+    for module in range(modules):
+        for case in range(cases):
+            yield f"tests/unit/test_module_{module}.py::TestGroup::test_case[{case}-{module}]"
+
+
+def legacy(modules: int, cases: int) -> tuple[dict, dict]:
+    skip: dict[str, list[SkipInfo]] = {}
+    xfail: dict[str, list[XfailInfo]] = {}
+    for n, nodeid in enumerate(nodeids(modules, cases)):
+        # -- a fresh copy of the node id, the reason and the markers, as the hooks produce them
+        nodeid = "".join(nodeid)
+        markers = ["parametrize", "skipif" if n % 2 else "xfail"]
+        if n % 2:
+            skip.setdefault(nodeid, []).append(
+                SkipInfo.model_construct(reason="".join("not on ci"), markers=markers)
+            )
+        else:
+            xfail.setdefault(nodeid, []).append(
+                XfailInfo.model_construct(
+                    reason="".join("flaky"), raises=None, run=True, strict=False, markers=markers
+                )
+            )
+    return skip, xfail
+
+
+def table(modules: int, cases: int) -> tuple[ClassificationTable, ClassificationTable]:
+    skip = ClassificationTable()
+    xfail = ClassificationTable(skip.node_ids)
+    for n, nodeid in enumerate(nodeids(modules, cases)):
+        nodeid = "".join(nodeid)
+        markers = ["parametrize", "skipif" if n % 2 else "xfail"]
+        if n % 2:
+            skip.add_skip(nodeid, "".join("not on ci"), markers)
+        else:
+            xfail.add_xfail(nodeid, "".join("flaky"), None, True, False, markers)
+    return skip, xfail
+
+
+def measure(name: str, func) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<8} {current / 2**20:>8.2f} MiB {elapsed:>8.3f} s")
+    del result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=20)
+    parser.add_argument("--cases", type=int, default=10_000)
+    args = parser.parse_args()
+
+    measure("records", lambda: legacy(args.modules, args.cases))
+    measure("table", lambda: table(args.modules, args.cases))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Cost of counting the collected items and refreshing the collecting progress line, the
+pydantic stats with a model_dump and new Text objects per refresh against the slotted counters
+with the cached progress segments.
+
+Usage: python tests/benchmarks/bench_collect_progress.py [--items N] [--every N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from boltons.strutils import cardinalize
+from rich.console import Console
+from rich.segment import Segments
+from rich.text import Text
+
+from pytest_textualize.model import CollectCounters
+from pytest_textualize.model import CollectStats
+from pytest_textualize.plugin.helpers.collect_progress import CollectProgress
+
+
+def legacy(console: Console, items: int, every: int) -> None:
+    stats = CollectStats()
+    for n in range(items):
+        stats.total_collected += 1
+        if n % 10 == 0:
+            stats.total_skipped += 1
+        if n % every:
+            continue
+        dump = stats.model_dump(mode="python", by_alias=True)
+        row = [
+            Text("▪ collecting ", style="items"),
+            Text(f"{dump["collected"]} {cardinalize("item", dump["collected"])}", style="items"),
+        ]
+        if dump["skipped"]:
+            row.append(Text(f" / {dump["skipped"]} skipped", style="skipped"))
+        console.print(*row, end="")
+
+
+def counters(console: Console, items: int, every: int) -> None:
+    counts = CollectCounters()
+    progress = CollectProgress(console)
+    for n in range(items):
+        counts.total_collected += 1
+        if n % 10 == 0:
+            counts.total_skipped += 1
+        if n % every:
+            continue
+        console.print(Segments(progress.segments(counts, final=False)), end="")
+    counts.to_stats()
+
+
+def measure(name: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    print(f"{name:<12} {time.perf_counter() - start:>8.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--every", type=int, default=20, help="items between two refreshes")
+    args = parser.parse_args()
+
+    console = Console(file=open("/dev/null", "w"), width=120, force_terminal=True)
+    measure("pydantic", lambda: legacy(console, args.items, args.every))
+    measure("counters", lambda: counters(console, args.items, args.every))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Per-call cost of the message helpers, built part by part against the compiled templates.
+
+Usage: python tests/benchmarks/bench_message_templates.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Annotated
+
+from pydantic import StringConstraints
+from pydantic import TypeAdapter
+from rich.markup import render as render_markup
+from rich.text import Text
+
+from pytest_textualize import Textualize
+from pytest_textualize._textualize import ConsoleMessage
+from pytest_textualize.textualize.console import KeyValueMessage
+
+NODE_ID = "tests/test_module.py::TestClass::test_parametrized[value-42]"
+MARKUP = "[b]Causes:[/b] the [pyest.hook.name]pytest_collection[/] hook failed"
+
+
+def legacy_hook_msg(hookname: str, info: str) -> tuple[Text, str, Text]:
+    level = Text("⯀", style="pyest.hook.prefix")
+    hookname_text = Text(hookname.ljust(30), style="pyest.hook.name")
+    msg = Text("hook:".ljust(6), style="pyest.hook.tag").append_text(hookname_text)
+    if info:
+        info_text = Text()
+        if len(render_markup(info).spans) > 0:
+            info_text.append(Text.from_markup(info, end=""))
+        else:
+            info_text.append(Text(info))
+    return msg, info, level
+
+
+def legacy_keyval_msg(key: str, value: str) -> tuple[Text, Text, Text]:
+    validator = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=1)]
+    level_char = TypeAdapter(validator).validate_python("∷")
+    separator = TypeAdapter(validator).validate_python(chr(0x2502))
+    level = Text(level_char.rjust(9), style="#B0D9B1")
+    key_text = Text(key.ljust(20), style="#CBFFA9").append(separator, style="none")
+    value_text = Text()
+    if len(Text.from_markup(value).spans) > 0:
+        Text.from_markup(value)
+    else:
+        Text(value)
+    value_text.append(value)
+    return key_text, value_text, level
+
+
+def legacy_stripped(text: str) -> str:
+    if len(render_markup(text).spans) > 0:
+        return Text.from_markup(text).plain
+    return text
+
+
+def bench(name: str, stmt, number: int) -> float:
+    seconds = min(timeit.repeat(stmt, number=number, repeat=5))
+    per_call = seconds / number * 1_000_000
+    print(f"{name:<32} {per_call:>9.2f} µs/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5_000)
+    number = parser.parse_args().number
+
+    message = ConsoleMessage(MARKUP)
+    cases = [
+        (
+            "hook_msg",
+            lambda: legacy_hook_msg("pytest_itemcollected", NODE_ID),
+            lambda: Textualize.hook_msg("pytest_itemcollected", NODE_ID),
+        ),
+        (
+            "keyval_msg",
+            lambda: legacy_keyval_msg("rootdir", NODE_ID),
+            lambda: KeyValueMessage("rootdir", NODE_ID)(),
+        ),
+        (
+            "ConsoleMessage.stripped",
+            lambda: legacy_stripped(MARKUP),
+            lambda: message.stripped,
+        ),
+    ]
+    for name, legacy_stmt, template_stmt in cases:
+        legacy_cost = bench(f"{name} / legacy", legacy_stmt, number)
+        template_cost = bench(f"{name} / template", template_stmt, number)
+        print(f"{'':<32} {legacy_cost / template_cost:>9.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
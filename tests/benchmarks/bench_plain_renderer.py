@@ -0,0 +1,104 @@
+"""Per-line cost of the rich layout against the plain renderer, for a non-interactive output.
+
+Usage: python tests/benchmarks/bench_plain_renderer.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import timeit
+from io import StringIO
+
+from rich.console import Console
+from rich.text import Text
+
+from pytest_textualize import Verbosity
+from pytest_textualize.textualize.console import key_value_scope
+from pytest_textualize.textualize.logging import TextualizeLogRender
+from pytest_textualize.textualize.logging import VerboseLogRecord
+from pytest_textualize.textualize.logging import VerboseLogger
+from pytest_textualize.textualize.plain import PlainRenderer
+
+WIDTH = 120
+ITEMS = [
+    ("type", "[skip]skip[/]"),
+    ("reason", Text("unconditional skip")),
+    ("marker", Text("@skip", style="#B3AE60")),
+]
+
+
+def make_console() -> Console:
+    console = Console(file=StringIO(), width=WIDTH, force_terminal=False, log_time=False)
+    TextualizeLogRender.override_log_render(console=console)
+    return console
+
+
+def make_record() -> VerboseLogRecord:
+    return VerboseLogRecord(
+        sep=" ",
+        end="\n",
+        level=Verbosity.VERBOSE,
+        highlight=False,
+        markup=True,
+        level_text=Text(" ▶ "),
+        filename=os.path.abspath(__file__),
+        line_no=42,
+        log_locals=False,
+        style=None,
+        renderables=("[#5FA4DE]pytest_itemcollected[/]", Text("tests/test_a.py::test_one")),
+        exc_info=None,
+        justify=None,
+        locals={},
+    )
+
+
+def make_logger() -> VerboseLogger:
+    return VerboseLogger.detached(Verbosity.VERBOSE)
+
+
+def bench(name: str, stmt, number: int) -> float:
+    seconds = min(timeit.repeat(stmt, number=number, repeat=5))
+    per_line = seconds / number * 1_000_000
+    print(f"{name:<32} {per_line:>9.2f} µs/line")
+    return per_line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2_000)
+    number = parser.parse_args().number
+
+    console = make_console()
+    plain_console = make_console()
+    renderer = PlainRenderer(plain_console)
+    setattr(plain_console, "_plain_renderer", renderer)
+    logger = make_logger()
+    record = make_record()
+    title = "[txt.stage_title][b]Collection[/] started at[/] [txt.stage_time]12:00:00[/]"
+
+    cases = [
+        (
+            "log record",
+            lambda: logger.process_record(console, record),
+            lambda: logger.process_record(plain_console, record),
+        ),
+        (
+            "stage rule",
+            lambda: console.rule(title, characters="="),
+            lambda: renderer.write_lines([renderer.rule(title)]),
+        ),
+        (
+            "key values (3 rows)",
+            lambda: console.print(key_value_scope(ITEMS)),
+            lambda: renderer.write_lines(renderer.key_values(ITEMS)),
+        ),
+    ]
+    for name, rich_stmt, plain_stmt in cases:
+        rich_cost = bench(f"{name} / rich", rich_stmt, number)
+        plain_cost = bench(f"{name} / plain", plain_stmt, number)
+        print(f"{'':<32} {rich_cost / plain_cost:>9.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Time and peak memory of the collect-only execution plan, one rich Tree against the streamed lines.
+
+Usage: python tests/benchmarks/bench_plan_tree.py [--items N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.tree import Tree
+
+from pytest_textualize.plugin.helpers.plan_tree import PlanTree
+from pytest_textualize.plugin.helpers.plan_tree import split_nodeid
+
+
+def make_items(count: int) -> list[SimpleNamespace]:
+    items = []
+    for n in range(count):
+        module = f"tests/unit/pkg_{n // 5000}/test_mod_{n // 250}.py"
+        nodeid = f"{module}::TestClass_{n // 50}::test_case[{n}]"
+        items.append(SimpleNamespace(nodeid=nodeid, path=Path(module), obj=None))
+    return items
+
+
+def legacy_tree(console: Console, items: list[SimpleNamespace]) -> None:
+    root = Tree("pytest session", hide_root=True)
+    stack: list[str] = []
+    tree_stack: list[Tree] = []
+    for item in items:
+        collectors, name = split_nodeid(item.nodeid)
+        needed = [f"<{kind}: {value}>" for kind, value in collectors] + [f"<Function: {name}>"]
+        while stack and stack != needed[: len(stack)]:
+            stack.pop()
+            tree_stack.pop()
+        for label in needed[len(stack) :]:
+            parent = tree_stack[-1] if tree_stack else root
+            tree_stack.append(parent.add(label))
+            stack.append(label)
+    console.print(Panel(root, expand=False, title="Execution Plan"))
+
+
+def measure(name: str, func) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<12} {elapsed:>8.2f} s {peak / 2**20:>10.1f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    items = make_items(parser.parse_args().items)
+
+    console = Console(file=open("/dev/null", "w"), width=120, force_terminal=True)
+    measure("rich Tree", lambda: legacy_tree(console, items))
+    measure("PlanTree", lambda: PlanTree(items).stream(console))
+
+
+if __name__ == "__main__":
+    main()
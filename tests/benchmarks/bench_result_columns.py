@@ -0,0 +1,74 @@
+"""Memory and time of recording the phase reports of a large run, one pydantic model per test
+against the parallel columns of ResultColumns.
+
+Usage: python tests/benchmarks/bench_result_columns.py [--tests N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pydantic import BaseModel
+
+from pytest_textualize.model import ResultColumns
+
+
+class TestRecord(BaseModel):
+    nodeid: str
+    outcome: str = "unknown"
+    setup: float = 0.0
+    call: float = 0.0
+    teardown: float = 0.0
+
+
+def make_nodeids(tests: int) -> list[str]:
+    # -- the node ids are kept alive by the items, they are not part of the measure
+    return [f"tests/unit/test_module_{n // 1000}.py::test_case[{n}]" for n in range(tests)]
+
+
+def models(nodeids: list[str]) -> dict[str, TestRecord]:
+    records: dict[str, TestRecord] = {}
+    for nodeid in nodeids:
+        record = records[nodeid] = TestRecord(nodeid=nodeid)
+        record.setup = 0.001
+        record.call, record.outcome = 0.002, "passed"
+        record.teardown = 0.0005
+    return records
+
+
+def columns(nodeids: list[str]) -> ResultColumns:
+    tests = ResultColumns()
+    for nodeid in nodeids:
+        tests.record(nodeid, "setup", "passed", 0.001)
+        tests.record(nodeid, "call", "passed", 0.002)
+        tests.record(nodeid, "teardown", "passed", 0.0005)
+    return tests
+
+
+def measure(name: str, func) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<8} {current / 2**20:>8.2f} MiB {elapsed:>8.3f} s")
+    del result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    nodeids = make_nodeids(args.tests)
+    measure("models", lambda: models(nodeids))
+    measure("columns", lambda: columns(nodeids))
+
+
+if __name__ == "__main__":
+    main()
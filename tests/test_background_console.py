@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+from io import StringIO
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import is_not
+from hamcrest import same_instance
+
+from pytest_textualize.plugin import writer_key
+from pytest_textualize.plugin.tracer import TextualizeTracer
+from pytest_textualize.textualize.writer import BackgroundConsole
+from pytest_textualize.textualize.writer import ConsoleWriter
+
+
+def make_console(writer: ConsoleWriter, file: StringIO, stderr: bool = False) -> BackgroundConsole:
+    return BackgroundConsole(
+        file=file, writer=writer, stderr=stderr, width=80, color_system=None, log_time=False
+    )
+
+
+def test_background_console_keeps_order() -> None:
+    writer = ConsoleWriter(maxsize=8)
+    out = StringIO()
+    console = make_console(writer, out)
+
+    for i in range(200):
+        console.print(f"line {i}")
+    console.rule("end", characters="=")
+    writer.close()
+
+    lines = out.getvalue().splitlines()
+    assert_that(lines[:200], equal_to([f"line {i}" for i in range(200)]), "ordered lines")
+    assert_that(lines[-1].strip("= "), equal_to("end"), "rule is last")
+
+
+def test_background_console_renders_on_writer_thread() -> None:
+    writer = ConsoleWriter()
+    console = make_console(writer, StringIO())
+    threads: list[threading.Thread] = []
+
+    console.defer(lambda: threads.append(threading.current_thread()))
+    writer.flush()
+
+    assert_that(threads[0], is_not(same_instance(threading.current_thread())), "writer thread")
+    writer.close()
+
+
+def test_background_consoles_share_queue_order() -> None:
+    writer = ConsoleWriter()
+    shared = StringIO()
+    stdout = make_console(writer, shared)
+    stderr = make_console(writer, shared, stderr=True)
+
+    stdout.print("first")
+    stderr.print("second")
+    stdout.print("third")
+    writer.close()
+
+    assert_that(shared.getvalue().splitlines(), equal_to(["first", "second", "third"]))
+
+
+def test_closed_writer_writes_inline() -> None:
+    writer = ConsoleWriter()
+    out = StringIO()
+    console = make_console(writer, out)
+    writer.close()
+
+    console.print("after close")
+    assert_that(writer.is_closed, equal_to(True), "is_closed")
+    assert_that(out.getvalue(), equal_to("after close\n"), "written inline")
+
+
+class Drainer:
+    """The writer drains of the tracer, with a console printing at the start of every test."""
+
+    flush_writer = TextualizeTracer.flush_writer
+    pytest_runtest_setup = TextualizeTracer.pytest_runtest_setup
+    pytest_runtest_call = TextualizeTracer.pytest_runtest_call
+    pytest_runtest_teardown = TextualizeTracer.pytest_runtest_teardown
+
+    def pytest_configure(self, config: pytest.Config) -> None:
+        self.config = config
+        config.stash[writer_key] = ConsoleWriter()
+        # -- like the terminal consoles, it writes to the sys.stdout of the moment
+        self.console = BackgroundConsole(writer=config.stash[writer_key], color_system=None)
+
+    def pytest_runtest_logstart(self, nodeid: str) -> None:
+        self.console.print(f"started {nodeid}")
+
+    def pytest_unconfigure(self, config: pytest.Config) -> None:
+        config.stash[writer_key].close()
+
+
+def test_queued_output_is_not_captured_by_the_tests(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        """
+import time
+import pytest
+
+@pytest.mark.parametrize("index", range(20))
+def test_capsys(capsys, index):
+    time.sleep(0.005)
+    assert capsys.readouterr().out == ""
+"""
+    )
+
+    result = pytester.inline_run("-p", "no:cacheprovider", plugins=[Drainer()])
+
+    result.assertoutcome(passed=20)
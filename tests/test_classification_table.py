@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_length
+from hamcrest import same_instance
+
+from pytest_textualize.model import ClassificationTable
+from pytest_textualize.model import NodeIdTable
+from pytest_textualize.model import TestCollectionRecord as CollectionRecord
+
+
+def test_parametrized_items_share_one_record() -> None:
+    table = ClassificationTable()
+    for n in range(1000):
+        table.add_skip(f"tests/test_a.py::TestA::test_b[{n}]", "later", ["skip", "parametrize"])
+    other = table.add_skip("tests/test_a.py::test_c", "later", ["skip"])
+
+    assert_that(table, has_length(1001))
+    assert_that(table.records, has_length(2))
+    assert_that(table.node_ids.parents, equal_to(["tests/test_a.py::TestA", "tests/test_a.py"]))
+    assert_that(table.get("tests/test_a.py::TestA::test_b[7]")[0], same_instance(table.records[0]))
+    assert_that(table.get("tests/test_a.py::test_c"), equal_to([other]))
+    assert_that(other.markers, equal_to(("skip",)))
+
+
+def test_xfail_records_differ_by_their_evaluation() -> None:
+    table = ClassificationTable()
+    first = table.add_xfail("test_x.py::test_a", "known", ValueError, True, False, ["xfail"])
+    same = table.add_xfail("test_x.py::test_b", "known", ValueError, True, False, ["xfail"])
+    strict = table.add_xfail("test_x.py::test_c", "known", ValueError, True, True, ["xfail"])
+
+    assert_that(same, same_instance(first))
+    assert_that(strict.strict, equal_to(True))
+    assert_that(
+        list(table.to_dict()),
+        equal_to(["test_x.py::test_a", "test_x.py::test_b", "test_x.py::test_c"]),
+    )
+
+
+def test_record_tables_share_the_node_ids_and_dump_by_node_id() -> None:
+    record = CollectionRecord()
+    record.skip.add_skip("test_x.py::test_a", "later", ["skip"])
+    record.xfail.add_xfail("test_x.py::test_b", "known", None, True, False, ["xfail"])
+
+    dumped = record.model_dump(include={"skip", "xfail"})
+
+    assert_that(record.skip.node_ids, same_instance(record.xfail.node_ids))
+    assert_that(record.node_ids.parents, equal_to(["test_x.py"]))
+    assert_that(
+        dumped["skip"], equal_to({"test_x.py::test_a": [{"reason": "later", "markers": ("skip",)}]})
+    )
+    assert_that(dumped["xfail"]["test_x.py::test_b"][0]["raises"], equal_to(""))
+
+
+def test_root_items_keep_their_node_id() -> None:
+    node_ids = NodeIdTable()
+
+    assert_that(node_ids.join(*node_ids.split("test_root")), equal_to("test_root"))
+    assert_that(node_ids.join(*node_ids.split("a.py::B::c[1]")), equal_to("a.py::B::c[1]"))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import has_length
+
+from pytest_textualize.plugin.helpers.collapse import CollapseTracker
+from pytest_textualize.plugin.helpers.collapse import CollapsedGroup
+
+
+def make_tracker(threshold: int) -> tuple[CollapseTracker, list[CollapsedGroup]]:
+    groups: list[CollapsedGroup] = []
+    return CollapseTracker(threshold, groups.append), groups
+
+
+def test_family_collapse() -> None:
+    tracker, groups = make_tracker(3)
+
+    shown = [tracker.add(f"test_a.py::test_p[{n}]", skipped=n % 2 == 0) for n in range(10)]
+    shown.append(tracker.add("test_a.py::test_other"))
+    tracker.flush()
+
+    assert_that(shown, equal_to([True] * 3 + [False] * 7 + [False]))
+    assert_that(groups, has_length(2))
+    family = groups[0]
+    assert_that(family.label, equal_to("test_a.py::test_p"))
+    assert_that(family.count, equal_to(7))
+    assert_that(family.skipped, equal_to(3))
+    assert_that(family.first, equal_to("test_a.py::test_p[3]"))
+    assert_that(family.last, equal_to("test_a.py::test_p[9]"))
+    assert_that(family.summary(), contains_string("7 items of test_a.py::test_p collapsed"))
+    assert_that(groups[1].label, equal_to("test_a.py"), "module passed the threshold")
+
+
+def test_module_change_resets_counts() -> None:
+    tracker, groups = make_tracker(2)
+
+    shown = [tracker.add(f"test_{m}.py::test_{n}") for m in "ab" for n in range(3)]
+    tracker.flush()
+
+    assert_that(shown, equal_to([True, True, False, True, True, False]))
+    assert_that([group.label for group in groups], equal_to(["test_a.py", "test_b.py"]))
+
+
+def test_zero_threshold_never_collapses() -> None:
+    tracker, groups = make_tracker(0)
+
+    assert_that(all(tracker.add(f"test_a.py::test_p[{n}]") for n in range(500)), equal_to(True))
+    tracker.flush()
+    assert_that(groups, has_length(0))
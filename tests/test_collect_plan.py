@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_entries
+
+from pytest_textualize.plugin.helpers.classify import MarkClassifier
+from pytest_textualize.plugin.helpers.duration_history import DURATIONS_CACHE_KEY
+from pytest_textualize.plugin.helpers.collect_plan import PlanWriter
+from pytest_textualize.plugin.helpers.collect_plan import historical_durations
+
+SOURCE = """
+import pytest
+
+@pytest.mark.skip(reason="later")
+def test_skipped():
+    pass
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_xfailed():
+    pass
+
+@pytest.mark.parametrize("n", [1, 2])
+def test_run(n):
+    pass
+"""
+
+
+def write_plan(pytester: pytest.Pytester, durations: dict[str, float]) -> tuple[dict, Path]:
+    items, _ = pytester.inline_genitems("--noconftest", pytester.makepyfile(SOURCE))
+    path = pytester.path / "out" / "plan.json"
+    writer = PlanWriter(path, durations)
+    for item, markers, skipped, xfailed in MarkClassifier().classify(items):
+        writer.classified(item.nodeid, markers, skipped, xfailed)
+
+    summary = writer.write(items[1:])
+    return summary, path
+
+
+def test_plan_of_the_selected_items(pytester: pytest.Pytester) -> None:
+    summary, path = write_plan(pytester, {})
+
+    plan = json.loads(path.read_text())
+    assert_that(plan["version"], equal_to(1))
+    assert_that(
+        [record["nodeid"] for record in plan["items"]],
+        equal_to(
+            [
+                "test_plan_of_the_selected_items.py::test_xfailed",
+                "test_plan_of_the_selected_items.py::test_run[1]",
+                "test_plan_of_the_selected_items.py::test_run[2]",
+            ]
+        ),
+    )
+    assert_that(
+        plan["items"][0],
+        has_entries(
+            module="test_plan_of_the_selected_items.py",
+            markers=["xfail"],
+            status="xfail",
+            xfail={"reason": "", "run": True, "strict": True, "raises": "ValueError"},
+            duration=None,
+        ),
+    )
+    assert_that(plan["items"][1], has_entries(markers=["parametrize"], status="run"))
+    assert_that(plan["summary"], equal_to(summary))
+    assert_that((summary["items"], summary["xfail"], summary["skip"]), equal_to((3, 1, 0)))
+
+
+def test_plan_carries_the_history(pytester: pytest.Pytester) -> None:
+    nodeid = "test_plan_carries_the_history.py::test_run[2]"
+    pytester.makeini("[pytest]\n")
+    config = pytester.parseconfigure()
+    config.cache.set(DURATIONS_CACHE_KEY, {nodeid: [1.25, 0.01, 4], "gone.py::test": "bad"})
+
+    durations = historical_durations(config)
+    summary, path = write_plan(pytester, durations)
+
+    assert_that(durations, equal_to({nodeid: 1.25}))
+    assert_that(json.loads(path.read_text())["items"][2]["duration"], equal_to(1.25))
+    assert_that(summary, has_entries(with_duration=1, estimated_duration=1.25))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from argparse import Namespace
+from io import StringIO
+from pathlib import Path
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import has_key
+from hamcrest import is_not
+from rich.console import Console
+
+from pytest_textualize.plugin.helpers.collect_profile import CollectProfile
+from pytest_textualize.plugin.helpers.collect_profile import ProfileEntry
+from pytest_textualize.plugin.helpers.collect_profile import profile_requested
+
+ROOT = Path("/project")
+
+
+class FakePluginManager:
+    imported: list[Path] = []
+
+    def _importconftest(self, conftestpath: Path, *args, **kwargs) -> str:
+        self.imported.append(conftestpath)
+        return f"module {conftestpath}"
+
+
+def make_profile() -> CollectProfile:
+    profile = CollectProfile(ROOT)
+    profile.own_directories = {ROOT: 0.5, ROOT / "a": 1.0, ROOT / "a" / "b": 0.25}
+    for path, seconds, items in [
+        (ROOT / "a" / "test_slow.py", 4.0, 10),
+        (ROOT / "a" / "b" / "test_fast.py", 0.25, 3),
+        (ROOT / "test_top.py", 1.0, 1),
+    ]:
+        profile.modules[path] = ProfileEntry("module", path, seconds, items)
+    conftest = ROOT / "a" / "conftest.py"
+    profile.conftests[conftest] = ProfileEntry("conftest", conftest, 2.0)
+    profile.total = 9.0
+    return profile
+
+
+def test_directories_add_everything_below() -> None:
+    directories = make_profile().directories()
+
+    assert_that(directories[ROOT].seconds, equal_to(9.0))
+    assert_that(directories[ROOT].items, equal_to(14))
+    assert_that(directories[ROOT / "a"].seconds, equal_to(7.5))
+    assert_that(directories[ROOT / "a" / "b"].items, equal_to(3))
+    assert_that(directories, is_not(has_key(Path("/"))))
+
+
+def test_slowest_and_json_export(tmp_path: Path) -> None:
+    profile = make_profile()
+
+    slowest = profile.slowest("module", top=2)
+    profile.dump(tmp_path / "profile.json")
+
+    assert_that([entry.path.name for entry in slowest], equal_to(["test_slow.py", "test_top.py"]))
+    data = json.loads((tmp_path / "profile.json").read_text())
+    assert_that(data["total"], equal_to(9.0))
+    assert_that(data["directories"][0], equal_to({"path": ".", "seconds": 9.0, "items": 14}))
+    assert_that(data["conftests"][0]["path"], equal_to("a/conftest.py"))
+
+
+def test_conftest_imports_are_timed() -> None:
+    profile = CollectProfile(ROOT)
+    pluginmanager = FakePluginManager()
+    conftest = ROOT / "conftest.py"
+
+    profile.install(pluginmanager)
+    start = profile.start_collector()
+    pluginmanager._importconftest(conftest, "prepend", ROOT)
+    pluginmanager._importconftest(conftest, "prepend", ROOT)
+    profile.uninstall()
+
+    assert_that(list(profile.conftests), equal_to([conftest]))
+    assert_that(profile._nested, equal_to(profile.conftests[conftest].seconds))
+    assert_that(pluginmanager.imported, equal_to([conftest, conftest]))
+    assert_that(vars(pluginmanager), is_not(has_key("_importconftest")))
+    assert_that(start > 0, equal_to(True))
+
+
+def test_table() -> None:
+    console = Console(file=StringIO(), width=100)
+
+    console.print(make_profile().table(top=1))
+
+    output = console.file.getvalue()
+    assert_that(output, contains_string("a/test_slow.py"))
+    assert_that(output, contains_string("a/conftest.py"))
+    assert_that(output, is_not(contains_string("test_top.py")))
+
+
+def test_profile_requested() -> None:
+    assert_that(
+        [
+            profile_requested(Namespace(textualize=True, textualize_collect_profile=5)),
+            profile_requested(
+                Namespace(textualize=True, textualize_collect_profile_json="profile.json")
+            ),
+            profile_requested(Namespace(textualize=False, textualize_collect_profile=5)),
+            profile_requested(Namespace(textualize=True, textualize_collect_profile=0)),
+        ],
+        equal_to([True, True, False, False]),
+    )
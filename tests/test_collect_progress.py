@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import is_not
+from hamcrest import same_instance
+from rich.console import Console
+from rich.segment import Segments
+
+from pytest_textualize.model import CollectCounters
+from pytest_textualize.plugin.helpers.collect_progress import CollectProgress
+
+
+def make_counters() -> CollectCounters:
+    counters = CollectCounters()
+    counters.total_collected = 12
+    counters.total_deselected = 2
+    counters.total_skipped = 1
+    return counters
+
+
+def test_counters_are_exported_once_to_the_model() -> None:
+    stats = make_counters().to_stats()
+
+    assert_that(stats.model_dump(by_alias=True)["collected"], equal_to(12))
+    assert_that((stats.total_deselected, stats.selected), equal_to((2, 10)))
+
+
+def test_progress_renders_only_the_changed_parts() -> None:
+    console = Console(file=StringIO(), width=120, color_system=None)
+    progress = CollectProgress(console)
+    counters = make_counters()
+
+    first = progress.segments(counters, final=False)
+    counters.total_collected += 1
+    second = progress.segments(counters, final=True, prefix="▪")
+
+    console.print(Segments(second))
+    text = console.file.getvalue()
+    assert_that(text, equal_to("▪collected 13 items  / 2 deselected  / 1 skipped  / 11 selected"))
+    assert_that(second[2], is_not(same_instance(first[2])))
+    assert_that(second[4], is_(same_instance(first[4])))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import math
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import close_to
+from hamcrest import contains_string
+from hamcrest import equal_to
+from rich.console import Console
+
+from pytest_textualize.model import ResultColumns
+from pytest_textualize.plugin.helpers.duration_history import DURATIONS_CACHE_KEY
+from pytest_textualize.plugin.helpers.duration_history import DurationHistory
+from pytest_textualize.plugin.helpers.duration_history import regressions_table
+
+
+class MemoryCache(dict):
+    def set(self, key: str, value: object) -> None:
+        self[key] = value
+
+
+def session(durations: dict[str, float], outcome: str = "passed") -> ResultColumns:
+    tests = ResultColumns()
+    for nodeid, duration in durations.items():
+        tests.record(nodeid, "setup", "passed", 0.0)
+        tests.record(nodeid, "call", outcome, duration)
+        tests.record(nodeid, "teardown", "passed", 0.0)
+    return tests
+
+
+def test_moving_average_and_variance() -> None:
+    history = DurationHistory(MemoryCache(), Path("."), alpha=0.5)
+
+    for duration in (1.0, 3.0, 3.0):
+        history.update("test_a.py::test_a", duration)
+
+    mean, variance, runs = history.entries["test_a.py::test_a"]
+    assert_that(mean, equal_to(2.5))
+    assert_that(variance, equal_to(0.75))
+    assert_that(runs, equal_to(3))
+
+
+def test_history_is_saved_once_and_flags_regressions(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_a="", test_b="")
+    config = pytester.parseconfigure()
+    stable = {"test_a.py::test_a": 0.10, "test_b.py::test_b": 0.50, "gone.py::test_c": 1.0}
+    for run in range(4):
+        history = DurationHistory.from_config(config)
+        history.record(session({nodeid: value + run * 0.001 for nodeid, value in stable.items()}))
+        history.save()
+
+    history = DurationHistory.from_config(config)
+    slow = session({"test_a.py::test_a": 0.40, "test_b.py::test_b": 0.51})
+    regressions = history.regressions(slow, sigma=3.0)
+    failed = history.regressions(session({"test_a.py::test_a": 0.40}, "failed"), sigma=3.0)
+
+    stored = config.cache.get(DURATIONS_CACHE_KEY, {})
+    assert_that(
+        sorted(stored), equal_to(["gone.py::test_c", "test_a.py::test_a", "test_b.py::test_b"])
+    )
+    assert_that(stored["test_a.py::test_a"][2], equal_to(4))
+    assert_that([regression.nodeid for regression in regressions], equal_to(["test_a.py::test_a"]))
+    assert_that(regressions[0].mean, close_to(0.102, 0.001))
+    assert_that(failed, equal_to([]))
+
+
+def test_deleted_modules_are_dropped(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(test_a="")
+    config = pytester.parseconfigure()
+    config.cache.set(DURATIONS_CACHE_KEY, {"gone.py::test_c": [1.0, 0.0, 5], "bad": 1.0})
+
+    history = DurationHistory.from_config(config)
+    history.record(session({"test_a.py::test_a": 0.25}))
+    history.save()
+
+    assert_that(
+        config.cache.get(DURATIONS_CACHE_KEY, {}), equal_to({"test_a.py::test_a": [0.25, 0.0, 1]})
+    )
+
+
+def test_history_can_be_disabled(pytester: pytest.Pytester) -> None:
+    config = pytester.parseconfigure(
+        "-p", "pytest_textualize.plugin.plugin", "--no-duration-history"
+    )
+
+    assert_that(DurationHistory.from_config(config), equal_to(None))
+
+
+def test_regressions_table() -> None:
+    history = DurationHistory(
+        MemoryCache({DURATIONS_CACHE_KEY: {"test_a.py::test_a": [0.1, 0.0, 5]}}), Path(".")
+    )
+    regressions = history.regressions(session({"test_a.py::test_a": 0.3}), sigma=3.0)
+    console = Console(file=StringIO(), width=120)
+
+    console.print(regressions_table(regressions, 3.0))
+
+    assert_that(math.isinf(regressions[0].sigmas), equal_to(True))
+    assert_that(console.file.getvalue(), contains_string("x3.0"))
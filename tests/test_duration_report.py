@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import random
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from rich.console import Console
+
+from pytest_textualize.model import ResultColumns
+from pytest_textualize.plugin.helpers.duration_report import DurationAnalytics
+from pytest_textualize.plugin.helpers.duration_report import log_histogram
+from pytest_textualize.plugin.helpers.duration_report import module_durations
+from pytest_textualize.plugin.helpers.duration_report import percentile
+
+
+def test_heaps_keep_the_slowest_of_each_phase() -> None:
+    analytics = DurationAnalytics(top=3)
+    durations = [n / 100 for n in range(100)]
+    random.Random(7).shuffle(durations)
+    for n, duration in enumerate(durations):
+        analytics.add(f"test_a.py::test_{n}", "call", duration)
+    analytics.add("test_a.py::test_0", "setup", 0.5)
+
+    assert_that([row.duration for row in analytics.slowest("call")], equal_to([0.99, 0.98, 0.97]))
+    assert_that([row.nodeid for row in analytics.slowest("setup")], equal_to(["test_a.py::test_0"]))
+    assert_that(analytics.slowest("teardown"), equal_to([]))
+
+
+def test_percentiles_per_module() -> None:
+    tests = ResultColumns()
+    for n in range(1, 101):
+        tests.record(f"test_a.py::test_{n}", "call", "passed", n / 1000)
+    tests.record("sub/test_b.py::TestB::test_b", "setup", "passed", 5.0)
+    tests.record("sub/test_b.py::TestB::test_b", "call", "passed", 2.0)
+
+    rows = module_durations(tests)
+
+    assert_that([row.module for row in rows], equal_to(["sub/test_b.py", "test_a.py"]))
+    assert_that(rows[0].percentiles, equal_to((7.0, 7.0, 7.0)))
+    assert_that((rows[1].tests, rows[1].percentiles), equal_to((100, (0.05, 0.09, 0.099))))
+    assert_that(rows[1].max, equal_to(0.1))
+    assert_that(percentile([], 50), equal_to(0.0))
+
+
+def test_histogram_buckets_are_decades() -> None:
+    buckets = log_histogram([0.0, 0.00005, 0.0002, 0.003, 0.003, 0.5, 1.0, 12.0, 500.0])
+
+    assert_that(
+        buckets,
+        equal_to(
+            [
+                ("< 0.1ms", 2),
+                ("0.1ms - 1.0ms", 1),
+                ("1.0ms - 10.0ms", 2),
+                ("10.0ms - 100.0ms", 0),
+                ("100.0ms - 1.00s", 1),
+                ("1.00s - 10.00s", 1),
+                (">= 10.00s", 2),
+            ]
+        ),
+    )
+
+
+def test_renderable() -> None:
+    tests = ResultColumns()
+    analytics = DurationAnalytics(top=5)
+    for when, duration in [("setup", 0.001), ("call", 0.25), ("teardown", 0.002)]:
+        tests.record("test_a.py::test_a", when, "passed", duration)
+        analytics.add("test_a.py::test_a", when, duration)
+    console = Console(file=StringIO(), width=120)
+
+    console.print(analytics.renderable(tests))
+
+    output = console.file.getvalue()
+    assert_that(output, contains_string("5 slowest per phase"))
+    assert_that(output, contains_string("250.0ms"))
+    assert_that(output, contains_string("100.0ms - 1.00s"))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import is_not
+from hamcrest import none
+from hamcrest import same_instance
+from rich.console import Console
+from rich.theme import Theme
+
+from pytest_textualize.model import ErrorInfo
+
+STYLES = {"scope.key_ni": "", "pyest.hook.name": ""}
+
+
+def collect_error(pytester: pytest.Pytester) -> ErrorInfo:
+    path = pytester.makepyfile(test_broken="import os\n\n\nraise RuntimeError('broken module')\n")
+    module = pytester.getpathnode(path)
+    report = module.ihook.pytest_make_collect_report(collector=module)
+    assert report.failed
+    excinfo = pytest.raises(RuntimeError, module.collect)
+    return ErrorInfo.from_exception_info("pytest_exception_interact", module, excinfo, report)
+
+
+def test_error_info_keeps_the_facts(pytester: pytest.Pytester) -> None:
+    error = collect_error(pytester)
+
+    assert_that(error.nodeid, equal_to("test_broken.py"))
+    assert_that((error.when, error.node_type), equal_to(("collect", "Module")))
+    assert_that((error.exception_type, error.message), equal_to(("RuntimeError", "broken module")))
+    assert_that((error.relpath, error.lineno), equal_to(("test_broken.py", 4)))
+    assert_that(error.statement, equal_to("raise RuntimeError('broken module')"))
+
+
+def test_renderables_are_built_once_on_demand(pytester: pytest.Pytester) -> None:
+    error = collect_error(pytester)
+    assert_that("rich_report" in error.__dict__ or "error_syntax" in error.__dict__, is_(False))
+
+    panel = error.rich_report
+    syntax = error.error_syntax
+
+    assert_that(error.rich_report, same_instance(panel))
+    assert_that(error.error_syntax, same_instance(syntax))
+    assert_that(syntax, is_not(none()))
+    console = Console(width=140, record=True, color_system=None, theme=Theme(STYLES))
+    console.print(panel)
+    assert_that(console.export_text(), contains_string("Statement ↦ raise RuntimeError"))
+
+
+def test_error_outside_a_file_has_no_syntax() -> None:
+    error = ErrorInfo(nodeid="test_a.py", exception_type="ValueError", message="bad")
+
+    assert_that(error.error_syntax, is_(none()))
+    assert_that("syntax_theme" in error.model_dump(), is_(False))
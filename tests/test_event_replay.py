@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import is_not
+
+from pytest_textualize import Verbosity
+from pytest_textualize.textualize.events import CollectFinish
+from pytest_textualize.textualize.events import EventRecorder
+from pytest_textualize.textualize.events import ItemCollected
+from pytest_textualize.textualize.events import LogMessage
+from pytest_textualize.textualize.events import RunTestReport
+from pytest_textualize.textualize.events import SessionFinish
+from pytest_textualize.textualize.events import SessionStart
+from pytest_textualize.textualize.events import iter_events
+from pytest_textualize.textualize.replay import EventReplay
+from pytest_textualize.textualize.replay import replay_console
+
+
+def record_session() -> list[str]:
+    file = StringIO()
+    recorder = EventRecorder(file)
+    recorder.emit(SessionStart, "10:00:00", "/project", 0, 80)
+    recorder.emit(
+        LogMessage, 1, 0, None, "tracer.py", 10, ["hook: [b]pytest_itemcollected[/]"], None
+    )
+    recorder.emit(ItemCollected, "test_a.py::test_one", ["skip"], "not now", None)
+    recorder.emit(CollectFinish, "10:00:01", 1, 0, 0, 1, 0)
+    recorder.emit(RunTestReport, "test_a.py::test_one", "setup", "skipped", 0.0, "not now")
+    recorder.emit(RunTestReport, "test_a.py::test_two", "call", "failed", 0.1, "assert 0")
+    recorder.emit(SessionFinish, "10:00:02", 1)
+    return file.getvalue().splitlines()
+
+
+def replay(verbosity: Verbosity) -> str:
+    console = replay_console(80, "plain")
+    console.file = StringIO()
+    EventReplay(console, verbosity).replay(iter_events(record_session()))
+    return console.file.getvalue()
+
+
+def test_events_round_trip() -> None:
+    events = list(iter_events(record_session()))
+
+    assert_that(len(events), equal_to(7), "events count")
+    assert_that(events[2].xfail, equal_to(None), "null fields")
+    assert_that(events[2].markers, equal_to(["skip"]), "list fields")
+
+
+def test_replay_normal_verbosity() -> None:
+    output = replay(Verbosity.NORMAL)
+
+    assert_that(output, contains_string("collected 1 item / 1 skipped"))
+    assert_that(output, contains_string(" test_a.py::test_two "))
+    assert_that(output, contains_string("assert 0"))
+    assert_that(output, contains_string(" 1 skipped, 1 failed in "))
+    assert_that(output, is_not(contains_string("pytest_itemcollected")))
+
+
+def test_replay_verbose_renders_logs() -> None:
+    output = replay(Verbosity.VERBOSE)
+
+    assert_that(output, contains_string("hook: pytest_itemcollected"))
+    assert_that(output, contains_string("reason     │not now"))
+    assert_that(output, contains_string("test_a.py::test_one SKIPPED"))
+
+
+def test_replay_routes_the_errors() -> None:
+    file = StringIO()
+    recorder = EventRecorder(file)
+    recorder.emit(SessionStart, "10:00:00", "/project", 0, 80)
+    recorder.emit(LogMessage, 0, 40, None, "error_tracer.py", 223, ["Error message ⟶ boom"], None)
+    lines = file.getvalue().splitlines()
+    console = replay_console(80, "plain")
+    console.file = StringIO()
+    error_console = replay_console(80, "plain", stderr=True)
+    error_console.file = StringIO()
+
+    EventReplay(console, Verbosity.VERBOSE, error_console).replay(iter_events(lines))
+    single = replay_console(80, "plain")
+    single.file = StringIO()
+    EventReplay(single, Verbosity.VERBOSE).replay(iter_events(lines))
+
+    assert_that(error_console.file.getvalue(), contains_string("Error message ⟶ boom"))
+    assert_that(console.file.getvalue(), is_not(contains_string("Error message")))
+    # -- without a stderr console, the errors are written in order with the rest of the replay
+    assert_that(single.file.getvalue(), contains_string("Error message ⟶ boom"))
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import less_than_or_equal_to
+from rich.console import Console
+
+from pytest_textualize.plugin.helpers.execution_dashboard import ExecutionDashboard
+
+
+class CountingDashboard(ExecutionDashboard):
+    frames = 0
+
+    def draw(self, now: float | None = None) -> None:
+        self.frames += 1
+        super().draw(now)
+
+
+def make_console() -> Console:
+    return Console(file=StringIO(), width=200, force_terminal=True, color_system=None)
+
+
+def run_tests(dashboard: ExecutionDashboard, count: int) -> None:
+    for i in range(count):
+        nodeid = f"tests/test_mod_{i // 1000}.py::test_{i}"
+        dashboard.test_started(nodeid)
+        dashboard.test_phase(None, 0.0, finished=False)
+        dashboard.test_phase("failed" if i % 100 == 0 else "passed", 0.0, finished=False)
+        dashboard.test_phase(None, 0.0, finished=True)
+
+
+def test_dashboard_redraws_at_frame_rate() -> None:
+    dashboard = CountingDashboard(make_console(), total=20_000, fps=1)
+
+    run_tests(dashboard, 20_000)
+
+    assert_that(dashboard.frames, less_than_or_equal_to(5), "frames")
+    assert_that(dashboard.completed, equal_to(20_000), "completed")
+    assert_that(dashboard.counts["failed"], equal_to(200), "failed")
+
+
+def test_dashboard_final_frame() -> None:
+    console = make_console()
+    dashboard = ExecutionDashboard(console, total=3)
+
+    run_tests(dashboard, 3)
+    dashboard.finish()
+
+    last_line = console.file.getvalue().splitlines()[-1]
+    assert_that(last_line, contains_string("3/3 / 2 passed / 1 failed"))
+    assert_that(last_line, contains_string("tests/test_mod_0.py"))
+
+
+def test_dashboard_counts_the_finished_tests() -> None:
+    dashboard = ExecutionDashboard(make_console(), total=2)
+
+    dashboard.test_started("tests/test_a.py::test_a")
+    dashboard.test_phase("passed", 0.0, finished=False)
+
+    assert_that(dashboard.completed, equal_to(0), "completed")
+    assert_that(dashboard.counts["passed"], equal_to(0), "passed")
+    dashboard.test_phase(None, 0.0, finished=True)
+    assert_that((dashboard.completed, dashboard.counts["passed"]), equal_to((1, 1)))
+
+
+def test_dashboard_line_is_erased_before_other_output() -> None:
+    console = make_console()
+    error_console = Console(file=StringIO(), width=200, force_terminal=True, color_system=None)
+    dashboard = ExecutionDashboard(console, total=3, error_console=error_console)
+
+    dashboard.draw()
+    console.print("⯀ hook: pytest_exception_interact")
+    dashboard.draw()
+    error_console.print("⯈ Error message")
+    run_tests(dashboard, 1)
+    dashboard.finish()
+
+    # -- what is left on every line of the terminal after its erasures
+    lines = [line.split("\x1b[2K\x1b[1G")[-1] for line in console.file.getvalue().splitlines()]
+    assert_that(lines[0], equal_to("⯀ hook: pytest_exception_interact"))
+    assert_that(lines[1], contains_string("1/3 / 1 failed"))
+    # -- the frame drawn on the line of stdout is erased through stderr
+    assert_that(error_console.file.getvalue(), equal_to("\x1b[2K\x1b[1G⯈ Error message\n"))
+    assert_that((console._render_hooks, error_console._render_hooks), equal_to(([], [])))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import greater_than_or_equal_to
+from hamcrest import less_than
+from rich.console import Console
+
+from pytest_textualize.plugin.helpers.fixture_profile import FixtureProfile
+from pytest_textualize.plugin.helpers.fixture_profile import FixtureStats
+from pytest_textualize.plugin.services.fixture_profile import FixtureProfilerService
+
+
+class Profiler:
+    """The hooks of the service, without the settings of the textualize plugin."""
+
+    pytest_fixture_setup = FixtureProfilerService.pytest_fixture_setup
+    pytest_fixture_post_finalizer = FixtureProfilerService.pytest_fixture_post_finalizer
+
+    def __init__(self) -> None:
+        self.profile = FixtureProfile()
+
+
+def test_setups_and_teardowns_are_charged_to_their_fixture(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_fixtures="""
+import time
+import pytest
+
+@pytest.fixture(scope="module")
+def db():
+    time.sleep(0.05)
+    yield 1
+    time.sleep(0.02)
+
+@pytest.fixture
+def conn(db):
+    yield db
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("broken")
+
+@pytest.mark.parametrize("index", range(3))
+def test_conn(conn, index):
+    pass
+
+def test_broken(broken):
+    pass
+"""
+    )
+    profiler = Profiler()
+
+    pytester.inline_run("-p", "no:cacheprovider", plugins=[profiler])
+
+    stats = {stats.name: stats for stats in profiler.profile.stats.values()}
+    # -- the parametrized index is not a fixture of the tests
+    assert_that(
+        {name: (stats[name].scope, stats[name].setups, stats[name].teardowns) for name in stats},
+        equal_to(
+            {
+                "db": ("module", 1, 1),
+                "conn": ("function", 3, 3),
+                "broken": ("function", 1, 0),
+            }
+        ),
+    )
+    assert_that(stats["db"].setup_ns, greater_than_or_equal_to(50_000_000))
+    assert_that(stats["db"].teardown_ns, greater_than_or_equal_to(20_000_000))
+    # -- the setup of db is not charged to conn, which requested it
+    assert_that(stats["conn"].setup_ns, less_than(25_000_000))
+    assert_that(stats["conn"].teardown_ns, less_than(10_000_000))
+
+
+def test_candidates_and_table() -> None:
+    profile = FixtureProfile()
+    for name, scope, setups, cost_ns in (
+        ("client", "function", 20, 4_000_000),
+        ("tmp", "function", 20, 10_000),
+        ("server", "session", 1, 900_000_000),
+        ("once", "function", 1, 50_000_000),
+    ):
+        stats = profile.stats[name] = FixtureStats(name, "tests/conftest.py", scope)
+        stats.setups = stats.teardowns = setups
+        stats.setup_ns = setups * cost_ns
+
+    console = Console(file=StringIO(), width=160)
+    console.print(profile.renderable(3))
+
+    assert_that(
+        [stats.name for stats in profile.slowest(3)], equal_to(["server", "client", "once"])
+    )
+    assert_that([stats.name for stats in profile.candidates()], equal_to(["client"]))
+    assert_that(console.file.getvalue(), contains_string("tests/conftest.py::client"))
+    assert_that(console.file.getvalue(), contains_string("candidates for a wider scope"))
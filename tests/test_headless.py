@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import is_
+from rich._null_file import NullFile
+from rich.console import Console
+
+from pytest_textualize import Textualize
+from pytest_textualize import Verbosity
+from pytest_textualize.textualize.logging import VerboseLogger
+
+
+class FrameCountingLogger(VerboseLogger):
+    frames = 0
+
+    def _caller_frame_info(self, offset, *args):
+        self.frames += 1
+        return super()._caller_frame_info(offset + 1, *args)
+
+
+def make_logger() -> FrameCountingLogger:
+    logger = FrameCountingLogger.detached(Verbosity.DEBUG)
+    logger.add_console("<stdout>", Console(file=NullFile()))
+    logger.add_console("<stderr>", Console(file=NullFile(), stderr=True))
+    return logger
+
+
+def test_null_consoles_skip_the_records() -> None:
+    logger = make_logger()
+
+    logger.warning("discarded")
+    logger.debug("discarded")
+
+    assert_that(logger.is_headless, is_(True))
+    assert_that(logger.wants(Verbosity.QUIET), is_(False))
+    assert_that(logger.frames, equal_to(0), "no caller frame captured")
+
+
+def test_headless_logger_still_feeds_the_sinks() -> None:
+    logger = make_logger()
+    sink = Console(file=StringIO(), width=100)
+    logger.add_sink("<log-file>", sink, Verbosity.VERBOSE)
+
+    logger.warning("kept")
+    logger.debug("too verbose for the sink")
+
+    assert_that(logger.wants(Verbosity.VERBOSE), is_(True))
+    assert_that(logger.frames, equal_to(1))
+    assert_that(sink.file.getvalue(), contains_string("kept"))
+
+
+def test_headless_is_recomputed_with_the_consoles() -> None:
+    logger = make_logger()
+    logger.add_console("<buffer>", Console(file=StringIO()))
+
+    assert_that(logger.is_headless, is_(False))
+    logger.remove_console("<buffer>")
+    assert_that(logger.is_headless, is_(True))
+    assert_that(Textualize.is_null_console(logger.consoles["<stdout>"]), is_(True))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import none
+from hamcrest import same_instance
+
+from pytest_textualize.plugin.helpers.classify import MarkClassifier
+from pytest_textualize.plugin.helpers.classify import mark_signature
+
+SOURCE = """
+import sys
+import pytest
+
+@pytest.mark.xfail(reason="family", strict=False)
+@pytest.mark.parametrize("n", range(50))
+def test_family(n): pass
+
+@pytest.mark.skipif("sys.platform != 'nowhere'", reason="string")
+@pytest.mark.parametrize("n", range(3))
+def test_string_condition(n): pass
+
+@pytest.mark.skipif(False, reason="never")
+def test_false_condition(): pass
+
+def test_plain(): pass
+"""
+
+
+def test_evaluates_once_per_signature(pytester: pytest.Pytester) -> None:
+    items = pytester.getitems(SOURCE)
+    classifier = MarkClassifier()
+
+    classified = classifier.classify(items)
+
+    assert_that([record.item for record in classified], equal_to(items))
+    assert_that(classifier.evaluations, equal_to(4))
+    family = [record for record in classified if record.item.originalname == "test_family"]
+    assert_that(family[0].xfailed, same_instance(family[-1].xfailed))
+    assert_that(family[0].xfailed.reason, equal_to("family"))
+    assert_that(family[0].markers, equal_to(["parametrize", "xfail"]))
+
+
+def test_string_conditions_are_evaluated_against_the_module(pytester: pytest.Pytester) -> None:
+    items = pytester.getitems(SOURCE)
+
+    classified = {record.item.name: record for record in MarkClassifier().classify(items)}
+
+    assert_that(mark_signature(classified["test_string_condition[0]"].item).dynamic, is_(True))
+    assert_that(classified["test_string_condition[2]"].skipped.reason, equal_to("string"))
+    assert_that(classified["test_false_condition"].skipped, is_(none()))
+    assert_that(classified["test_plain"].skipped, is_(none()))
+
+
+def test_skip_reason_is_not_a_condition(pytester: pytest.Pytester) -> None:
+    items = pytester.getitems(
+        """
+import pytest
+
+@pytest.mark.skip("not now")
+def test_skip(): pass
+
+@pytest.mark.xfail("sys.platform == 'nowhere'", reason="string")
+def test_xfail(): pass
+"""
+    )
+
+    signatures = [mark_signature(item) for item in items]
+
+    assert_that([signature.dynamic for signature in signatures], equal_to([False, True]))
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import is_not
+from hamcrest import same_instance
+from rich.text import Span
+from rich.text import Text
+
+from pytest_textualize import Textualize
+from pytest_textualize.textualize.console import KeyValueMessage
+from pytest_textualize.textualize.templates import MessageTemplate
+from pytest_textualize.textualize.templates import Slot
+from pytest_textualize.textualize.templates import is_markup
+from pytest_textualize.textualize.templates import strip_markup
+
+
+def test_hook_msg_matches_text_building() -> None:
+    msg, info, level = Textualize.hook_msg("pytest_collection", info="tests/test_a.py")
+
+    expected = Text("hook: ", style="pyest.hook.tag").append_text(
+        Text("pytest_collection".ljust(30), style="pyest.hook.name")
+    )
+    assert_that(msg, equal_to(expected))
+    assert_that(msg.spans, equal_to(expected.spans))
+    assert_that(info, equal_to("tests/test_a.py"))
+    assert_that(level, equal_to(Text("⯀", style="pyest.hook.prefix")))
+
+
+def test_keyval_msg_matches_text_building() -> None:
+    key, value, level = KeyValueMessage("rootdir", "/tmp")()
+
+    expected = Text("rootdir".ljust(20), style="#CBFFA9").append(chr(0x2502), style="none")
+    assert_that(key, equal_to(expected))
+    assert_that(key.spans, equal_to(expected.spans))
+    assert_that(value.plain, equal_to("/tmp"))
+    assert_that(level, equal_to(Text("∷".rjust(9), style="#B0D9B1")))
+
+
+def test_template_overflowing_slot() -> None:
+    template = MessageTemplate(("[", None), (Slot("name", width=3), "bold"), ("]", "dim"))
+
+    text = template.render(name="toolong")
+
+    assert_that(text.plain, equal_to("[toolong]"))
+    assert_that(text.spans, equal_to([Span(1, 8, "bold"), Span(8, 9, "dim")]))
+    assert_that(template.render(name="ab").spans, equal_to([Span(1, 4, "bold"), Span(4, 5, "dim")]))
+
+
+def test_rendered_texts_are_independent() -> None:
+    template = MessageTemplate(("static", "bold"))
+
+    first, second = template.render(), template.render()
+    first.append(" changed")
+
+    assert_that(first, is_not(same_instance(second)))
+    assert_that(second.plain, equal_to("static"))
+    assert_that(second.spans, equal_to([Span(0, 6, "bold")]))
+
+
+def test_markup_helpers() -> None:
+    assert_that(is_markup("[b]bold[/b]"), is_(True))
+    assert_that(is_markup("tests/test_a.py::test_p[1]"), is_(False))
+    assert_that(is_markup(""), is_(False))
+    assert_that(strip_markup("[b]bold[/b] text"), equal_to("bold text"))
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import none
+from rich.console import Console
+from rich.text import Text
+
+from pytest_textualize.model import CollectStats
+from pytest_textualize.textualize.console import key_value_scope
+from pytest_textualize.textualize.plain import PlainRenderer
+from pytest_textualize.textualize.plain import plain_text
+
+parameterize = pytest.mark.parametrize
+
+
+def make_console() -> Console:
+    return Console(file=StringIO(), width=80, color_system=None, force_terminal=False)
+
+
+def rich_lines(console: Console) -> list[str]:
+    return [line.rstrip() for line in console.file.getvalue().splitlines()]
+
+
+@parameterize("title", ["[b]Session[/] started at [i]12:00:00[/]", "odd title", ""])
+def test_rule_matches_rich(title: str) -> None:
+    console = make_console()
+    console.rule(title, characters="=")
+
+    assert_that(PlainRenderer(console).rule(title), equal_to(rich_lines(console)[0]))
+
+
+def test_key_values_match_rich() -> None:
+    items = [
+        ("type", "[skip]skip[/]"),
+        ("reason", Text("unconditional skip")),
+        ("run", "True"),
+    ]
+    console = make_console()
+    console.print(key_value_scope(items))
+
+    lines = PlainRenderer(console).key_values(items)
+    assert_that(lines, equal_to(rich_lines(console)))
+
+
+def test_plain_text_rejects_layout_renderables() -> None:
+    assert_that(plain_text("[b]bold[/]"), equal_to("bold"))
+    assert_that(plain_text(Text("text")), equal_to("text"))
+    assert_that(plain_text(key_value_scope([])), none())
+
+
+def test_collect_progress() -> None:
+    stats = CollectStats(collected=12, errors=1, deselected=2)
+
+    assert_that(
+        PlainRenderer.collect_progress(stats, final=True),
+        equal_to("collected 12 items / 1 error / 2 deselected / 10 selected"),
+    )
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from rich.console import Console
+
+from pytest_textualize.plugin.helpers.plan_tree import PlanTree
+from pytest_textualize.plugin.helpers.plan_tree import split_nodeid
+
+
+@pytest.fixture
+def items(pytester: pytest.Pytester) -> list[pytest.Item]:
+    pytester.mkpydir("pkg")
+    pytester.makepyfile(
+        **{
+            "pkg/test_one": """
+                import pytest
+
+                @pytest.mark.parametrize("n", range(3))
+                def test_p(n):
+                    '''Checks n.'''
+
+                class TestGroup:
+                    def test_a(self): pass
+                """,
+            "plain/test_two": "def test_b(): pass",
+        }
+    )
+    items, _ = pytester.inline_genitems()
+    return items
+
+
+def plain_lines(tree: PlanTree) -> list[str]:
+    return ["".join(segment.text for segment in line) for line in tree.lines()]
+
+
+def test_tree_lines(items: list[pytest.Item]) -> None:
+    tree = PlanTree(items)
+
+    assert_that(
+        plain_lines(tree),
+        equal_to(
+            [
+                "<Package: pkg> 4 items",
+                "└── <Module: test_one.py> 4 items",
+                "    ├── <Function: test_p[0]>  Checks n.",
+                "    ├── <Function: test_p[1]>  Checks n.",
+                "    ├── <Function: test_p[2]>  Checks n.",
+                "    └── <Class: TestGroup> 1 item",
+                "        └── <Function: test_a>",
+                "<Dir: plain> 1 item",
+                "└── <Module: test_two.py> 1 item",
+                "    └── <Function: test_b>",
+            ]
+        ),
+    )
+
+
+def test_depth_limit_keeps_the_counts(items: list[pytest.Item]) -> None:
+    tree = PlanTree(items, max_depth=1)
+
+    assert_that(plain_lines(tree), equal_to(["<Package: pkg> 4 items", "<Dir: plain> 1 item"]))
+
+
+def test_reordered_items_start_new_branches(items: list[pytest.Item]) -> None:
+    tree = PlanTree([items[0], items[-1], items[1]], max_depth=2)
+
+    assert_that(
+        plain_lines(tree),
+        equal_to(
+            [
+                "<Package: pkg> 1 item",
+                "└── <Module: test_one.py> 1 item",
+                "<Dir: plain> 1 item",
+                "└── <Module: test_two.py> 1 item",
+                "<Package: pkg> 1 item",
+                "└── <Module: test_one.py> 1 item",
+            ]
+        ),
+    )
+
+
+def test_stream_writes_chunks(items: list[pytest.Item]) -> None:
+    console = Console(file=StringIO(), width=80)
+
+    PlanTree(items * 300).stream(console)
+
+    output = console.file.getvalue()
+    assert_that(output, contains_string("Execution Plan"))
+    assert_that(output.count("<Function: test_b>"), equal_to(300))
+
+
+def test_split_nodeid() -> None:
+    collectors, name = split_nodeid("../tests/test_a.py::TestA::test_x[1-2]")
+
+    assert_that(
+        collectors, equal_to([("Dir", "tests"), ("Module", "test_a.py"), ("Class", "TestA")])
+    )
+    assert_that(name, equal_to("test_x[1-2]"))
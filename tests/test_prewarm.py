@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+from _pytest.assertion.rewrite import _read_pyc
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import is_not
+from hamcrest import none
+
+from pytest_textualize.plugin.helpers import prewarm
+from pytest_textualize.plugin.helpers.prewarm import BytecodePrewarmer
+from pytest_textualize.plugin.helpers.prewarm import is_fresh
+from pytest_textualize.plugin.helpers.prewarm import pyc_path
+
+
+def make_tree(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(
+        test_one="def test_one():\n    assert 1 + 1 == 2\n",
+        test_two="def test_two():\n    assert [1] == [1]\n",
+        helper="VALUE = 1\n",
+        conftest="",
+    )
+    pytester.mkdir("build").joinpath("test_skipped.py").write_text("")
+    pytester.makeini("[pytest]\nnorecursedirs = build\n")
+
+
+@pytest.mark.parametrize("workers", [1, 2], ids=["in-process", "pool"])
+def test_prewarm_writes_the_rewritten_pycs(pytester: pytest.Pytester, workers: int) -> None:
+    make_tree(pytester)
+    config = pytester.parseconfig("--assert=rewrite", pytester.path)
+    prewarmer = BytecodePrewarmer(config, workers=workers)
+
+    sources = prewarmer.find_sources()
+    first = prewarmer.run(sources)
+    second = prewarmer.run(sources)
+
+    names = sorted(path.name for path in sources)
+    assert_that(names, equal_to(["conftest.py", "test_one.py", "test_two.py"]))
+    assert_that((first.compiled, first.fresh, first.failed), equal_to((3, 0, 0)))
+    assert_that((second.compiled, second.fresh), equal_to((0, 3)))
+    pyc = pyc_path(pytester.path / "test_one.py", rewrite=True)
+    assert_that(pyc.name, contains_string("-pytest-"))
+    assert_that(_read_pyc(pytester.path / "test_one.py", pyc), is_not(none()))
+
+
+def test_prewarm_without_the_rewrite_api(
+    pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    make_tree(pytester)
+    monkeypatch.setattr(prewarm, "rewrite_supported", lambda: False)
+    config = pytester.parseconfig("--assert=rewrite", pytester.path)
+    prewarmer = BytecodePrewarmer(config, workers=1)
+    source = pytester.path / "test_one.py"
+
+    report = prewarmer.run([source])
+
+    assert_that(prewarmer.rewrite, equal_to(False))
+    assert_that((report.compiled, report.failed), equal_to((1, 0)))
+    assert_that(is_fresh(source, pyc_path(source, rewrite=False)), equal_to(True))
+
+
+def test_changed_and_broken_sources(pytester: pytest.Pytester) -> None:
+    make_tree(pytester)
+    config = pytester.parseconfig("--assert=plain", pytester.path)
+    prewarmer = BytecodePrewarmer(config, workers=1)
+    source = pytester.path / "test_one.py"
+    prewarmer.run([source])
+
+    source.write_text("def test_one(:\n    pass\n")
+    report = prewarmer.run([source])
+
+    assert_that(is_fresh(source, pyc_path(source, rewrite=False)), equal_to(False))
+    assert_that((report.compiled, report.failed), equal_to((0, 1)))
+    assert_that(prewarmer.errors[source], contains_string("SyntaxError"))
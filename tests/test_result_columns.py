@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+from hamcrest import has_length
+
+from pytest_textualize.model import ResultColumns
+from pytest_textualize.model import TestResult as Result
+from pytest_textualize.plugin.runtest_tracer import report_outcome
+
+SOURCE = """
+import pytest
+
+@pytest.fixture
+def broken():
+    raise RuntimeError("setup")
+
+@pytest.fixture
+def dirty():
+    yield
+    raise RuntimeError("teardown")
+
+def test_passed():
+    pass
+
+def test_failed():
+    assert False
+
+def test_error(broken):
+    pass
+
+def test_teardown(dirty):
+    pass
+
+@pytest.mark.skip
+def test_skipped():
+    pass
+
+@pytest.mark.xfail
+def test_xfailed():
+    assert False
+
+@pytest.mark.xfail
+def test_xpassed():
+    pass
+
+@pytest.mark.xfail(run=False)
+def test_not_run():
+    pass
+"""
+
+
+def test_reports_are_recorded_per_test(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile(SOURCE)
+    reprec = pytester.inline_run("-p", "no:cacheprovider")
+    columns = ResultColumns()
+
+    for report in reprec.getreports("pytest_runtest_logreport"):
+        columns.record(report.nodeid, report.when, report_outcome(report), report.duration)
+
+    names = [nodeid.partition("::")[2] for nodeid, *_ in columns]
+    outcomes = [outcome for _, outcome, *_ in columns]
+    assert_that(
+        dict(zip(names, outcomes)),
+        equal_to(
+            {
+                "test_passed": Result.Passed,
+                "test_failed": Result.Failed,
+                "test_error": Result.Error,
+                "test_teardown": Result.Error,
+                "test_skipped": Result.Skipped,
+                "test_xfailed": Result.XFailed,
+                "test_xpassed": Result.XPassed,
+                "test_not_run": Result.XFailed,
+            }
+        ),
+    )
+    assert_that(columns.counts()[Result.Error], equal_to(2))
+    assert_that(repr(columns), equal_to("<ResultColumns tests=8 running=0>"))
+
+
+def test_columns_keep_the_phase_durations() -> None:
+    columns = ResultColumns()
+    for when, duration in [("setup", 0.5), ("call", 2.0), ("teardown", 0.25)]:
+        columns.record("test_a.py::test_a", when, "passed", duration)
+    columns.record("test_a.py::test_b", "setup", "passed", 0.125)
+
+    assert_that(columns, has_length(2))
+    assert_that(list(columns)[0], equal_to(("test_a.py::test_a", Result.Passed, 0.5, 2.0, 0.25)))
+    assert_that(
+        columns.to_dict(),
+        equal_to(
+            {
+                "nodeid": ["test_a.py::test_a", "test_a.py::test_b"],
+                "outcome": ["passed", "unknown"],
+                "setup": [0.5, 0.125],
+                "call": [2.0, 0.0],
+                "teardown": [0.25, 0.0],
+            }
+        ),
+    )
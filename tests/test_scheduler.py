@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import equal_to
+
+from pytest_textualize.plugin.helpers.scheduler import make_scheduler
+
+MODULES = {
+    "test_fast": """
+def test_one():
+    pass
+
+def test_two():
+    pass
+""",
+    "test_slow": """
+def test_top():
+    pass
+
+class TestGroup:
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+""",
+    "test_params": """
+import pytest
+
+@pytest.fixture(scope="module", params=[1, 2])
+def resource(request):
+    return request.param
+
+def test_x(resource):
+    pass
+
+class TestY:
+    def test_y(self, resource):
+        pass
+""",
+}
+
+DURATIONS = {
+    "test_fast.py::test_one": 0.1,
+    "test_fast.py::test_two": 0.3,
+    "test_slow.py::test_top": 1.0,
+    "test_slow.py::TestGroup::test_a": 0.5,
+    "test_slow.py::TestGroup::test_b": 2.0,
+    "test_params.py::test_x[1]": 0.2,
+}
+
+
+def collect(pytester: pytest.Pytester) -> list[pytest.Item]:
+    pytester.makepyfile(**MODULES)
+    items, _ = pytester.inline_genitems()
+    return items
+
+
+def test_longest_first_moves_whole_scopes(pytester: pytest.Pytester) -> None:
+    items = collect(pytester)
+    original = [item.nodeid for item in items if item.nodeid.startswith("test_params")]
+    scheduler = make_scheduler("longest-first", DURATIONS, {})
+
+    ordered = [item.nodeid for item in scheduler.order(items)]
+
+    assert_that(
+        ordered,
+        equal_to(
+            [
+                "test_slow.py::TestGroup::test_b",
+                "test_slow.py::TestGroup::test_a",
+                "test_slow.py::test_top",
+                # -- the module scoped parameters keep the order pytest grouped them in
+                *original,
+                "test_fast.py::test_two",
+                "test_fast.py::test_one",
+            ]
+        ),
+    )
+    assert_that(scheduler.frozen, equal_to(["test_params.py"]))
+
+
+def test_shortest_first_and_unknown_durations(pytester: pytest.Pytester) -> None:
+    items = collect(pytester)
+    scheduler = make_scheduler("shortest-first", DURATIONS, {})
+
+    modules = []
+    for item in scheduler.order(items):
+        module = item.nodeid.partition("::")[0]
+        if module not in modules:
+            modules.append(module)
+
+    # -- the unknown durations weigh the mean of the known ones
+    assert_that(modules, equal_to(["test_fast.py", "test_params.py", "test_slow.py"]))
+
+
+def test_failed_first(pytester: pytest.Pytester) -> None:
+    items = collect(pytester)
+    lastfailed = {"test_slow.py::TestGroup::test_b": True}
+
+    ordered = [item.nodeid for item in make_scheduler("failed-first", {}, lastfailed).order(items)]
+
+    assert_that(
+        ordered[:3],
+        equal_to(
+            [
+                "test_slow.py::TestGroup::test_b",
+                "test_slow.py::TestGroup::test_a",
+                "test_slow.py::test_top",
+            ]
+        ),
+    )
+    assert_that(sorted(ordered), equal_to(sorted(item.nodeid for item in items)))
+
+
+def test_session_parametrization_keeps_the_order(pytester: pytest.Pytester) -> None:
+    pytester.makeconftest(
+        "import pytest\n\n@pytest.fixture(scope='session', params=[1, 2])\n"
+        "def db(request):\n    return request.param\n"
+    )
+    pytester.makepyfile(test_a="def test_a(db):\n    pass\n", test_b="def test_b(db):\n    pass\n")
+    items, _ = pytester.inline_genitems()
+    scheduler = make_scheduler("longest-first", {"test_b.py::test_b[1]": 5.0}, {})
+
+    assert_that(scheduler.order(items), equal_to(items))
+    assert_that(scheduler.frozen, equal_to([items[0].nodeid]))
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import calling
+from hamcrest import contains_string
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import none
+from hamcrest import raises
+
+from pytest_textualize.plugin.helpers.static_analysis import NotStatic
+from pytest_textualize.plugin.helpers.static_analysis import StaticAnalyzer
+from pytest_textualize.plugin.helpers.static_collect import StaticModule
+
+SOURCE = """
+import pytest
+from pytest import mark, param
+
+pytestmark = [pytest.mark.slow]
+
+
+def helper():
+    pass
+
+
+@pytest.mark.parametrize("n", [1, 2.5, "a b", None, (1, 2)])
+@mark.parametrize("flag", [True, False], ids=["on", "off"])
+def test_params(n, flag):
+    pass
+
+
+@pytest.mark.skipif(True, reason="never")
+def test_skipped():
+    pass
+
+
+@pytest.mark.xfail(reason="known", strict=True)
+@pytest.mark.parametrize("a, b", [param(1, 2, id="first"), (3, 4), param(5, 6)])
+def test_pairs(a, b):
+    pass
+
+
+@pytest.mark.parametrize("value", ["x", "x"])
+class TestGroup:
+    pytestmark = pytest.mark.group
+
+    def test_method(self, value):
+        pass
+
+    @pytest.mark.parametrize("other", [0])
+    async def test_async(self, value, other):
+        pass
+
+    def not_a_test(self):
+        pass
+
+
+def test_skipped():
+    pass
+"""
+
+analyzer = StaticAnalyzer(
+    lambda name: name.startswith("test"), lambda name: name.startswith("Test")
+)
+
+
+def collect_both(pytester: pytest.Pytester, source: str) -> tuple[list, list, StaticModule]:
+    real = pytester.getmodulecol(source)
+    static = StaticModule.from_parent(real.parent, path=real.path)
+    static_items = pytester.genitems([static])
+    return pytester.genitems([real]), static_items, static
+
+
+def test_static_items_match_the_imported_ones(pytester: pytest.Pytester) -> None:
+    pytester.makeini("[pytest]\nmarkers =\n    slow\n    group\n")
+    real, static, module = collect_both(pytester, SOURCE)
+
+    assert_that(module.fallback, is_(none()))
+    assert_that([item.nodeid for item in static], equal_to([item.nodeid for item in real]))
+    for real_item, static_item in zip(real, static):
+        real_marks = [(mark.name, mark.args, mark.kwargs) for mark in real_item.iter_markers()]
+        static_marks = [(mark.name, mark.args, mark.kwargs) for mark in static_item.iter_markers()]
+        assert_that(static_marks, equal_to(real_marks), static_item.nodeid)
+        assert_that(static_item.location[:2], equal_to(real_item.location[:2]))
+
+
+def test_static_module_is_never_imported(pytester: pytest.Pytester) -> None:
+    path = pytester.makepyfile("raise RuntimeError('imported')\n\ndef test_one():\n    pass\n")
+    module = pytester.getpathnode(pytester.path)
+    static = StaticModule.from_parent(module, path=path)
+
+    items = pytester.genitems([static])
+
+    assert_that([item.name for item in items], equal_to(["test_one"]))
+    assert_that(static.fallback, is_(none()))
+
+
+@pytest.mark.parametrize(
+    "source, reason",
+    [
+        ("import sys\nif sys.platform:\n    def test_a():\n        pass\n", "test_a bound"),
+        ("from helpers import *\n", "star import"),
+        (
+            "VALUES = [1]\n@__import__('pytest').mark.parametrize('v', VALUES)\ndef test_v(v): pass",
+            "decorator",
+        ),
+        (
+            "import pytest\n@pytest.mark.parametrize('v', VALUES)\ndef test_v(v): pass",
+            "not a literal",
+        ),
+        ("class TestA(object):\n    def test_a(self): pass\n", "has bases"),
+        ("def pytest_generate_tests(metafunc):\n    pass\n", "pytest_generate_tests"),
+        ("import pytest\n@pytest.mark.skipif(**{'reason': 'r'})\ndef test_a(): pass", "unpacked"),
+        ("import pytest\n@pytest.fixture(params=[1, 2])\ndef value(request): pass\n", "fixture"),
+    ],
+    ids=[
+        "conditional",
+        "star-import",
+        "unknown-decorator",
+        "name",
+        "bases",
+        "generate",
+        "unpacked",
+        "fixture",
+    ],
+)
+def test_dynamic_modules_are_not_static(source: str, reason: str) -> None:
+    assert_that(
+        calling(analyzer.analyse).with_args(source),
+        raises(NotStatic, pattern=reason),
+    )
+
+
+def test_fallback_imports_the_module(pytester: pytest.Pytester) -> None:
+    source = "import pytest\nVALUES = [1, 2]\n\n@pytest.mark.parametrize('v', VALUES)\ndef test_v(v):\n    pass\n"
+    real, static, module = collect_both(pytester, source)
+
+    assert_that(module.fallback, contains_string("not a literal"))
+    assert_that([item.nodeid for item in static], equal_to([item.nodeid for item in real]))
+
+
+def test_conftest_generate_tests_imports_the_module(pytester: pytest.Pytester) -> None:
+    pytester.makeconftest(
+        """
+def pytest_generate_tests(metafunc):
+    if "n" in metafunc.fixturenames:
+        metafunc.parametrize("n", [1, 2, 3])
+"""
+    )
+    real, static, module = collect_both(pytester, "def test_gen(n):\n    pass\n")
+
+    assert_that(module.fallback, contains_string("pytest_generate_tests"))
+    assert_that(
+        [item.name for item in static], equal_to(["test_gen[1]", "test_gen[2]", "test_gen[3]"])
+    )
+    assert_that([item.nodeid for item in static], equal_to([item.nodeid for item in real]))
+
+
+def test_annotated_pytestmark() -> None:
+    info = analyzer.analyse(
+        "import pytest\npytestmark: list = [pytest.mark.slow]\ndef test_a(): pass\n"
+    )
+
+    assert_that([mark.name for mark in info.marks], equal_to(["slow"]))
+
+
+def test_other_marks_keep_their_name() -> None:
+    info = analyzer.analyse("import pytest\n@pytest.mark.custom(object())\ndef test_a(): pass\n")
+
+    assert_that(
+        [(mark.name, mark.args) for mark in info.entries[0].marks], equal_to([("custom", ())])
+    )
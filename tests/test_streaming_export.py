@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from io import StringIO
+from pathlib import Path
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import ends_with
+from hamcrest import equal_to
+from hamcrest import is_
+from hamcrest import starts_with
+from rich.console import Console
+
+from pytest_textualize.textualize.export import HtmlStreamExporter
+from pytest_textualize.textualize.export import StreamingRecordBuffer
+from pytest_textualize.textualize.export import SvgStreamExporter
+
+
+def make_console(export: StreamingRecordBuffer) -> Console:
+    console = Console(file=StringIO(), width=80, color_system="truecolor", force_terminal=True)
+    return export.attach(console)
+
+
+def test_record_buffer_stays_empty(tmp_path: Path) -> None:
+    export = StreamingRecordBuffer([HtmlStreamExporter(tmp_path / "out.html")])
+    console = make_console(export)
+
+    for n in range(200):
+        console.print(f"[bold red]line {n}[/] <tag>", highlight=False)
+
+    assert_that(len(getattr(console, "_record_buffer")), equal_to(0), "nothing retained")
+    export.close()
+    html = (tmp_path / "out.html").read_text(encoding="utf-8")
+    assert_that(html, starts_with("<!DOCTYPE html>"))
+    assert_that(html, contains_string("line 199"))
+    assert_that(html, contains_string("&lt;tag&gt;"))
+    assert_that(html, contains_string(".r1 {"))
+    assert_that(html.rstrip(), ends_with("</html>"))
+
+
+def test_svg_export_counts_lines(tmp_path: Path) -> None:
+    svg_exporter = SvgStreamExporter(tmp_path / "out.svg", width=80)
+    export = StreamingRecordBuffer([svg_exporter])
+    console = make_console(export)
+
+    console.print("[green]first[/]\nsecond")
+    console.print("third", end="")
+    console.print(" continued")
+
+    assert_that(svg_exporter._y, equal_to(3))
+    export.close()
+    svg = (tmp_path / "out.svg").read_text(encoding="utf-8")
+    assert_that(svg, starts_with("<svg"))
+    assert_that(svg, contains_string("continued"))
+    assert_that(svg.rstrip(), ends_with("</svg>"))
+    assert_that((tmp_path / "out.svg.part").exists(), is_(False), "part file removed")
+
+
+def test_shared_export(tmp_path: Path) -> None:
+    export = StreamingRecordBuffer([HtmlStreamExporter(tmp_path / "out.html")])
+    stdout = make_console(export)
+    stderr = make_console(export)
+
+    stdout.print("from stdout")
+    stderr.print("from stderr")
+    export.close()
+    export.close()
+
+    html = (tmp_path / "out.html").read_text(encoding="utf-8")
+    assert_that(html.index("from stdout") < html.index("from stderr"), is_(True))
+
+
+def test_redrawn_lines_are_dropped(tmp_path: Path) -> None:
+    from pytest_textualize.plugin.helpers.execution_dashboard import ExecutionDashboard
+
+    export = StreamingRecordBuffer([HtmlStreamExporter(tmp_path / "out.html")])
+    console = make_console(export)
+    dashboard = ExecutionDashboard(console, total=50)
+
+    for n in range(50):
+        dashboard.test_started(f"test_a.py::test_{n}")
+        dashboard.draw()
+        if n == 25:
+            console.print("halfway")
+        dashboard.test_phase("passed", 0.0, finished=True)
+    dashboard.finish()
+    export.close()
+
+    html = (tmp_path / "out.html").read_text(encoding="utf-8")
+    assert_that(html.count("tests/s"), equal_to(1), "the final frame only")
+    assert_that(html, contains_string("50/50"))
+    assert_that(html, contains_string("halfway"))
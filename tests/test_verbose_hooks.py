@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from io import StringIO
+from types import SimpleNamespace
+
+import pytest
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import empty
+from hamcrest import equal_to
+from hamcrest import instance_of
+from hamcrest import is_
+from rich._null_file import NullFile
+from rich.console import Console
+
+from pytest_textualize import TextualizePlugins
+from pytest_textualize import Verbosity
+from pytest_textualize.plugin.collector_tracer import CollectorDebugTracer
+from pytest_textualize.plugin.collector_tracer import CollectorTracer
+from pytest_textualize.plugin.collector_tracer import CollectorVerboseTracer
+from pytest_textualize.textualize.logging import VerboseLogger
+
+
+def make_logger(
+    verbosity: Verbosity, headless: bool = False, sink: Verbosity | None = None
+) -> VerboseLogger:
+    logger = VerboseLogger.detached(verbosity)
+    logger.add_console("<stdout>", Console(file=NullFile() if headless else StringIO()))
+    if sink is not None:
+        logger.add_sink("<log-file>", Console(file=StringIO(), width=200), sink)
+    return logger
+
+
+def configure_tracer(
+    verbosity: Verbosity, headless: bool = False, sink: Verbosity | None = None
+) -> pytest.PytestPluginManager:
+    pluginmanager = pytest.PytestPluginManager()
+    tracer = CollectorTracer(results=SimpleNamespace())
+    option = SimpleNamespace(verbose=int(verbosity), collectonly=False)
+    tracer.config = SimpleNamespace(option=option, getoption=lambda name: getattr(option, name))
+    tracer.pluginmanager = pluginmanager
+    tracer.headless = headless
+    tracer.verbose_logger = make_logger(verbosity, headless, sink)
+    pluginmanager.register(tracer, tracer.name)
+    tracer.register_verbose_tracer()
+    return pluginmanager
+
+
+def impl_names(pluginmanager: pytest.PytestPluginManager, hookname: str) -> list[str]:
+    return [impl.plugin_name for impl in getattr(pluginmanager.hook, hookname).get_hookimpls()]
+
+
+@pytest.mark.parametrize("verbosity", [Verbosity.QUIET, Verbosity.NORMAL])
+def test_no_verbose_hooks_below_verbose(verbosity: Verbosity) -> None:
+    pluginmanager = configure_tracer(verbosity)
+
+    assert_that(pluginmanager.has_plugin(TextualizePlugins.COLLECTOR_VERBOSE_TRACER), is_(False))
+    assert_that(impl_names(pluginmanager, "pytest_make_collect_report"), empty())
+    assert_that(
+        impl_names(pluginmanager, "pytest_collection_modifyitems"),
+        equal_to([TextualizePlugins.COLLECTOR_TRACER]),
+    )
+    assert_that(impl_names(pluginmanager, "pytest_report_collectionfinish"), empty())
+
+
+def test_verbose_hooks() -> None:
+    pluginmanager = configure_tracer(Verbosity.VERBOSE)
+
+    plugin = pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_VERBOSE_TRACER)
+    assert_that(type(plugin), equal_to(CollectorVerboseTracer))
+    assert_that(impl_names(pluginmanager, "pytest_make_collect_report"), empty())
+    assert_that(
+        impl_names(pluginmanager, "pytest_report_collectionfinish"),
+        equal_to([TextualizePlugins.COLLECTOR_VERBOSE_TRACER]),
+    )
+
+
+def test_debug_hooks() -> None:
+    pluginmanager = configure_tracer(Verbosity.VERY_VERBOSE)
+
+    plugin = pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_VERBOSE_TRACER)
+    assert_that(plugin, instance_of(CollectorDebugTracer))
+    assert_that(
+        impl_names(pluginmanager, "pytest_make_collect_report"),
+        equal_to([TextualizePlugins.COLLECTOR_VERBOSE_TRACER]),
+    )
+
+
+def test_headless_skips_verbose_hooks() -> None:
+    pluginmanager = configure_tracer(Verbosity.DEBUG, headless=True)
+
+    assert_that(pluginmanager.has_plugin(TextualizePlugins.COLLECTOR_VERBOSE_TRACER), is_(False))
+
+
+def test_log_file_sink_registers_the_debug_hooks(pytester: pytest.Pytester) -> None:
+    pluginmanager = configure_tracer(Verbosity.NORMAL, sink=Verbosity.DEBUG)
+    tracer = pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_TRACER)
+    plugin = pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_VERBOSE_TRACER)
+    assert_that(plugin, instance_of(CollectorDebugTracer))
+    plugin.config = tracer.config
+    plugin.verbose_logger = tracer.verbose_logger
+
+    plugin.pytest_make_collect_report(pytester.getmodulecol("def test_a():\n    pass\n"))
+    plugin.pytest_collection_modifyitems([])
+
+    log_file = tracer.verbose_logger.sinks["<log-file>"].console.file.getvalue()
+    assert_that(log_file, contains_string("pytest_make_collect_report"))
+    assert_that(log_file, contains_string("pytest_collection_modifyitems"))
+    assert_that(plugin.pytest_report_collectionfinish([]), is_(None), "no terminal report")
+    stdout = tracer.verbose_logger.consoles["<stdout>"].file.getvalue()
+    assert_that(stdout, equal_to(""), "nothing on the terminal")
+
+
+def test_log_file_sink_gets_the_collected_items() -> None:
+    pluginmanager = configure_tracer(Verbosity.NORMAL, sink=Verbosity.VERBOSE)
+    tracer = pluginmanager.get_plugin(TextualizePlugins.COLLECTOR_TRACER)
+
+    tracer.itemcollected(SimpleNamespace(nodeid="test_a.py::test_a"), [])
+
+    log_file = tracer.verbose_logger.sinks["<log-file>"].console.file.getvalue()
+    assert_that(log_file, contains_string("test_a.py::test_a"))
+    stdout = tracer.verbose_logger.consoles["<stdout>"].file.getvalue()
+    assert_that(stdout, equal_to(""), "nothing on the terminal")
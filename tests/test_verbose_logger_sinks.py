@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from io import StringIO
+
+from hamcrest import assert_that
+from hamcrest import contains_string
+from hamcrest import equal_to
+from rich.console import Console
+
+from pytest_textualize import Verbosity
+from pytest_textualize.textualize.logging import VerboseLogger
+from pytest_textualize.textualize.writer import BackgroundConsole
+from pytest_textualize.textualize.writer import ConsoleWriter
+
+
+class CountingLogger(VerboseLogger):
+    renders = 0
+    render_thread: threading.Thread | None = None
+
+    def render_record(self, console, record):
+        self.renders += 1
+        self.render_thread = threading.current_thread()
+        return super().render_record(console, record)
+
+
+def make_console(color_system: str | None = None, stderr: bool = False) -> Console:
+    return Console(
+        file=StringIO(), width=100, color_system=color_system, force_terminal=True, stderr=stderr
+    )
+
+
+def make_logger(verbosity: Verbosity = Verbosity.NORMAL) -> CountingLogger:
+    logger = CountingLogger.detached(verbosity)
+    logger.add_console("<stdout>", make_console())
+    logger.add_console("<stderr>", make_console(stderr=True))
+    return logger
+
+
+def test_sinks_share_rendered_segments() -> None:
+    logger = make_logger(Verbosity.VERBOSE)
+    file_sink = make_console()
+    logger.add_sink("<log-file>", file_sink, Verbosity.VERBOSE)
+
+    logger.warning("hello sinks")
+
+    assert_that(logger.renders, equal_to(1), "rendered once")
+    assert_that(file_sink.file.getvalue(), contains_string("hello sinks"))
+    stdout = logger.consoles["<stdout>"].file.getvalue()
+    assert_that(stdout, equal_to(file_sink.file.getvalue()), "same output")
+
+
+def test_sinks_render_per_color_system() -> None:
+    logger = make_logger(Verbosity.VERBOSE)
+    logger.add_sink("<truecolor>", make_console("truecolor"), Verbosity.VERBOSE)
+    logger.add_sink("<mirror>", make_console(), Verbosity.VERBOSE)
+
+    logger.warning("hello sinks")
+
+    assert_that(logger.renders, equal_to(2), "rendered per color system")
+
+
+def test_sink_verbosity_threshold() -> None:
+    logger = make_logger(Verbosity.NORMAL)
+    file_sink = make_console()
+    logger.add_sink("<log-file>", file_sink, Verbosity.DEBUG)
+
+    logger.debug("debug only")
+
+    assert_that(logger.consoles["<stdout>"].file.getvalue(), equal_to(""), "stdout")
+    assert_that(file_sink.file.getvalue(), contains_string("debug only"), "sink")
+
+
+def test_background_sink_renders_on_writer_thread() -> None:
+    logger = make_logger(Verbosity.VERBOSE)
+    writer = ConsoleWriter()
+    background = BackgroundConsole(
+        file=StringIO(), writer=writer, width=100, color_system="truecolor", force_terminal=True
+    )
+    logger.add_sink("<log-file>", background, Verbosity.VERBOSE)
+
+    logger.warning("hello writer")
+    writer.close()
+
+    assert_that(logger.renders, equal_to(2), "rendered per color system")
+    assert_that(logger.render_thread.name, equal_to("textualize-console-writer"), "writer")
+    assert_that(background.file.getvalue(), contains_string("hello writer"))